@@ -7,14 +7,394 @@ from typing import Any, Text, Dict, List
 from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet, FollowupAction
-from rasa_sdk.forms import FormAction
 
+import asyncio
+import functools
+import itertools
+import logging
+import multiprocessing
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Make the recommender package importable, without adding the project root twice
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from recommender.recommendation_engine import get_shared_recommender
+from recommender.ranking import compact_ranking, expand_ranking, ranking_matches
+from recommender.export import export_key, export_url, get_export_queue, start_export_server
+
+# Scoring and formatting run on a bounded executor, never on the action server's event loop.
+# ACTION_WORKERS sets its size; ACTION_EXECUTOR=process scores in worker processes instead of threads.
+ACTION_WORKERS_ENV = "ACTION_WORKERS"
+ACTION_EXECUTOR_ENV = "ACTION_EXECUTOR"
+DEFAULT_ACTION_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _create_executor():
+    """Bounded executor for CPU-bound action work, as configured by the environment"""
+    workers = int(os.environ.get(ACTION_WORKERS_ENV) or DEFAULT_ACTION_WORKERS)
+    if os.environ.get(ACTION_EXECUTOR_ENV, "thread") == "process":
+        # Each worker process compiles and warms its own recommender before taking work
+        return ProcessPoolExecutor(max_workers=workers, initializer=get_shared_recommender)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="career-action")
+
+
+# Created by get_executor, in the action server process only
+_executor = None
+_executor_lock = threading.Lock()
+
+# Bump whenever format_career_details or format_learning_plan changes, so older renders are never served
+RENDER_TEMPLATE_VERSION = 1
+
+# Rendered replies are kept for the whole catalogue; RENDER_CACHE_SIZE caps them on very large catalogues
+RENDER_CACHE_SIZE_ENV = "RENDER_CACHE_SIZE"
+
+logger = logging.getLogger(__name__)
+
+
+def get_executor():
+    """Return the action executor, creating it on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = _create_executor()
+    return _executor
+
+
+async def run_in_executor(func, *args):
+    """Await a module-level function run on the action executor, keeping the event loop free"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args))
+
+
+# Version of the structured payloads sent alongside the text replies
+PAYLOAD_VERSION = 1
+
+
+def ranked_recommendations(user_profile, conversation_id, ranking=None):
+    """
+    The conversation's recommendations and their compact ranking. A stored ranking
+    for the same profile hash and catalogue version is reused without rescoring.
+    """
+    recommender = get_shared_recommender()
+    if ranking_matches(ranking, user_profile, recommender.version):
+        return expand_ranking(ranking, recommender), ranking
+
+    # Rescore only what changed since this conversation's last turn
+    recommendations = recommender.recommend_careers(user_profile, top_n=5, conversation_id=conversation_id)
+    return recommendations, compact_ranking(recommendations, user_profile, recommender.version)
+
+
+def recommend_and_format(user_profile, conversation_id, ranking=None):
+    """Rank a profile and build the reply; returns (recommendations, text, payload, ranking)"""
+    recommendations, ranking = ranked_recommendations(user_profile, conversation_id, ranking)
+    if not recommendations:
+        return recommendations, None, None, ranking
+    text = format_recommendations(recommendations)
+    return recommendations, text, recommendations_payload(recommendations, text), ranking
+
+
+def recommendations_payload(recommendations, text):
+    """
+    Compact structured form of the recommendations, sent as a custom json_message.
+    Rasa's REST channel splits the text reply on blank lines and sends the parts just
+    before this payload; text_parts tells a client rendering the payload how many to replace.
+    """
+    return {
+        "type": "career_recommendations",
+        "version": PAYLOAD_VERSION,
+        "text_parts": len(text.strip().split("\n\n")),
+        "recommendations": [{
+            "career_id": rec['career_id'],
+            "name": rec['career_name'],
+            "domain": rec['domain'],
+            "match_score": rec['match_score'],
+            "confidence": rec['confidence'],
+            "salary_range": rec['salary_range'],
+            "why_it_fits": rec['why_it_fits'],
+            "key_skills": rec['key_requirements'][:3]
+        } for rec in recommendations[:3]]  # The same top 3 as the text reply
+    }
+
+
+def format_recommendations(recommendations):
+    """Markdown reply listing the top three recommendations"""
+    response_parts = []
+    response_parts.append("🎯 Based on what you've shared, here are career paths that align well with your profile:")
+
+    for i, rec in enumerate(recommendations[:3], 1):  # Top 3 recommendations
+        emoji_map = {1: "🥇", 2: "🥈", 3: "🥉"}
+        emoji = emoji_map.get(i, "⭐")
+
+        response_parts.append(f"\n{emoji} **{rec['career_name']}**")
+        response_parts.append(f"   💼 *{rec['domain']}*")
+        response_parts.append(f"   📊 *Match Score: {rec['match_score']}% ({rec['confidence']} confidence)*")
+        response_parts.append(f"   💰 *Salary Range: {rec['salary_range']}*")
+        response_parts.append(f"   ✅ *Why it fits:* {rec['why_it_fits']}")
+
+        # Show key requirements
+        if rec['key_requirements']:
+            reqs = ", ".join(rec['key_requirements'][:3])
+            response_parts.append(f"   🛠️ *Key Skills:* {reqs}")
+
+    response_parts.append("\n🤔 Would you like me to elaborate on any of these careers, or explore different options based on specific preferences?")
+
+    return "\n".join(response_parts)
+
+
+def career_details_text(career_id):
+    """Formatted details of a career, or None when it is unknown"""
+    career_details = get_shared_recommender().get_career_details(career_id)
+    if not career_details:
+        return None
+    return format_career_details(career_details)
+
+
+def format_career_details(career_details):
+    """Markdown reply describing one career"""
+    response_parts = []
+    response_parts.append(f"📋 **Detailed Information: {career_details['name']}**")
+    response_parts.append(f"📖 *Description:* {career_details['description']}")
+    response_parts.append(f"🏢 *Domain:* {career_details['domain']}")
+
+    response_parts.append("\n🛠️ **Key Skills Required:**")
+    for skill in career_details['key_skills']:
+        response_parts.append(f"   • {skill}")
+
+    response_parts.append("\n💼 **Key Interests:**")
+    for interest in career_details['key_interests']:
+        response_parts.append(f"   • {interest}")
+
+    response_parts.append("\n💪 **Key Strengths:**")
+    for strength in career_details['key_strengths']:
+        response_parts.append(f"   • {strength}")
+
+    response_parts.append("\n📊 **Career Details:**")
+    response_parts.append(f"   🎓 *Education:* {career_details['education']}")
+    response_parts.append(f"   💰 *Salary Range:* {career_details['salary_range']}")
+    response_parts.append(f"   📈 *Growth Potential:* {career_details['growth_potential']}")
+    response_parts.append(f"   ⚖️ *Work-Life Balance:* {career_details['work_life_balance']}")
+    response_parts.append(f"   🔮 *Future Outlook:* {career_details['future_outlook']}")
+    response_parts.append(f"   🏢 *Work Environment:* {career_details['work_environment']}")
+
+    return "\n".join(response_parts)
+
+
+def learning_plan_text(career_id):
+    """Formatted learning plan of a career, or None when it is unknown"""
+    learning_plan = get_shared_recommender().generate_learning_plan(career_id)
+    if not learning_plan:
+        return None
+    return format_learning_plan(learning_plan)
+
+
+def format_learning_plan(learning_plan):
+    """Markdown reply laying out a learning plan"""
+    response_parts = []
+    response_parts.append(f"📚 **Learning Plan for {learning_plan['career']}**")
+    response_parts.append(f"⏱️ *Estimated Duration: {learning_plan['duration_months']} months*")
+
+    for phase in learning_plan['phases']:
+        response_parts.append(f"\n📌 **{phase['phase']} Phase** ({phase['duration']})")
+        response_parts.append(f"   🎯 *Focus:* {phase['focus']}")
+        response_parts.append("   📖 *Resources:*")
+        for resource in phase['resources']:
+            response_parts.append(f"      • {resource}")
+
+    response_parts.append("\n🛠️ **Key Skills to Learn:**")
+    for skill in learning_plan['key_skills_to_learn']:
+        response_parts.append(f"   • {skill}")
+
+    response_parts.append("\n🏆 **Recommended Certifications:**")
+    for cert in learning_plan['recommended_certifications']:
+        response_parts.append(f"   • {cert}")
+
+    response_parts.append("\n📈 **Career Progression Path:**")
+    progression = " → ".join(learning_plan['career_progression'])
+    response_parts.append(f"   {progression}")
+
+    response_parts.append("\n💡 *Pro tip:* Start with free resources, build a portfolio, and network with professionals in the field!")
+
+    return "\n".join(response_parts)
+
+
+# Reply kinds served from the render cache, and the functions rendering them
+RENDERERS = {"details": career_details_text, "learning_plan": learning_plan_text}
+
+
+def render_capacity(num_careers):
+    """Replies the render cache keeps: every career's, unless RENDER_CACHE_SIZE sets fewer"""
+    capacity = len(RENDERERS) * num_careers
+    limit = os.environ.get(RENDER_CACHE_SIZE_ENV)
+    return min(capacity, int(limit)) if limit else capacity
+
+
+def render_catalogue(limit):
+    """Catalogue version and {(kind, career_id): text} for the first careers, up to limit replies"""
+    recommender = get_shared_recommender()
+    career_ids = itertools.islice(recommender.career_db, limit // len(RENDERERS))
+    renders = {(kind, career_id): render(career_id) for career_id in career_ids for kind, render in RENDERERS.items()}
+    return recommender.version, renders
+
+
+class RenderCache:
+    """
+    Rendered career details and learning plans, keyed by
+    (kind, career_id, catalogue version, template version) in a bounded LRU.
+    Unless max_entries is given, it is sized to every career of the catalogue it follows.
+    When the catalogue version changes, the new one is warmed on the action executor.
+    """
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries
+        self.capacity = max_entries or 0
+        self.entries = OrderedDict()
+        self.version = None
+        self.lock = threading.Lock()
+
+    def get(self, kind, career_id, version):
+        key = (kind, career_id, version, RENDER_TEMPLATE_VERSION)
+        with self.lock:
+            text = self.entries.get(key)
+            if text is not None:
+                self.entries.move_to_end(key)
+            return text
+
+    def put(self, kind, career_id, version, text):
+        with self.lock:
+            self._put((kind, career_id, version, RENDER_TEMPLATE_VERSION), text)
+
+    def _put(self, key, text):
+        self.entries[key] = text
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def store(self, version, renders):
+        """Add a batch of renders of one catalogue version, skipping unknown careers"""
+        with self.lock:
+            for (kind, career_id), text in renders.items():
+                if text is not None:
+                    self._put((kind, career_id, version, RENDER_TEMPLATE_VERSION), text)
+
+    def _resize(self, num_careers):
+        self.capacity = self.max_entries or render_capacity(num_careers)
+
+    def warm(self):
+        """Render the catalogue now; used at startup, before any conversation arrives"""
+        self._resize(len(get_shared_recommender().career_db))
+        version, renders = render_catalogue(self.capacity)
+        self.version = version
+        self.store(version, renders)
+
+    def follow(self, version, num_careers):
+        """Drop renders of older catalogues, resize for the new one and warm it in the background"""
+        with self.lock:
+            if version == self.version:
+                return
+            self.version = version
+            self.entries.clear()
+            self._resize(num_careers)
+        future = get_executor().submit(render_catalogue, self.capacity)
+        future.add_done_callback(self._store_warmed)
+
+    def _store_warmed(self, future):
+        if future.exception() is not None:
+            logger.warning("Warming the render cache failed: %s", future.exception())
+        else:
+            self.store(*future.result())
+
+
+_render_cache = RenderCache()
+
+
+async def rendered_reply(kind, career_id):
+    """A career's details or learning plan: a cache lookup, rendered on the executor on a miss"""
+    recommender = get_shared_recommender()
+    version = recommender.version
+    _render_cache.follow(version, len(recommender.career_db))
+    text = _render_cache.get(kind, career_id, version)
+    if text is None:
+        text = await run_in_executor(RENDERERS[kind], career_id)
+        if text is not None:
+            _render_cache.put(kind, career_id, version, text)
+    return text
+
+
+def export_summary_text(user_profile, conversation_id, ranking=None):
+    """Formatted summary of a profile and its ranked careers; returns (text, ranking)"""
+    recommendations, ranking = ranked_recommendations(user_profile, conversation_id, ranking)
+
+    response_parts = []
+    response_parts.append("📄 **Career Exploration Summary**")
+    response_parts.append("\n👤 **Your Profile:**")
+    if user_profile['interests']:
+        response_parts.append(f"   💡 *Interests:* {', '.join(user_profile['interests'])}")
+    if user_profile['skills']:
+        response_parts.append(f"   🛠️ *Skills:* {', '.join(user_profile['skills'])}")
+    if user_profile['strengths']:
+        response_parts.append(f"   💪 *Strengths:* {', '.join(user_profile['strengths'])}")
+
+    response_parts.append("\n🎯 **Recommended Careers:**")
+    for rec in recommendations[:3]:
+        response_parts.append(f"   • {rec['career_name']} ({rec['domain']}) - {rec['match_score']}% match")
+        response_parts.append(f"     ✅ *Why it fits:* {rec['why_it_fits']}")
+
+    return "\n".join(response_parts), ranking
+
+
+def export_reply(key, future):
+    """
+    Reply line and json_message payload of a queued export, sent without waiting for it.
+    The payload carries the store key and download path, never the PDF: json_messages are
+    kept in the tracker's events, and the client fetches the file from the export server.
+    """
+    payload = {"type": "career_plan_export", "version": PAYLOAD_VERSION, "status": "pending",
+               "key": key, "url": export_url(key)}
+    if not future.done():
+        return "⏳ *I'm preparing a PDF of your plan with detailed recommendations, learning plans, and next steps. It will be ready to download in a moment!*", payload
+    if future.exception() is not None:
+        payload.update(status="failed", url=None)
+        return "⚠️ *I couldn't create the PDF right now, but you can save this summary for your records!*", payload
+    payload["status"] = "ready"
+    return "📥 *Your PDF career plan is ready to download!*", payload
+
+
+def ranked_career_ids(tracker):
+    """Career ids of the conversation's last ranking, best first"""
+    ranking = tracker.get_slot('career_ranking')
+    if ranking:
+        return [career['id'] for career in ranking['careers']]
+    return tracker.get_slot('current_career_recommendations') or []
+
+
+def start_action_server():
+    """
+    Create the executor, compile the shared recommender and render every career's replies
+    while the action server starts up, so the first user after a deploy doesn't pay the
+    cold-start cost; then start the server PDF exports are downloaded from. Executor worker
+    processes import this module too (under spawn, on Windows and macOS), and skip it: they
+    only need the recommender their initializer builds.
+    """
+    if multiprocessing.parent_process() is not None:
+        return
+    get_executor()
+    get_shared_recommender()
+    _render_cache.warm()
+    try:
+        start_export_server()
+    except OSError as error:
+        logger.warning("Career plan downloads are unavailable, the export server did not start: %s", error)
+
+
+start_action_server()
 
-from recommender.recommendation_engine import CareerRecommender
-from recommender.career_database import normalize_interest
 
 class ActionExtractEntities(Action):
     """Extract and normalize entities from user input"""
@@ -22,9 +402,9 @@ class ActionExtractEntities(Action):
     def name(self) -> Text:
         return "action_extract_entities"
 
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
 
         # Get entities from the latest message
         entities = tracker.latest_message.get('entities', [])
@@ -40,8 +420,8 @@ class ActionExtractEntities(Action):
             entity_value = entity.get('value')
 
             if entity_type == 'interest':
-                # Normalize interests (handle abbreviations)
-                normalized = normalize_interest(entity_value)
+                # Normalize interests (handle abbreviations) against the catalogue being served
+                normalized = get_shared_recommender().normalize_interest(entity_value)
                 interests.extend(normalized)
             elif entity_type == 'skill':
                 skills.append(entity_value.lower())
@@ -75,9 +455,9 @@ class ActionRecommendCareers(Action):
     def name(self) -> Text:
         return "action_recommend_careers"
 
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
 
         # Get user profile from slots
         interests = tracker.get_slot('interests') or []
@@ -98,41 +478,20 @@ class ActionRecommendCareers(Action):
             'preferences': preferences
         }
 
-        # Get recommendations
-        recommender = CareerRecommender()
-        recommendations = recommender.recommend_careers(user_profile, top_n=5)
+        # Score and format on the executor, so other conversations' turns keep flowing
+        recommendations, full_response, payload, ranking = await run_in_executor(
+            recommend_and_format, user_profile, tracker.sender_id, tracker.get_slot('career_ranking'))
 
         if not recommendations:
             dispatcher.utter_message(text="I couldn't find strong matches with the information you provided. Could you tell me more about your interests or skills? Sometimes using different words can help me understand better.")
-            return []
-
-        # Format recommendations for display
-        response_parts = []
-        response_parts.append("🎯 Based on what you've shared, here are career paths that align well with your profile:")
-
-        for i, rec in enumerate(recommendations[:3], 1):  # Top 3 recommendations
-            emoji_map = {1: "🥇", 2: "🥈", 3: "🥉"}
-            emoji = emoji_map.get(i, "⭐")
-
-            response_parts.append(f"\n{emoji} **{rec['career_name']}**")
-            response_parts.append(f"   💼 *{rec['domain']}*")
-            response_parts.append(f"   📊 *Match Score: {rec['match_score']}% ({rec['confidence']} confidence)*")
-            response_parts.append(f"   💰 *Salary Range: {rec['salary_range']}*")
-            response_parts.append(f"   ✅ *Why it fits:* {rec['why_it_fits']}")
+            return [SlotSet("career_ranking", ranking)]
 
-            # Show key requirements
-            if rec['key_requirements']:
-                reqs = ", ".join(rec['key_requirements'][:3])
-                response_parts.append(f"   🛠️ *Key Skills:* {reqs}")
-
-        response_parts.append("\n🤔 Would you like me to elaborate on any of these careers, or explore different options based on specific preferences?")
-
-        full_response = "\n".join(response_parts)
-        dispatcher.utter_message(text=full_response)
+        # Text for any channel, plus the structured payload the web frontend renders as cards
+        dispatcher.utter_message(text=full_response, json_message=payload)
 
-        # Store recommendations in slot for later reference
+        # Store recommendations, and the ranking follow-up turns reuse, in slots for later reference
         career_list = [rec['career_id'] for rec in recommendations]
-        return [SlotSet("current_career_recommendations", career_list)]
+        return [SlotSet("current_career_recommendations", career_list), SlotSet("career_ranking", ranking)]
 
 class ActionProvideCareerDetails(Action):
     """Provide detailed information about a specific career"""
@@ -140,9 +499,9 @@ class ActionProvideCareerDetails(Action):
     def name(self) -> Text:
         return "action_provide_career_details"
 
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
 
         # Get the career from entities or context
         entities = tracker.latest_message.get('entities', [])
@@ -155,7 +514,7 @@ class ActionProvideCareerDetails(Action):
 
         # If no career entity found, check current recommendations
         if not career_entity:
-            current_recs = tracker.get_slot('current_career_recommendations') or []
+            current_recs = ranked_career_ids(tracker)
             if current_recs:
                 # For now, provide details about the first recommendation
                 career_entity = current_recs[0]
@@ -164,41 +523,13 @@ class ActionProvideCareerDetails(Action):
             dispatcher.utter_message(text="I'd be happy to provide more details about a specific career. Which career from the recommendations interests you most?")
             return []
 
-        # Get career details
-        recommender = CareerRecommender()
-        career_details = recommender.get_career_details(career_entity)
+        # Get the pre-rendered career details
+        full_response = await rendered_reply("details", career_entity)
 
-        if not career_details:
+        if not full_response:
             dispatcher.utter_message(text="I couldn't find details for that career. Could you be more specific about which career you'd like to learn about?")
             return []
 
-        # Format detailed response
-        response_parts = []
-        response_parts.append(f"📋 **Detailed Information: {career_details['name']}**")
-        response_parts.append(f"📖 *Description:* {career_details['description']}")
-        response_parts.append(f"🏢 *Domain:* {career_details['domain']}")
-
-        response_parts.append("\n🛠️ **Key Skills Required:**")
-        for skill in career_details['key_skills']:
-            response_parts.append(f"   • {skill}")
-
-        response_parts.append("\n💼 **Key Interests:**")
-        for interest in career_details['key_interests']:
-            response_parts.append(f"   • {interest}")
-
-        response_parts.append("\n💪 **Key Strengths:**")
-        for strength in career_details['key_strengths']:
-            response_parts.append(f"   • {strength}")
-
-        response_parts.append("\n📊 **Career Details:**")
-        response_parts.append(f"   🎓 *Education:* {career_details['education']}")
-        response_parts.append(f"   💰 *Salary Range:* {career_details['salary_range']}")
-        response_parts.append(f"   📈 *Growth Potential:* {career_details['growth_potential']}")
-        response_parts.append(f"   ⚖️ *Work-Life Balance:* {career_details['work_life_balance']}")
-        response_parts.append(f"   🔮 *Future Outlook:* {career_details['future_outlook']}")
-        response_parts.append(f"   🏢 *Work Environment:* {career_details['work_environment']}")
-
-        full_response = "\n".join(response_parts)
         dispatcher.utter_message(text=full_response)
 
         return []
@@ -209,9 +540,9 @@ class ActionGenerateLearningPlan(Action):
     def name(self) -> Text:
         return "action_generate_learning_plan"
 
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
 
         # Get the career from entities or current recommendations
         entities = tracker.latest_message.get('entities', [])
@@ -224,7 +555,7 @@ class ActionGenerateLearningPlan(Action):
 
         # If no career entity found, check current recommendations
         if not career_entity:
-            current_recs = tracker.get_slot('current_career_recommendations') or []
+            current_recs = ranked_career_ids(tracker)
             if current_recs:
                 career_entity = current_recs[0]
 
@@ -232,41 +563,13 @@ class ActionGenerateLearningPlan(Action):
             dispatcher.utter_message(text="To create a learning plan, I need to know which career you're interested in. Which career from the recommendations appeals to you most?")
             return []
 
-        # Generate learning plan
-        recommender = CareerRecommender()
-        learning_plan = recommender.generate_learning_plan(career_entity)
+        # Get the pre-rendered learning plan
+        full_response = await rendered_reply("learning_plan", career_entity)
 
-        if not learning_plan:
+        if not full_response:
             dispatcher.utter_message(text="I couldn't generate a learning plan for that career. Let me know if you'd like recommendations for a different career.")
             return []
 
-        # Format learning plan response
-        response_parts = []
-        response_parts.append(f"📚 **Learning Plan for {learning_plan['career']}**")
-        response_parts.append(f"⏱️ *Estimated Duration: {learning_plan['duration_months']} months*")
-
-        for phase in learning_plan['phases']:
-            response_parts.append(f"\n📌 **{phase['phase']} Phase** ({phase['duration']})")
-            response_parts.append(f"   🎯 *Focus:* {phase['focus']}")
-            response_parts.append("   📖 *Resources:*")
-            for resource in phase['resources']:
-                response_parts.append(f"      • {resource}")
-
-        response_parts.append("\n🛠️ **Key Skills to Learn:**")
-        for skill in learning_plan['key_skills_to_learn']:
-            response_parts.append(f"   • {skill}")
-
-        response_parts.append("\n🏆 **Recommended Certifications:**")
-        for cert in learning_plan['recommended_certifications']:
-            response_parts.append(f"   • {cert}")
-
-        response_parts.append("\n📈 **Career Progression Path:**")
-        progression = " → ".join(learning_plan['career_progression'])
-        response_parts.append(f"   {progression}")
-
-        response_parts.append("\n💡 *Pro tip:* Start with free resources, build a portfolio, and network with professionals in the field!")
-
-        full_response = "\n".join(response_parts)
         dispatcher.utter_message(text=full_response)
 
         return []
@@ -277,42 +580,32 @@ class ActionExportCareerPlan(Action):
     def name(self) -> Text:
         return "action_export_career_plan"
 
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
 
         # Get user profile and recommendations
-        interests = tracker.get_slot('interests') or []
-        skills = tracker.get_slot('skills') or []
-        strengths = tracker.get_slot('strengths') or []
-        recommendations = tracker.get_slot('current_career_recommendations') or []
+        user_profile = {
+            'interests': tracker.get_slot('interests') or [],
+            'skills': tracker.get_slot('skills') or [],
+            'strengths': tracker.get_slot('strengths') or [],
+            'preferences': tracker.get_slot('preferences') or []
+        }
+        recommendations = ranked_career_ids(tracker)
 
         if not recommendations:
             dispatcher.utter_message(text="I don't have any career recommendations to export yet. Let's start by exploring your interests and getting some personalized recommendations first!")
             return []
 
-        # For now, provide a summary that could be exported
-        response_parts = []
-        response_parts.append("📄 **Career Exploration Summary**")
-        response_parts.append("\n👤 **Your Profile:**")
-        if interests:
-            response_parts.append(f"   💡 *Interests:* {', '.join(interests)}")
-        if skills:
-            response_parts.append(f"   🛠️ *Skills:* {', '.join(skills)}")
-        if strengths:
-            response_parts.append(f"   💪 *Strengths:* {', '.join(strengths)}")
-
-        response_parts.append("\n🎯 **Recommended Careers:**")
-        recommender = CareerRecommender()
-        for career_id in recommendations[:3]:
-            career_details = recommender.get_career_details(career_id)
-            if career_details:
-                response_parts.append(f"   • {career_details['name']} ({career_details['domain']})")
-
-        response_parts.append("\n💾 *In a full implementation, this would be exported as a PDF with detailed recommendations, learning plans, and next steps.*")
-        response_parts.append("\n📧 *For now, you can save this summary or take a screenshot for your records!*")
-
-        full_response = "\n".join(response_parts)
-        dispatcher.utter_message(text=full_response)
+        # Summarize the plan, reusing the stored ranking while the profile is unchanged
+        full_response, ranking = await run_in_executor(export_summary_text, user_profile, tracker.sender_id,
+                                                       tracker.get_slot('career_ranking'))
 
-        return []
+        # The PDF renders on the export queue and the reply goes out at once; the frontend
+        # downloads it from the export server, and a repeated export is served from the store
+        future = get_export_queue().submit(user_profile, ranking, get_shared_recommender())
+        key = export_key(ranking["profile_hash"], ranking["version"])
+        status_text, payload = export_reply(key, future)
+        dispatcher.utter_message(text=f"{full_response}\n\n{status_text}", json_message=payload)
+
+        return [SlotSet("career_ranking", ranking)]
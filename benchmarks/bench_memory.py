@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Career Catalogue Memory Report
+Compares the resident size of the dict-of-dicts catalogue with compiled Career records
+
+Usage:
+    python benchmarks/bench_memory.py --sizes 10000 50000 --output memory.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_career_database
+from recommender.records import compile_catalogue
+
+DEFAULT_SIZES = [10000, 50000]
+
+
+def retained_memory(load):
+    """Bytes still allocated once load() has returned, with its result kept alive"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = load()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        return result, current, peak
+    finally:
+        tracemalloc.stop()
+
+
+def measure(size, seed):
+    """Memory of one catalogue size in both representations"""
+    # Decoding from JSON gives every career its own string objects, as real loaders do
+    source = json.dumps(generate_career_database(size, seed))
+
+    def load_dicts():
+        return json.loads(source)
+
+    def load_records():
+        career_db = json.loads(source)
+        catalogue = compile_catalogue(career_db)
+        del career_db
+        return catalogue
+
+    _, dict_bytes, dict_peak = retained_memory(load_dicts)
+    _, record_bytes, record_peak = retained_memory(load_records)
+    return {
+        "careers": size,
+        "dict_of_dicts_mb": dict_bytes / (1024 * 1024),
+        "compiled_records_mb": record_bytes / (1024 * 1024),
+        "dict_of_dicts_peak_mb": dict_peak / (1024 * 1024),
+        "compiled_records_peak_mb": record_peak / (1024 * 1024),
+        "reduction": 1 - record_bytes / dict_bytes
+    }
+
+
+def main():
+    """Print and optionally save the before/after memory report"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="catalogue sizes to measure")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument("--output", help="write the report as JSON to this path")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        entry = measure(size, args.seed)
+        results.append(entry)
+        print(f"{size:>8} careers  dict-of-dicts {entry['dict_of_dicts_mb']:8.2f} MB  "
+              f"compiled {entry['compiled_records_mb']:8.2f} MB  "
+              f"({entry['reduction']:.0%} smaller)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"seed": args.seed, "results": results}, handle, indent=2)
+        print(f"[OK] Results written to {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Recommendation Engine Benchmarks
+Times the recommender on synthetic career databases and records machine-readable results
+
+Usage:
+    python benchmarks/bench_recommender.py --sizes 20 1000 10000 --output results.json
+    python benchmarks/bench_recommender.py --compare baseline.json --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_career_database, generate_profiles
+from recommender.career_database import CAREER_CATALOGUE, search_careers_by_keywords
+from recommender.recommendation_engine import CareerRecommender
+from recommender.records import compile_catalogue
+from recommender.search import CareerSearchIndex, get_search_index
+
+DEFAULT_SIZES = [20, 1000, 10000, 100000]
+
+# Slowdown ratio over the baseline that counts as a regression
+REGRESSION_THRESHOLD = 1.25
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    rank = max(int(round(fraction * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def time_operation(operation, arguments):
+    """Run an operation once per argument, returning per-call latencies in seconds"""
+    latencies = []
+    for argument in arguments:
+        start = time.perf_counter()
+        operation(argument)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def peak_memory(operation, arguments):
+    """Peak traced allocation in bytes while running the operation over its arguments"""
+    tracemalloc.start()
+    try:
+        for argument in arguments:
+            operation(argument)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(name, size, latencies, memory_bytes):
+    """Latency percentiles, throughput and peak memory for one operation"""
+    total = sum(latencies)
+    return {
+        "operation": name,
+        "careers": size,
+        "iterations": len(latencies),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "throughput_per_s": len(latencies) / total if total else float("inf"),
+        "peak_memory_mb": memory_bytes / (1024 * 1024)
+    }
+
+
+def bench_size(size, iterations, seed):
+    """Benchmark every operation against one synthetic catalogue size"""
+    if size == len(CAREER_CATALOGUE):
+        career_db = CAREER_CATALOGUE
+    else:
+        career_db = compile_catalogue(generate_career_database(size, seed))
+    profiles = generate_profiles(career_db, iterations, seed)
+    rng = random.Random(seed)
+    careers = [rng.choice(list(career_db.values())) for _ in range(iterations)]
+    keyword_sets = [profile["interests"] + profile["skills"] or ["data"] for profile in profiles]
+    memory_sample = max(1, iterations // 10)
+
+    results = []
+
+    build_start = time.perf_counter()
+    recommender = CareerRecommender(career_db=career_db, use_cache=False)
+    build_seconds = time.perf_counter() - build_start
+    # A copy of the catalogue forces a fresh build instead of reusing the shared index
+    build_memory = peak_memory(
+        lambda db: CareerRecommender(career_db=compile_catalogue(dict(db)), use_cache=False), [career_db])
+    results.append(summarize("build", size, [build_seconds], build_memory))
+
+    # Keyword search is served from an FTS5 index built once per catalogue
+    search_start = time.perf_counter()
+    get_search_index(career_db)
+    search_seconds = time.perf_counter() - search_start
+    search_memory = peak_memory(CareerSearchIndex, [career_db])
+    results.append(summarize("build_search_index", size, [search_seconds], search_memory))
+
+    operations = [
+        ("recommend_careers", lambda profile: recommender.recommend_careers(profile, top_n=5), profiles),
+        ("search_careers_by_keywords",
+         lambda keywords: search_careers_by_keywords(keywords, career_db=career_db), keyword_sets),
+        ("search_careers_by_keywords_top10",
+         lambda keywords: search_careers_by_keywords(keywords, career_db=career_db, limit=10), keyword_sets),
+        ("calculate_match_score",
+         lambda pair: recommender.calculate_match_score(*pair), list(zip(profiles, careers)))
+    ]
+    for name, operation, arguments in operations:
+        latencies = time_operation(operation, arguments)
+        memory_bytes = peak_memory(operation, arguments[:memory_sample])
+        results.append(summarize(name, size, latencies, memory_bytes))
+
+    return results
+
+
+def git_revision():
+    """Current commit of the working tree, if available"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, threshold):
+    """Print p50 ratios against a baseline run and return the regressed entries"""
+    with open(baseline_path, encoding="utf-8") as handle:
+        baseline = {(entry["operation"], entry["careers"]): entry
+                    for entry in json.load(handle)["results"]}
+
+    regressions = []
+    print(f"\nComparison with {baseline_path} (p50 ratio, >{threshold:.2f} is a regression)")
+    for entry in results:
+        previous = baseline.get((entry["operation"], entry["careers"]))
+        if not previous or not previous["p50_ms"]:
+            continue
+        ratio = entry["p50_ms"] / previous["p50_ms"]
+        flag = "REGRESSION" if ratio > threshold else "ok"
+        print(f"   {entry['operation']:<28} {entry['careers']:>8} careers  x{ratio:.2f}  {flag}")
+        if ratio > threshold:
+            regressions.append(entry)
+    return regressions
+
+
+def main():
+    """Run the benchmark suite from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="catalogue sizes to benchmark")
+    parser.add_argument("--iterations", type=int, default=200, help="calls timed per operation")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="p50 slowdown ratio that fails the comparison")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        print(f"[WORKING] Benchmarking {size} careers...")
+        for entry in bench_size(size, args.iterations, args.seed):
+            results.append(entry)
+            print(f"   {entry['operation']:<28} p50 {entry['p50_ms']:9.3f} ms  "
+                  f"p95 {entry['p95_ms']:9.3f} ms  p99 {entry['p99_ms']:9.3f} ms  "
+                  f"{entry['throughput_per_s']:10.1f}/s  peak {entry['peak_memory_mb']:8.2f} MB")
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"[OK] Results written to {args.output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,121 @@
+"""
+Synthetic Career Data
+Generates career databases and user profiles that follow the CAREER_DATABASE schema
+"""
+
+import random
+
+from recommender.career_database import CAREER_DATABASE, ABBREVIATION_MAP
+from recommender.recommendation_engine import RELATED_TERMS
+
+SCHEMA_FIELDS = ("key_interests", "key_skills", "key_strengths")
+
+DOMAINS = sorted({career["domain"] for career in CAREER_DATABASE.values()})
+EDUCATION = sorted({career["education"] for career in CAREER_DATABASE.values()})
+EXPERIENCE_LEVELS = sorted({career["experience_level"] for career in CAREER_DATABASE.values()})
+WORK_ENVIRONMENTS = sorted({career["work_environment"] for career in CAREER_DATABASE.values()})
+RATINGS = ["Low", "Medium", "High", "Very High"]
+BALANCE = ["Poor", "Variable", "Good", "Excellent"]
+OUTLOOK = ["Declining", "Stable", "Good", "Excellent"]
+
+# How many terms each career lists per field, as in the hand-written catalogue
+TERMS_PER_FIELD = {"key_interests": (4, 5), "key_skills": (4, 6), "key_strengths": (3, 4)}
+
+
+def _real_terms(field):
+    return sorted({term for career in CAREER_DATABASE.values() for term in career[field]})
+
+
+def build_vocabulary(num_careers, rng):
+    """
+    Real catalogue terms plus synthetic ones, growing sub-linearly with the
+    catalogue the way occupation taxonomies reuse most of their vocabulary.
+    """
+    vocabulary = {}
+    for field in SCHEMA_FIELDS:
+        terms = _real_terms(field)
+        extra = int(4 * num_careers ** 0.5)
+        stems = [term.split("_")[0] for term in terms]
+        terms += [f"{rng.choice(stems)}_{field[4:-1]}_{i}" for i in range(extra)]
+        vocabulary[field] = terms
+    return vocabulary
+
+
+def _zipf_choice(terms, rng, count):
+    """Sample distinct terms with a long-tailed bias towards the start of the list"""
+    chosen = []
+    while len(chosen) < count:
+        term = terms[min(int(rng.paretovariate(1.2)) - 1, len(terms) - 1)]
+        if rng.random() < 0.5:
+            term = rng.choice(terms)
+        if term not in chosen:
+            chosen.append(term)
+    return chosen
+
+
+def generate_career_database(num_careers, seed=0):
+    """Synthetic career database of the given size, deterministic for a seed"""
+    rng = random.Random(seed)
+    vocabulary = build_vocabulary(num_careers, rng)
+    for terms in vocabulary.values():
+        rng.shuffle(terms)
+
+    career_db = {}
+    for i in range(num_careers):
+        low = rng.randrange(30, 120) * 1000
+        high = low + rng.randrange(20, 100) * 1000
+        career = {
+            "name": f"Synthetic Career {i}",
+            "domain": rng.choice(DOMAINS),
+            "description": f"Synthetic occupation {i} for benchmarking the recommender",
+            "salary_range": f"${low:,} - ${high:,}",
+            "education": rng.choice(EDUCATION),
+            "experience_level": rng.choice(EXPERIENCE_LEVELS),
+            "work_environment": rng.choice(WORK_ENVIRONMENTS),
+            "growth_potential": rng.choice(RATINGS),
+            "job_satisfaction": rng.choice(RATINGS),
+            "work_life_balance": rng.choice(BALANCE),
+            "future_outlook": rng.choice(OUTLOOK)
+        }
+        for field in SCHEMA_FIELDS:
+            career[field] = _zipf_choice(vocabulary[field], rng, rng.randint(*TERMS_PER_FIELD[field]))
+        career_db[f"synthetic_career_{i}"] = career
+    return career_db
+
+
+def generate_profiles(career_db, count, seed=0):
+    """
+    Realistic profile mix: exact catalogue terms, abbreviations, partial
+    terms, related concepts, preferences and the odd unknown word.
+    """
+    rng = random.Random(seed)
+    careers = list(career_db.values())
+    abbreviations = list(ABBREVIATION_MAP)
+    concepts = list(RELATED_TERMS)
+    preferences = ["remote work", "travel", "creative freedom", "leadership", "teamwork", "independent"]
+
+    def partial(term):
+        start = rng.randrange(0, max(len(term) - 3, 1))
+        return term[start:start + rng.randint(3, 8)]
+
+    def pick(field):
+        term = rng.choice(rng.choice(careers)[field])
+        roll = rng.random()
+        if roll < 0.5:
+            return term
+        if roll < 0.8:
+            return partial(term)
+        return f"unknown_{rng.randrange(1000)}"
+
+    profiles = []
+    for _ in range(count):
+        interests = [pick("key_interests") for _ in range(rng.randint(0, 2))]
+        interests += rng.sample(abbreviations, rng.randint(0, 1))
+        interests += rng.sample(concepts, rng.randint(0, 1))
+        profiles.append({
+            "interests": interests,
+            "skills": [pick("key_skills") for _ in range(rng.randint(0, 3))],
+            "strengths": [pick("key_strengths") for _ in range(rng.randint(0, 2))],
+            "preferences": rng.sample(preferences, rng.randint(0, 2))
+        })
+    return profiles
@@ -135,6 +135,9 @@ if 'is_typing' not in st.session_state:
 # Rasa server configuration
 RASA_SERVER_URL = "http://localhost:5005/webhooks/rest/webhook"
 
+# The action server's export endpoint, serving finished PDF career plans by key
+EXPORT_SERVER_URL = "http://localhost:5056"
+
 def send_message_to_rasa(message, sender_id):
     """Send message to Rasa server and get response with improved error handling"""
     try:
@@ -176,7 +179,7 @@ def send_message_to_rasa(message, sender_id):
     except Exception as e:
         return [{"text": f"🚨 Critical error: {str(e)}. Please restart the application and try again."}]
 
-def render_message(message, is_user=False):
+def render_message(message, is_user=False, payload=None, key=None):
     """Render a chat message with clean styling"""
     if is_user:
         # User message - right aligned
@@ -187,54 +190,79 @@ def render_message(message, is_user=False):
             </div>
         </div>
         """, unsafe_allow_html=True)
+    elif payload and payload.get('type') == 'career_recommendations':
+        render_career_recommendations(payload)
+    elif payload and payload.get('type') == 'career_plan_export':
+        render_career_plan_export(payload, key)
     else:
-        # Check if message contains career recommendations
-        if "🥇" in message or "🥈" in message or "🥉" in message:
-            render_career_recommendations(message)
-        else:
-            # Bot message - left aligned
-            st.markdown(f"""
-            <div class="message-bubble bot-message">
-                {message}
-            </div>
-            """, unsafe_allow_html=True)
-
-def render_career_recommendations(message):
-    """Parse and render career recommendations using Streamlit components"""
-    lines = message.split('\n')
-    recommendations = []
-    current_rec = {}
-
-    for line in lines:
-        if line.startswith('🥇') or line.startswith('🥈') or line.startswith('🥉'):
-            if current_rec:
-                recommendations.append(current_rec)
-            current_rec = {'title': line.strip(), 'details': []}
-        elif current_rec:
-            current_rec['details'].append(line)
-
-    if current_rec:
-        recommendations.append(current_rec)
-
-    # Render each recommendation using Streamlit components
-    for rec in recommendations:
-        title = rec['title']
-        details = '\n'.join(rec['details'])
-
-        # Extract match score for styling
-        if "High confidence" in details or "80%" in details or "90%" in details:
-            score_color = "🟢"
-            score_text = "High Match"
-        elif "Low" in details or "20%" in details or "30%" in details:
-            score_color = "🔴"
-            score_text = "Low Match"
-        else:
-            score_color = "🟡"
-            score_text = "Medium Match"
+        # Bot message - left aligned
+        st.markdown(f"""
+        <div class="message-bubble bot-message">
+            {message}
+        </div>
+        """, unsafe_allow_html=True)
+
+def match_badge(confidence):
+    """CSS class and label of the match badge for a recommendation's confidence level"""
+    if confidence in ("High", "Medium-High"):
+        return "high-match", "High Match"
+    elif confidence == "Medium":
+        return "medium-match", "Medium Match"
+    return "low-match", "Low Match"
+
+def render_career_recommendations(payload):
+    """Render structured career recommendations as cards, straight from the action's payload"""
+    st.markdown("🎯 Based on what you've shared, here are career paths that align well with your profile:")
+
+    medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+    for i, rec in enumerate(payload['recommendations'], 1):
+        badge_class, badge_text = match_badge(rec['confidence'])
 
         # Use Streamlit's expander for clean collapsible cards
-        with st.expander(f"{title} - {score_color} {score_text}", expanded=False):
-            st.markdown(details)
+        with st.expander(f"{medals.get(i, '⭐')} {rec['name']} - {badge_text}", expanded=i == 1):
+            st.markdown(f'<span class="match-score {badge_class}">{rec["match_score"]}% match · '
+                        f'{rec["confidence"]} confidence</span>', unsafe_allow_html=True)
+            st.markdown(f"💼 *{rec['domain']}*")
+            st.markdown(f"💰 *Salary Range:* {rec['salary_range']}")
+            st.markdown(f"✅ *Why it fits:* {rec['why_it_fits']}")
+            if rec['key_skills']:
+                st.markdown(f"🛠️ *Key Skills:* {', '.join(rec['key_skills'])}")
+
+    st.markdown("🤔 Would you like me to elaborate on any of these careers, or explore different options based on specific preferences?")
+
+def fetch_export(url):
+    """Status code and PDF bytes of an export from the export server; (None, None) when it is unreachable"""
+    try:
+        response = requests.get(EXPORT_SERVER_URL + url, timeout=10)
+    except requests.exceptions.RequestException:
+        return None, None
+    return response.status_code, response.content if response.status_code == 200 else None
+
+def render_career_plan_export(payload, key):
+    """Offer a PDF export for download, fetched from the export server by its key and kept for the session"""
+    if payload.get('status') == 'failed' or not payload.get('url'):
+        return
+
+    exports = st.session_state.setdefault('exports', {})
+    data = exports.get(payload['key'])
+    status = 200
+    if data is None:
+        status, data = fetch_export(payload['url'])
+        if data is not None:
+            exports[payload['key']] = data
+
+    if data is not None:
+        st.download_button("📥 Download your career plan (PDF)", data,
+                           file_name=f"career_plan_{payload['key'][:8]}.pdf", mime="application/pdf", key=key)
+    elif status == 202:
+        st.info("⏳ Your PDF career plan is still being prepared.")
+        # Any button click reruns the app, which fetches the export again
+        st.button("🔄 Check again", key=f"{key}-refresh")
+    elif status is None:
+        st.warning("⚠️ Couldn't reach the export server to download your PDF. Please try again in a moment.")
+        st.button("🔄 Try again", key=f"{key}-refresh")
+    else:
+        st.warning("⚠️ This PDF is no longer available. Ask me to export your career plan again.")
 
 def render_typing_indicator():
     """Render typing indicator animation"""
@@ -282,8 +310,8 @@ def main():
 
         with chat_container:
             # Display chat messages
-            for message in st.session_state.messages:
-                render_message(message['content'], message['is_user'])
+            for i, message in enumerate(st.session_state.messages):
+                render_message(message['content'], message['is_user'], message.get('payload'), key=f"message-{i}")
 
             # Show typing indicator if bot is responding
             if st.session_state.is_typing:
@@ -330,13 +358,33 @@ def main():
             st.session_state.is_typing = False
 
             # Add bot responses
+            bot_messages = []
             for response in bot_responses:
                 if 'text' in response:
-                    st.session_state.messages.append({
+                    bot_messages.append({
                         'content': response['text'],
                         'is_user': False,
                         'timestamp': datetime.now()
                     })
+                elif isinstance(response.get('custom'), dict) and response['custom'].get('type') == 'career_recommendations':
+                    # The cards replace the text version of the same reply, sent just before it
+                    payload = response['custom']
+                    del bot_messages[max(len(bot_messages) - payload.get('text_parts', 0), 0):]
+                    bot_messages.append({
+                        'content': None,
+                        'payload': payload,
+                        'is_user': False,
+                        'timestamp': datetime.now()
+                    })
+                elif isinstance(response.get('custom'), dict) and response['custom'].get('type') == 'career_plan_export':
+                    # Shown after the export summary as a download button, fetched once the PDF is ready
+                    bot_messages.append({
+                        'content': None,
+                        'payload': response['custom'],
+                        'is_user': False,
+                        'timestamp': datetime.now()
+                    })
+            st.session_state.messages.extend(bot_messages)
 
             # Rerun to update UI
             st.rerun()
@@ -0,0 +1,129 @@
+"""
+Recommendation Cache
+Bounded LRU/TTL cache of recommendations keyed by canonicalized profile
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+PROFILE_FIELDS = ("interests", "skills", "strengths", "preferences")
+
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TTL_SECONDS = 3600
+
+
+def canonical_profile(user_profile):
+    """
+    Order-insensitive, normalized copy of a profile.
+    Terms are lowercased and sorted; repeats are kept because they change scores.
+    """
+    return {
+        field: sorted(term.lower().strip() if field == "interests" else term.lower()
+                      for term in user_profile.get(field, []))
+        for field in PROFILE_FIELDS
+    }
+
+
+def profile_key(canonical):
+    """Hashable key for a canonical profile"""
+    return tuple(tuple(canonical[field]) for field in PROFILE_FIELDS)
+
+
+def profile_hash(user_profile):
+    """Short, stable hash of a profile's canonical form, for use outside this process"""
+    payload = json.dumps(profile_key(canonical_profile(user_profile)))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class RecommendationCache:
+    """Thread-safe LRU cache with optional time-to-live and hit/miss/eviction counters"""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL_SECONDS, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def check_version(self, version):
+        """Drop every entry when the career database version changes"""
+        with self.lock:
+            if version != self.version:
+                if self.entries:
+                    self.invalidations += 1
+                self.entries.clear()
+                self.version = version
+
+    def get(self, key):
+        """Cached value for key, or None on a miss"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if self.ttl is not None and self.clock() - stored_at > self.ttl:
+                del self.entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, version=None):
+        """
+        Store a value, evicting the least recently used entries beyond maxsize.
+        A value computed against another career database version than the current one is dropped.
+        """
+        with self.lock:
+            if version is not None and version != self.version:
+                return
+            self.entries[key] = (self.clock(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry, keeping the counters"""
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        """Counters for sizing the cache against real traffic"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "version": self.version,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+_shared_cache = None
+
+
+def get_recommendation_cache():
+    """Return the process-wide recommendation cache"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = RecommendationCache()
+    return _shared_cache
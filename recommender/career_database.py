@@ -3,6 +3,18 @@ Career Database and Recommendation Engine
 Contains comprehensive career information and matching algorithms
 """
 
+import re
+
+from .index import get_career_index
+from .lazy import lazy_import
+from .normalizer import TermNormalizer
+from .records import TERM_FIELDS, compile_catalogue
+
+# Only the search and facet helpers need SQLite and NumPy
+sqlite3 = lazy_import("sqlite3")
+_facets = lazy_import(".facets", __package__)
+_search = lazy_import(".search", __package__)
+
 CAREER_DATABASE = {
     # Technology & Engineering
     "software_engineer": {
@@ -327,6 +339,32 @@ CAREER_DATABASE = {
     }
 }
 
+# Compiled, read-only view of the catalogue used at runtime
+CAREER_CATALOGUE = compile_catalogue(CAREER_DATABASE)
+
+# Recommended certifications per career, used in learning plans
+CERTIFICATION_MAP = {
+    "software_engineer": ["AWS Certified Developer", "Google Cloud Professional", "Microsoft Azure Fundamentals"],
+    "data_scientist": ["IBM Data Science Professional Certificate", "Google Data Analytics", "TensorFlow Developer Certificate"],
+    "ai_engineer": ["AWS Machine Learning Specialty", "Google Cloud AI/ML", "Deep Learning Specialization"],
+    "cybersecurity_analyst": ["CompTIA Security+", "CISSP", "CEH (Certified Ethical Hacker)"],
+    "ux_ui_designer": ["Google UX Design", "Adobe Certified Expert", "Interaction Design Foundation"],
+    "business_analyst": ["CBAP (Certified Business Analysis Professional)", "PMI-PBA", "ECBA"],
+    "financial_analyst": ["CFA (Chartered Financial Analyst)", "FRM", "CPA"],
+    "project_manager": ["PMP (Project Management Professional)", "CSM (Certified ScrumMaster)", "PRINCE2"]
+}
+DEFAULT_CERTIFICATIONS = ["Industry-specific certifications"]
+
+# Career progression paths, used in learning plans
+CAREER_PROGRESSION_MAP = {
+    "software_engineer": ["Junior Developer", "Mid-level Developer", "Senior Developer", "Tech Lead", "Engineering Manager"],
+    "data_scientist": ["Data Analyst", "Junior Data Scientist", "Data Scientist", "Senior Data Scientist", "Data Science Manager"],
+    "ux_ui_designer": ["Junior Designer", "UX/UI Designer", "Senior Designer", "Design Lead", "Design Manager"],
+    "business_analyst": ["Business Analyst", "Senior Business Analyst", "Business Analysis Manager", "IT Business Partner"],
+    "project_manager": ["Associate PM", "Project Manager", "Senior PM", "Program Manager", "PMO Director"]
+}
+DEFAULT_CAREER_PROGRESSION = ["Entry Level", "Mid Level", "Senior Level", "Management", "Executive"]
+
 # Abbreviation mappings
 ABBREVIATION_MAP = {
     "it": ["information_technology", "tech", "technology"],
@@ -358,57 +396,101 @@ ABBREVIATION_MAP = {
     "software": ["programming", "development", "tech", "technology"]
 }
 
+# Compiled once; catalogue terms let plural forms like "designs" resolve to "design"
+_interest_normalizer = TermNormalizer(ABBREVIATION_MAP, vocabulary={
+    term for career in CAREER_DATABASE.values() for field in TERM_FIELDS for term in career[field]})
+
 def normalize_interest(interest):
-    """Normalize interests by expanding abbreviations and standardizing terms"""
-    interest_lower = interest.lower().strip()
+    """
+    Normalize interests by expanding abbreviations and standardizing terms.
+    Separators and plurals are normalized too ("Machine Learning" -> machine_learning),
+    and a term made only of abbreviations ("ai/ml") expands each of them.
+    """
+    return list(_interest_normalizer.normalize(interest))
 
-    # Check if it's an abbreviation
-    if interest_lower in ABBREVIATION_MAP:
-        return ABBREVIATION_MAP[interest_lower]
+_shared_normalizer = None
 
-    # Return as list for consistency
-    return [interest_lower]
+def get_interest_normalizer(index):
+    """
+    Return the interest normalizer over a career index's own vocabulary, so plurals resolve
+    against whatever catalogue is served; it is compiled again only when the index changes
+    """
+    global _shared_normalizer
+    if _shared_normalizer is None or _shared_normalizer[0] is not index:
+        vocabulary = {term for field in TERM_FIELDS for term in index.csc(field)[0]}
+        _shared_normalizer = index, TermNormalizer(ABBREVIATION_MAP, vocabulary=vocabulary)
+    return _shared_normalizer[1]
 
 def get_career_by_id(career_id):
     """Get career details by ID"""
-    return CAREER_DATABASE.get(career_id)
+    return CAREER_CATALOGUE.get(career_id)
 
 def get_all_careers():
     """Get all careers in the database"""
-    return CAREER_DATABASE
+    return CAREER_CATALOGUE
 
 def get_careers_by_domain(domain):
     """Get careers filtered by domain"""
-    return {k: v for k, v in CAREER_DATABASE.items() if v["domain"] == domain}
+    return _facets.get_facet_index(get_career_index(CAREER_CATALOGUE)).careers({"domain": domain})
+
+def search_careers_by_keywords(keywords, career_db=None, limit=None, offset=0, prefix=False):
+    """
+    Search careers by keywords in interests, skills, or strengths
+    Answered from a SQLite FTS5 index, or by a full scan where SQLite lacks FTS5
+    """
+    if career_db is None:
+        career_db = CAREER_CATALOGUE
+
+    try:
+        search_index = _search.get_search_index(career_db)
+    except sqlite3.OperationalError:
+        return _scan_careers_by_keywords(keywords, career_db, limit, offset, prefix)
+    return search_index.search(keywords, limit, offset, prefix)
+
+_WORD = re.compile(r"[^\W_]+")
+
+def _starts_words(keyword, text):
+    """Whether the keyword's words appear in the text, the last one as a word prefix"""
+    wanted = _WORD.findall(keyword)
+    words = _WORD.findall(text.lower())
+    n = len(wanted)
+    return any(words[i:i + n - 1] == wanted[:-1] and words[i + n - 1].startswith(wanted[-1])
+               for i in range(len(words) - n + 1))
 
-def search_careers_by_keywords(keywords):
-    """Search careers by keywords in interests, skills, or strengths"""
+def _scan_careers_by_keywords(keywords, career_db, limit=None, offset=0, prefix=False):
+    """Search careers by keywords with a full scan of the database"""
     matching_careers = {}
 
-    for career_id, career_data in CAREER_DATABASE.items():
+    for career_id, career_data in career_db.items():
         score = 0
         matched_keywords = []
 
         for keyword in keywords:
             keyword_lower = keyword.lower()
+            if prefix:
+                if not _WORD.search(keyword_lower):
+                    continue
+                matches = lambda values: any(_starts_words(keyword_lower, value) for value in values)
+            else:
+                matches = lambda values: any(keyword_lower in value for value in values)
 
             # Check interests
-            if any(keyword_lower in interest for interest in career_data["key_interests"]):
+            if matches(career_data["key_interests"]):
                 score += 3
                 matched_keywords.append(f"interest: {keyword}")
 
             # Check skills
-            if any(keyword_lower in skill for skill in career_data["key_skills"]):
+            if matches(career_data["key_skills"]):
                 score += 2
                 matched_keywords.append(f"skill: {keyword}")
 
             # Check strengths
-            if any(keyword_lower in strength for strength in career_data["key_strengths"]):
+            if matches(career_data["key_strengths"]):
                 score += 2
                 matched_keywords.append(f"strength: {keyword}")
 
             # Check name and description
-            if keyword_lower in career_data["name"].lower() or keyword_lower in career_data["description"].lower():
+            if matches([career_data["name"].lower(), career_data["description"].lower()]):
                 score += 1
                 matched_keywords.append(f"description: {keyword}")
 
@@ -420,4 +502,5 @@ def search_careers_by_keywords(keywords):
             }
 
     # Sort by score descending
-    return dict(sorted(matching_careers.items(), key=lambda x: x[1]["score"], reverse=True))
+    ranked = sorted(matching_careers.items(), key=lambda x: x[1]["score"], reverse=True)
+    return dict(ranked[offset:None if limit is None else offset + limit])
@@ -0,0 +1,65 @@
+"""
+Concept Graph
+Precompiled bidirectional index of related concepts for interest matching
+"""
+
+# How many hops away a concept may be and still count as related
+RELATED_CONCEPT_DEPTH = 1
+
+# Cosine similarity a vocabulary term needs to count as a similar concept (see similarity.py)
+SIMILARITY_THRESHOLD = 0.5
+
+
+class ConceptGraph:
+    """
+    Undirected concept graph with the related set of every concept precomputed.
+    Relations and synonyms are merged, and each edge is stored in both directions.
+    """
+
+    def __init__(self, *relation_maps, depth=RELATED_CONCEPT_DEPTH):
+        self.depth = depth
+        self.adjacency = {}
+
+        for relation_map in relation_maps:
+            for concept, related_list in relation_map.items():
+                for related in related_list:
+                    self._connect(concept.lower(), related.lower())
+
+        self.closure = {concept: self._reachable(concept) for concept in self.adjacency}
+
+    def _connect(self, concept, related):
+        if concept == related:
+            return
+        self.adjacency.setdefault(concept, set()).add(related)
+        self.adjacency.setdefault(related, set()).add(concept)
+
+    def _reachable(self, concept):
+        """Concepts within depth hops of a concept, excluding itself"""
+        seen = {concept}
+        frontier = {concept}
+        for _ in range(self.depth):
+            frontier = {neighbour for node in frontier for neighbour in self.adjacency[node]} - seen
+            if not frontier:
+                break
+            seen |= frontier
+        seen.discard(concept)
+        return frozenset(seen)
+
+    def related(self, concept):
+        """Concepts related to the given concept"""
+        return self.closure.get(concept.lower(), frozenset())
+
+    def is_related(self, concept, terms):
+        """Whether any of the terms is related to the concept"""
+        return not self.closure.get(concept.lower(), frozenset()).isdisjoint(terms)
+
+
+_shared_graphs = {}
+
+
+def get_concept_graph(related_terms, synonyms, depth=RELATED_CONCEPT_DEPTH):
+    """Return the concept graph for these relations and depth, compiling it on first use"""
+    key = (id(related_terms), id(synonyms), depth)
+    if key not in _shared_graphs:
+        _shared_graphs[key] = ConceptGraph(related_terms, synonyms, depth=depth)
+    return _shared_graphs[key]
@@ -0,0 +1,297 @@
+"""
+Career Plan Export
+PDF career plans rendered on a background queue into a content-addressed file store,
+and served for download over HTTP
+"""
+
+import hashlib
+import io
+import logging
+import os
+import queue
+import re
+import tempfile
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .ranking import expand_ranking
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bump whenever render_pdf or plan_document changes, so older exports are never served
+EXPORT_FORMAT = 1
+
+# Directory of the export store; CAREER_EXPORT_DIR overrides it
+EXPORT_DIR_ENV = "CAREER_EXPORT_DIR"
+DEFAULT_EXPORT_DIR = os.path.join(PROJECT_ROOT, "exports")
+
+# Background threads rendering PDFs
+EXPORT_WORKERS = 1
+
+# Recommended careers whose details and learning plans go into the PDF
+EXPORTED_CAREERS = 3
+
+# Address the download server listens on; CAREER_EXPORT_HOST and CAREER_EXPORT_PORT override it
+EXPORT_HOST_ENV = "CAREER_EXPORT_HOST"
+EXPORT_PORT_ENV = "CAREER_EXPORT_PORT"
+DEFAULT_EXPORT_HOST = "127.0.0.1"
+DEFAULT_EXPORT_PORT = 5056
+
+# Seconds a client is asked to wait before fetching a PDF that is still rendering
+RETRY_AFTER_SECONDS = 2
+
+_EXPORT_PATH = re.compile(r"/exports/([0-9a-f]{40})\.pdf")
+
+logger = logging.getLogger(__name__)
+
+
+def export_key(profile_hash, version):
+    """Store key of the plan of one profile against one catalogue version"""
+    return hashlib.sha1(f"{EXPORT_FORMAT}:{profile_hash}:{version}".encode("utf-8")).hexdigest()
+
+
+def export_url(key):
+    """Path of an export on the download server"""
+    return f"/exports/{key}.pdf"
+
+
+class ExportStore:
+    """
+    Rendered PDFs on local disk, one file per key, fanned out over subdirectories
+    by the key's first two characters. Files are written atomically, so a reader
+    never sees a partial PDF.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or os.environ.get(EXPORT_DIR_ENV) or DEFAULT_EXPORT_DIR
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.pdf")
+
+    def get(self, key):
+        """Path of a stored export, or None"""
+        path = self.path(key)
+        return path if os.path.exists(path) else None
+
+    def read(self, key):
+        """Bytes of a stored export, or None"""
+        try:
+            with open(self.path(key), "rb") as handle:
+                return handle.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, data):
+        """Store an export's bytes and return its path"""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return path
+
+
+def plan_document(user_profile, ranking, recommender, limit=EXPORTED_CAREERS):
+    """Everything a career plan shows: the profile, and each top career with its details and learning plan"""
+    careers = []
+    for recommendation in expand_ranking(ranking, recommender)[:limit]:
+        career_id = recommendation["career_id"]
+        careers.append({
+            "recommendation": recommendation,
+            "details": recommender.get_career_details(career_id),
+            "learning_plan": recommender.generate_learning_plan(career_id)
+        })
+    return {"profile": user_profile, "version": ranking["version"], "careers": careers}
+
+
+def render_pdf(plan):
+    """Render a plan document as PDF bytes with ReportLab"""
+    # ReportLab is only needed once someone exports, so it stays out of the import path
+    from xml.sax.saxutils import escape
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import cm
+    from reportlab.platypus import ListFlowable, PageBreak, Paragraph, SimpleDocTemplate, Spacer
+
+    styles = getSampleStyleSheet()
+
+    def paragraph(text, style="BodyText"):
+        return Paragraph(escape(str(text)), styles[style])
+
+    def field(label, value):
+        return Paragraph(f"<b>{escape(label)}:</b> {escape(str(value))}", styles["BodyText"])
+
+    def bullets(items):
+        return ListFlowable([paragraph(item) for item in items], bulletType="bullet", leftIndent=12)
+
+    story = [paragraph("Career Exploration Plan", "Title"), paragraph("Your Profile", "Heading2")]
+    for label, key in (("Interests", "interests"), ("Skills", "skills"),
+                       ("Strengths", "strengths"), ("Preferences", "preferences")):
+        if plan["profile"].get(key):
+            story.append(field(label, ", ".join(plan["profile"][key])))
+
+    story.append(paragraph("Recommended Careers", "Heading2"))
+    for i, career in enumerate(plan["careers"], 1):
+        rec = career["recommendation"]
+        story.append(paragraph(f"{i}. {rec['career_name']} ({rec['domain']})", "Heading3"))
+        story.append(field("Match score", f"{rec['match_score']}% ({rec['confidence']} confidence)"))
+        story.append(field("Salary range", rec["salary_range"]))
+        story.append(field("Why it fits", rec["why_it_fits"]))
+
+    for career in plan["careers"]:
+        details, learning_plan = career["details"], career["learning_plan"]
+        story.extend([PageBreak(), paragraph(details["name"], "Heading1"), paragraph(details["description"])])
+        story.append(field("Domain", details["domain"]))
+        story.append(field("Education", details["education"]))
+        story.append(field("Salary range", details["salary_range"]))
+        story.append(field("Growth potential", details["growth_potential"]))
+        story.append(field("Work-life balance", details["work_life_balance"]))
+        story.append(field("Future outlook", details["future_outlook"]))
+        story.append(field("Work environment", details["work_environment"]))
+        story.extend([paragraph("Key Skills", "Heading3"), bullets(details["key_skills"])])
+
+        story.append(paragraph(f"Learning Plan ({learning_plan['duration_months']} months)", "Heading2"))
+        for phase in learning_plan["phases"]:
+            story.append(paragraph(f"{phase['phase']} Phase ({phase['duration']})", "Heading3"))
+            story.append(field("Focus", phase["focus"]))
+            story.append(bullets(phase["resources"]))
+        story.extend([paragraph("Recommended Certifications", "Heading3"),
+                      bullets(learning_plan["recommended_certifications"])])
+        story.append(field("Career progression", " » ".join(learning_plan["career_progression"])))
+        story.append(Spacer(1, 0.5 * cm))
+
+    buffer = io.BytesIO()
+    document = SimpleDocTemplate(buffer, pagesize=A4, title="Career Exploration Plan",
+                                 leftMargin=2 * cm, rightMargin=2 * cm, topMargin=2 * cm, bottomMargin=2 * cm)
+    document.build(story)
+    return buffer.getvalue()
+
+
+class ExportQueue:
+    """
+    Renders PDF exports on background threads, off the request path. submit() returns a
+    Future of the export's store key: already done when the store has it, and shared by
+    every caller asking for the same key while it renders.
+    """
+
+    def __init__(self, store=None, workers=EXPORT_WORKERS):
+        self.store = store or ExportStore()
+        self.workers = workers
+        self.jobs = queue.Queue()
+        self.pending = {}
+        self.threads = []
+        self.lock = threading.Lock()
+
+    def submit(self, user_profile, ranking, recommender):
+        """Queue the plan of a ranked profile, unless it is stored or already queued"""
+        key = export_key(ranking["profile_hash"], ranking["version"])
+        if self.store.get(key) is not None:
+            future = Future()
+            future.set_result(key)
+            return future
+
+        with self.lock:
+            future = self.pending.get(key)
+            if future is None:
+                future = self.pending[key] = Future()
+                self.jobs.put((key, future, user_profile, ranking, recommender))
+                self._start()
+            return future
+
+    def is_pending(self, key):
+        """Whether an export is queued or rendering"""
+        with self.lock:
+            return key in self.pending
+
+    def _start(self):
+        # Workers start with the first export, so servers that never export run no threads
+        while len(self.threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f"career-export-{len(self.threads)}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _work(self):
+        while True:
+            key, future, user_profile, ranking, recommender = self.jobs.get()
+            # A cancelled export is dropped, as nobody is waiting for it
+            running = future.set_running_or_notify_cancel()
+            error = None
+            if running:
+                try:
+                    if self.store.get(key) is None:
+                        self.store.put(key, render_pdf(plan_document(user_profile, ranking, recommender)))
+                except Exception as render_error:
+                    logger.warning("Exporting career plan %s failed: %s", key, render_error)
+                    error = render_error
+            # No longer pending by the time the future resolves, so callers find it stored or failed
+            with self.lock:
+                self.pending.pop(key, None)
+            if not running:
+                continue
+            if error is None:
+                future.set_result(key)
+            else:
+                future.set_exception(error)
+
+
+class ExportRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET /exports/<key>.pdf: 200 with the PDF once it is stored, 202 while it is
+    queued or rendering, and 404 for keys that are unknown or whose render failed
+    """
+
+    def do_GET(self):
+        match = _EXPORT_PATH.fullmatch(self.path.split("?", 1)[0])
+        if match is None:
+            self.send_error(404, "Not an export")
+            return
+        key = match.group(1)
+        export_queue = self.server.export_queue
+        data = export_queue.store.read(key)
+        if data is not None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Content-Disposition", f'attachment; filename="career_plan_{key[:8]}.pdf"')
+            # Keys are content-addressed, so a stored PDF never changes
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+            self.end_headers()
+            self.wfile.write(data)
+        elif export_queue.is_pending(key):
+            self.send_response(202)
+            self.send_header("Retry-After", str(RETRY_AFTER_SECONDS))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self.send_error(404, "Unknown export")
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def start_export_server(export_queue=None, host=None, port=None):
+    """Serve an export queue's store for download on a background thread; returns the server"""
+    host = host or os.environ.get(EXPORT_HOST_ENV) or DEFAULT_EXPORT_HOST
+    port = int(port if port is not None else os.environ.get(EXPORT_PORT_ENV) or DEFAULT_EXPORT_PORT)
+    server = ThreadingHTTPServer((host, port), ExportRequestHandler)
+    server.daemon_threads = True
+    server.export_queue = export_queue or get_export_queue()
+    threading.Thread(target=server.serve_forever, name="career-export-server", daemon=True).start()
+    return server
+
+
+_shared_queue = None
+
+
+def get_export_queue():
+    """Return the process-wide export queue, creating it on first use"""
+    global _shared_queue
+    if _shared_queue is None:
+        _shared_queue = ExportQueue()
+    return _shared_queue
@@ -0,0 +1,141 @@
+"""
+Career Facets
+Secondary indexes over categorical career attributes and faceted filter queries
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+FACET_FIELDS = ("domain", "growth_potential", "experience_level", "work_life_balance", "future_outlook")
+
+# Distinct filter combinations whose row masks are kept around
+MASK_CACHE_SIZE = 256
+
+
+def canonical_filters(filters):
+    """
+    Hashable, order-independent form of a {facet: value or values} filter.
+    Values compare case-insensitively; a facet with no values does not constrain.
+    """
+    canonical = []
+    for field, wanted in sorted((filters or {}).items()):
+        if isinstance(wanted, str):
+            wanted = [wanted]
+        values = tuple(sorted({value.lower() for value in wanted or ()}))
+        if values:
+            canonical.append((field, values))
+    return tuple(canonical)
+
+
+class FacetIndex:
+    """
+    Per-facet secondary indexes: every career's value code, and the rows holding each value.
+    Values within one facet are OR-ed together; facets are AND-ed.
+    """
+
+    def __init__(self, index, fields=FACET_FIELDS):
+        self.index = index
+        self.num_careers = len(index)
+        self.codes = {}
+        self.values = {}
+        self.rows = {}
+        self._codes_by_value = {}
+
+        for field in fields:
+            codes, values = index.categories(field)
+            codes = np.asarray(codes, dtype=np.intp)
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(values) + 1))
+            self.codes[field] = codes
+            self.values[field] = values
+            self.rows[field] = [order[bounds[code]:bounds[code + 1]] for code in range(len(values))]
+
+            codes_by_value = {}
+            for code, value in enumerate(values):
+                codes_by_value.setdefault(value.lower(), []).append(code)
+            self._codes_by_value[field] = codes_by_value
+
+        self._masks = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _value_codes(self, field, values):
+        if field not in self.codes:
+            raise ValueError(f"Unknown facet '{field}', expected one of {', '.join(self.codes)}")
+        return [code for value in values for code in self._codes_by_value[field].get(value, ())]
+
+    def mask(self, filters):
+        """Boolean mask over career rows matching the filters, or None when nothing is filtered"""
+        key = canonical_filters(filters)
+        if not key:
+            return None
+        with self._lock:
+            if key in self._masks:
+                self._masks.move_to_end(key)
+                return self._masks[key]
+
+        mask = np.ones(self.num_careers, dtype=bool)
+        for field, values in key:
+            # Codes first: they reject an unknown facet name before anything is looked up by it
+            codes = self._value_codes(field, values)
+            selected = np.zeros(len(self.values[field]), dtype=bool)
+            selected[codes] = True
+            mask &= selected[self.codes[field]]
+        mask.setflags(write=False)
+
+        with self._lock:
+            self._masks[key] = mask
+            if len(self._masks) > MASK_CACHE_SIZE:
+                self._masks.popitem(last=False)
+        return mask
+
+    def matching_rows(self, filters):
+        """Rows of the careers matching the filters, in database order"""
+        # A single value of a single facet is already materialized
+        key = canonical_filters(filters)
+        if len(key) == 1 and len(key[0][1]) == 1:
+            field, (value,) = key[0]
+            codes = self._value_codes(field, [value])
+            if len(codes) == 1:
+                return self.rows[field][codes[0]]
+        mask = self.mask(filters)
+        return np.arange(self.num_careers) if mask is None else np.flatnonzero(mask)
+
+    def counts(self, rows):
+        """Per-facet value counts over the given rows, omitting values with no careers"""
+        counts = {}
+        for field, values in self.values.items():
+            totals = np.bincount(self.codes[field][rows], minlength=len(values))
+            counts[field] = {value: int(total) for value, total in zip(values, totals) if total}
+        return counts
+
+    def careers(self, filters):
+        """career_id -> career for every career matching the filters, in database order"""
+        career_ids = self.index.career_ids
+        career_db = self.index.career_db
+        return {career_ids[row]: career_db[career_ids[row]] for row in self.matching_rows(filters).tolist()}
+
+    def query(self, filters=None, mask=None):
+        """Careers matching the filters (and an optional row mask) plus the facet counts of that result"""
+        rows = self.matching_rows(filters)
+        if mask is not None:
+            rows = rows[mask[rows]]
+        career_ids = self.index.career_ids
+        career_db = self.index.career_db
+        return {
+            "careers": {career_ids[row]: career_db[career_ids[row]] for row in rows.tolist()},
+            "total": len(rows),
+            "facets": self.counts(rows)
+        }
+
+
+_shared_facets = None
+
+
+def get_facet_index(index):
+    """Return the facet index for a career index, building it only when the index changes"""
+    global _shared_facets
+    if _shared_facets is None or _shared_facets.index is not index:
+        _shared_facets = FacetIndex(index)
+    return _shared_facets
@@ -0,0 +1,177 @@
+"""
+Incremental Scoring
+Per-conversation partial sums that follow a profile as it grows turn by turn
+"""
+
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+SCORED_FIELDS = ("interests", "skills", "strengths")
+
+# Memory all conversations' sums may take together; the least recently used are dropped beyond it
+DEFAULT_MAX_BYTES = 64 << 20
+
+# Rough per-conversation cost beyond the sums arrays: the state, its term counters and its LRU slot
+STATE_OVERHEAD_BYTES = 2048
+
+
+def scored_terms(user_profile):
+    """Terms of each scored field in the form the scorers compare them"""
+    return {
+        "interests": Counter(interest.lower().strip() for interest in user_profile.get('interests', [])),
+        "skills": Counter(skill.lower() for skill in user_profile.get('skills', [])),
+        "strengths": Counter(strength.lower() for strength in user_profile.get('strengths', []))
+    }
+
+
+class ProfileState:
+    """
+    One conversation's interest points and skill/strength hits for just the careers its
+    terms touched: sorted rows, and a float32 (rows x scored fields) array of their sums.
+    Every point value is a small integer, so float32 sums stay exact and a removed term
+    returns a career to exactly zero, which drops it.
+    """
+
+    __slots__ = ("version", "terms", "rows", "sums")
+
+    def __init__(self, version):
+        self.version = version
+        self.terms = {field: Counter() for field in SCORED_FIELDS}
+        self.rows = np.empty(0, dtype=np.int32)
+        self.sums = np.empty((0, len(SCORED_FIELDS)), dtype=np.float32)
+
+    @property
+    def nbytes(self):
+        return self.rows.nbytes + self.sums.nbytes + STATE_OVERHEAD_BYTES
+
+    def add(self, rows, sums):
+        """Merge per-row changes into the sums; the cost follows the touched rows, not the catalogue"""
+        merged_rows, inverse = np.unique(np.concatenate((self.rows, rows)), return_inverse=True)
+        merged = np.zeros((len(merged_rows), len(SCORED_FIELDS)), dtype=np.float32)
+        np.add.at(merged, inverse, np.concatenate((self.sums, sums)))
+        touched = merged.any(axis=1)
+        self.rows = merged_rows[touched].astype(np.int32)
+        self.sums = merged[touched]
+
+
+class IncrementalScorer:
+    """
+    Keeps a ProfileState per conversation and applies only the terms that
+    changed since the last turn, touching just the careers they index to.
+    States are bounded by their total size in bytes, not by conversation count.
+    """
+
+    def __init__(self, matrix, concepts, normalizer, similar_terms=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.matrix = matrix
+        self.concepts = concepts
+        self.normalizer = normalizer
+        self.similar_terms = similar_terms
+        self.max_bytes = max_bytes
+        self.states = OrderedDict()
+        self.nbytes = 0
+        self.lock = threading.Lock()
+
+    def _state_for(self, conversation_id):
+        """Fetch a conversation's state, starting afresh when the catalogue changed"""
+        version = self.matrix.index.version
+        with self.lock:
+            state = self.states.get(conversation_id)
+            if state is None or state.version != version:
+                if state is not None:
+                    self.nbytes -= state.nbytes
+                state = ProfileState(version)
+                self.states[conversation_id] = state
+                self.nbytes += state.nbytes
+            self.states.move_to_end(conversation_id)
+            self._evict()
+        return state
+
+    def _evict(self):
+        # The current conversation is always kept, even when it alone is over budget
+        while self.nbytes > self.max_bytes and len(self.states) > 1:
+            _, evicted = self.states.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def _resized(self, conversation_id, state, previous_nbytes):
+        """Account for a state's new size, dropping the least recently used states over budget"""
+        with self.lock:
+            if self.states.get(conversation_id) is state:
+                self.nbytes += state.nbytes - previous_nbytes
+            self._evict()
+
+    def forget(self, conversation_id):
+        """Drop a conversation's state, e.g. when its slots are reset"""
+        with self.lock:
+            state = self.states.pop(conversation_id, None)
+            if state is not None:
+                self.nbytes -= state.nbytes
+
+    def _term_weights(self, field, term):
+        """(rows, points) pairs one profile term adds to its field's sums"""
+        if field == "interests":
+            return [self.matrix.interest_weights(norm_interest, self.concepts.related, self.similar_terms)
+                    for norm_interest in self.normalizer.normalize(term)]
+        return [self.matrix.containment_weights("key_" + field, term)]
+
+    def update(self, conversation_id, user_profile):
+        """Bring a conversation's sums in line with its profile, applying only the delta"""
+        state = self._state_for(conversation_id)
+        changed_rows = []
+        changed_sums = []
+        for position, (field, terms) in enumerate(scored_terms(user_profile).items()):
+            previous = state.terms[field]
+            for term in terms.keys() | previous.keys():
+                change = terms[term] - previous[term]
+                if change:
+                    # Add the term's points, or with a negative change remove them
+                    for rows, points in self._term_weights(field, term):
+                        sums = np.zeros((len(rows), len(SCORED_FIELDS)), dtype=np.float32)
+                        sums[:, position] = points * change
+                        changed_rows.append(rows)
+                        changed_sums.append(sums)
+            state.terms[field] = terms
+
+        if changed_rows:
+            previous_nbytes = state.nbytes
+            state.add(np.concatenate(changed_rows), np.concatenate(changed_sums))
+            self._resized(conversation_id, state, previous_nbytes)
+        return state
+
+    def score_profile(self, conversation_id, user_profile, allowed=None):
+        """
+        Scores for every career the conversation's profile touches, in database order.
+        allowed optionally masks the career rows to score.
+        """
+        state = self.update(conversation_id, user_profile)
+        rows, sums = state.rows, state.sums
+        if allowed is not None:
+            keep = allowed[rows]
+            rows, sums = rows[keep], sums[keep]
+        interest_sums, skill_sums, strength_sums = sums.T.astype(np.float64)
+        return self.matrix.finish(
+            user_profile,
+            sum(state.terms["skills"].values()),
+            sum(state.terms["strengths"].values()),
+            rows.astype(np.int64),
+            interest_sums,
+            skill_sums,
+            strength_sums
+        )
+
+
+_shared_scorers = {}
+
+
+def get_incremental_scorer(matrix, concepts, normalizer, similar_terms=None):
+    """
+    Return the process-wide incremental scorer for a concept graph,
+    rebuilt with the matrix, similarity or normalizer
+    """
+    scorer = _shared_scorers.get(id(concepts))
+    if (scorer is None or scorer.matrix is not matrix or scorer.similar_terms is not similar_terms
+            or scorer.normalizer is not normalizer):
+        scorer = IncrementalScorer(matrix, concepts, normalizer, similar_terms)
+        _shared_scorers[id(concepts)] = scorer
+    return scorer
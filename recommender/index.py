@@ -0,0 +1,106 @@
+"""
+Career Term Index
+Inverted indexes from career interests, skills and strengths to the careers that list them
+"""
+
+import hashlib
+import json
+from array import array
+from collections.abc import Mapping
+
+from .matching import SubstringMatcher
+
+INDEXED_FIELDS = ("key_interests", "key_skills", "key_strengths")
+
+
+def _plain(value):
+    """JSON fallback for compiled catalogues and records, which are mappings but not dicts"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def catalogue_fingerprint(career_db):
+    """Short content hash identifying a version of a career database"""
+    payload = json.dumps(career_db, sort_keys=True, default=_plain).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+class CareerIndex:
+    """Term-to-career inverted index shared by the recommendation scorers"""
+
+    def __init__(self, career_db, version=None):
+        self.career_db = career_db
+        self.version = version or catalogue_fingerprint(career_db)
+        self.career_ids = list(career_db)
+        self.positions = {career_id: i for i, career_id in enumerate(self.career_ids)}
+        self.postings = {field: {} for field in INDEXED_FIELDS}
+
+        for career_id, career_data in career_db.items():
+            for field in INDEXED_FIELDS:
+                for term in career_data[field]:
+                    self.postings[field].setdefault(term, set()).add(career_id)
+
+        # Partial matches are answered by one automaton walk instead of a vocabulary scan
+        self.matchers = {field: SubstringMatcher(self.postings[field]) for field in INDEXED_FIELDS}
+
+    def __len__(self):
+        return len(self.career_ids)
+
+    def csc(self, field):
+        """
+        A field's careers x terms incidence matrix in column-wise (CSC) form:
+        term -> column, column start offsets, and the career rows of each column.
+        """
+        postings = self.postings[field]
+        columns = {term: col for col, term in enumerate(postings)}
+        indptr = array("q", [0])
+        rows = array("i")
+        for career_ids in postings.values():
+            rows.extend(sorted(self.positions[career_id] for career_id in career_ids))
+            indptr.append(len(rows))
+        return columns, indptr, rows
+
+    def categories(self, field):
+        """A categorical field of every career as (per-row codes, distinct values)"""
+        values = {}
+        codes = array("i")
+        for career_id in self.career_ids:
+            value = self.career_db[career_id].get(field, "")
+            codes.append(values.setdefault(value, len(values)))
+        return codes, list(values)
+
+    def work_environments(self):
+        """Work environment of every career as (per-row codes, distinct values)"""
+        return self.categories("work_environment")
+
+    def exact(self, field, term):
+        """Careers listing exactly this term in the given field"""
+        return self.postings[field].get(term, set())
+
+    def terms_containing(self, field, term):
+        """Indexed terms of the given field that contain this term"""
+        return self.matchers[field].containing(term)
+
+    def containing(self, field, term):
+        """Careers with a term in the given field that contains this term"""
+        matches = set()
+        for career_term in self.terms_containing(field, term):
+            matches |= self.postings[field][career_term]
+        return matches
+
+
+_shared_index = None
+
+
+def get_career_index(career_db):
+    """Return the index for a career database, building it only when the database changes"""
+    global _shared_index
+    # Stores carry their own index over the mapped postings
+    compiled_index = getattr(career_db, "compiled_index", None)
+    if compiled_index is not None:
+        return compiled_index()
+    if (_shared_index is None or _shared_index.career_db is not career_db
+            or len(_shared_index) != len(career_db)):
+        _shared_index = CareerIndex(career_db)
+    return _shared_index
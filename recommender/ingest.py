@@ -0,0 +1,264 @@
+"""
+Career Ingestion
+Streams external occupation datasets (CSV or JSONL) into a compiled career store
+
+Usage:
+    python -m recommender.ingest occupations.csv careers.store
+    python -m recommender.ingest occupations.jsonl careers.store --strict
+    python -m recommender.ingest onet.csv careers.store --column name=Title --column description=Description
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+from .normalizer import split_words
+from .records import CAREER_FIELDS, TERM_FIELDS
+from .store import StoreWriter
+
+# Fields a record must fill in; the rest default to empty values
+REQUIRED_FIELDS = ("name", "domain", "key_interests", "key_skills")
+
+# Input columns holding the career id; without one the id is derived from the name
+ID_COLUMNS = ("career_id", "id")
+
+# Separator between terms when a term field is a single text value, as in CSV
+DEFAULT_TERM_SEPARATOR = ";"
+
+STAGES = ("read", "validate", "normalize", "write", "finish")
+
+# Invalid records echoed in the report; the rest are only counted
+REPORTED_ERRORS = 10
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+_NON_ID = re.compile(r"[^a-z0-9]+")
+
+
+class InvalidRecord(ValueError):
+    """Raised for an input record that cannot become a career"""
+
+
+def read_csv(handle):
+    """Yield (line number, row dict or None, error) for each CSV row"""
+    reader = csv.DictReader(handle)
+    for row in reader:
+        if None in row:
+            yield reader.line_num, None, "more values than header columns"
+        else:
+            yield reader.line_num, row, None
+
+
+def read_jsonl(handle):
+    """Yield (line number, object or None, error) for each non-blank JSON line"""
+    for line_number, line in enumerate(handle, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            yield line_number, None, f"invalid JSON: {error}"
+            continue
+        if isinstance(record, dict):
+            yield line_number, record, None
+        else:
+            yield line_number, None, "a JSON line must hold an object"
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl}
+
+
+def validate_record(raw, columns=None, separator=DEFAULT_TERM_SEPARATOR):
+    """
+    Map one input record onto the CAREER_DATABASE schema.
+    columns renames fields to input columns ({field: column}); term fields may be
+    lists or separated text. Returns (career_id, career_data) or raises InvalidRecord.
+    """
+    columns = columns or {}
+    career_data = {}
+    for field in CAREER_FIELDS:
+        value = raw.get(columns.get(field, field))
+        if value is None:
+            value = [] if field in TERM_FIELDS else ""
+        if field in TERM_FIELDS:
+            if isinstance(value, str):
+                value = value.split(separator)
+            if not isinstance(value, list) or not all(isinstance(term, str) for term in value):
+                raise InvalidRecord(f"'{field}' must be a list of strings or separated text")
+            value = [term.strip() for term in value if term.strip()]
+        elif isinstance(value, str):
+            value = value.strip()
+        else:
+            raise InvalidRecord(f"'{field}' must be text")
+        career_data[field] = value
+
+    missing = [field for field in REQUIRED_FIELDS if not career_data[field]]
+    if missing:
+        raise InvalidRecord(f"missing {', '.join(missing)}")
+
+    career_id = next((raw[column] for column in ID_COLUMNS if raw.get(column)), None)
+    if career_id is None:
+        career_id = _NON_ID.sub("_", career_data["name"].lower()).strip("_")
+    if not isinstance(career_id, str) or not career_id.strip():
+        raise InvalidRecord("career id must be non-empty text")
+    return career_id.strip(), career_data
+
+
+def canonical_term(term):
+    """A term in the catalogue's form: lowercase words joined with underscores ("Machine Learning" -> machine_learning)"""
+    return "_".join(split_words(term))
+
+
+def normalize_terms(terms):
+    """
+    Put terms in canonical form, dropping repeats. Abbreviations are not expanded and
+    plurals are kept as written, like the built-in catalogue's "statistics": user interests
+    are expanded at query time, and skills and strengths are matched there as typed.
+    """
+    normalized = {}
+    for term in terms:
+        term = canonical_term(term)
+        if term:
+            normalized.setdefault(term)
+    return list(normalized)
+
+
+def normalize_record(career_data):
+    """Normalize every term field of a validated record in place"""
+    for field in TERM_FIELDS:
+        career_data[field] = normalize_terms(career_data[field])
+    return career_data
+
+
+class IngestReport:
+    """Per-stage timings and invalid-record counts of one ingestion run"""
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.records = 0
+        self.written = 0
+        self.invalid = Counter()
+        self.errors = []
+
+    def reject(self, line_number, reason):
+        self.invalid[reason.split(":")[0]] += 1
+        if len(self.errors) < REPORTED_ERRORS:
+            self.errors.append(f"line {line_number}: {reason}")
+
+    def lines(self):
+        """Human-readable summary, one line per stage"""
+        lines = [f"{self.records} records read, {self.written} careers written, "
+                 f"{sum(self.invalid.values())} invalid"]
+        for stage in STAGES:
+            seconds = self.seconds[stage]
+            count = 1 if stage == "finish" else self.records if stage == "read" else self.written
+            rate = f"{count / seconds:,.0f} records/s" if seconds and stage != "finish" else ""
+            lines.append(f"  {stage:<10} {seconds * 1000:9.1f} ms  {rate}")
+        for reason, count in self.invalid.most_common():
+            lines.append(f"  invalid: {reason} ({count})")
+        lines.extend(f"    {error}" for error in self.errors)
+        return lines
+
+
+def ingest(rows, writer, columns=None, separator=DEFAULT_TERM_SEPARATOR, strict=False):
+    """
+    Stream reader rows through validate, normalize and write, one record at a time.
+    Invalid records are counted and skipped, or raise InvalidRecord when strict.
+    Returns an IngestReport; the caller finishes the writer.
+    """
+    report = IngestReport()
+    seconds = report.seconds
+    clock = time.perf_counter
+
+    started = clock()
+    for line_number, raw, error in rows:
+        read = clock()
+        seconds["read"] += read - started
+        report.records += 1
+        try:
+            if error is not None:
+                raise InvalidRecord(error)
+            career_id, career_data = validate_record(raw, columns, separator)
+            validated = clock()
+            seconds["validate"] += validated - read
+            normalize_record(career_data)
+            normalized = clock()
+            seconds["normalize"] += normalized - validated
+            writer.add(career_id, career_data)
+            seconds["write"] += clock() - normalized
+            report.written += 1
+        except ValueError as error:
+            if strict:
+                raise InvalidRecord(f"line {line_number}: {error}") from error
+            report.reject(line_number, str(error))
+        started = clock()
+    seconds["read"] += clock() - started
+    return report
+
+
+def _parse_columns(mappings):
+    columns = {}
+    for mapping in mappings:
+        field, separator, column = mapping.partition("=")
+        if not separator or field not in CAREER_FIELDS:
+            raise argparse.ArgumentTypeError(f"--column expects FIELD=COLUMN with a career field, got '{mapping}'")
+        columns[field] = column
+    return columns
+
+
+def main():
+    """Ingest a CSV or JSONL occupation dataset into a store file"""
+    parser = argparse.ArgumentParser(description="Stream a CSV or JSONL occupation dataset into a career store")
+    parser.add_argument("input", help="CSV or JSONL file to ingest")
+    parser.add_argument("output", help="path of the store file to write")
+    parser.add_argument("--format", choices=sorted(READERS), help="input format (default: from the file extension)")
+    parser.add_argument("--column", action="append", default=[], metavar="FIELD=COLUMN",
+                        help="read a career field from a differently named input column")
+    parser.add_argument("--separator", default=DEFAULT_TERM_SEPARATOR,
+                        help=f"separator between terms in text columns (default: '{DEFAULT_TERM_SEPARATOR}')")
+    parser.add_argument("--version", help="store version (default: a hash of the ingested careers)")
+    parser.add_argument("--strict", action="store_true", help="stop at the first invalid record")
+    args = parser.parse_args()
+
+    input_format = args.format or FORMATS.get(os.path.splitext(args.input)[1].lower())
+    if input_format is None:
+        parser.error(f"cannot tell the format of {args.input}, pass --format")
+    try:
+        columns = _parse_columns(args.column)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+
+    print(f"[WORKING] Ingesting {args.input} ({input_format})")
+    writer = StoreWriter(args.output, args.version)
+    try:
+        with open(args.input, encoding="utf-8", newline="") as handle:
+            report = ingest(READERS[input_format](handle), writer, columns, args.separator, args.strict)
+        if not report.written:
+            print(f"[ERROR] No valid careers in {args.input}, store not written")
+            success = False
+        else:
+            started = time.perf_counter()
+            writer.finish()
+            report.seconds["finish"] = time.perf_counter() - started
+            success = True
+    except (OSError, InvalidRecord) as error:
+        print(f"[ERROR] {error}")
+        return False
+    finally:
+        writer.close()
+
+    for line in report.lines():
+        print(line)
+    if success:
+        print(f"[OK] Wrote store {writer.version} ({report.written} careers) to {args.output}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
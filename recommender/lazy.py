@@ -0,0 +1,33 @@
+"""
+Lazy Imports
+Module objects that are only executed when a code path first uses them
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name, package=None):
+    """
+    Import a module lazily, with the same arguments as importlib.import_module.
+    The module is found now but only executed on its first attribute access,
+    so importing a caller does not pay for NumPy, SQLite or process pools it may never use.
+    """
+    absolute_name = importlib.util.resolve_name(name, package)
+    module = sys.modules.get(absolute_name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(absolute_name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{absolute_name}'", name=absolute_name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[absolute_name] = module
+    loader.exec_module(module)
+    # Bind it on its package as a regular import would, for code that reaches it as package.module
+    parent_name, _, child_name = absolute_name.rpartition(".")
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+    return module
@@ -0,0 +1,100 @@
+"""
+Substring Matcher
+Compiled automaton answering which vocabulary terms contain a given term
+"""
+
+
+class SubstringMatcher:
+    """
+    Generalized suffix automaton over a vocabulary of terms.
+    Every substring of every term is a path from the root, and each state
+    records which terms contain the substrings ending there, so a lookup is
+    a single walk over the query's characters.
+    """
+
+    def __init__(self, terms):
+        self.terms = list(terms)
+        self.transitions = [{}]
+        self.links = [-1]
+        self.lengths = [0]
+
+        for term in self.terms:
+            state = 0
+            for char in term:
+                state = self._extend(state, char)
+
+        self.matches = self._collect_matches()
+
+    def _new_state(self, length, transitions, link):
+        self.transitions.append(transitions)
+        self.lengths.append(length)
+        self.links.append(link)
+        return len(self.lengths) - 1
+
+    def _clone(self, state, length):
+        """Split a state so that it only covers substrings up to the given length"""
+        return self._new_state(length, dict(self.transitions[state]), self.links[state])
+
+    def _extend(self, last, char):
+        """Append a character to the term ending at state last, returning the new end state"""
+        if char in self.transitions[last]:
+            # Another term already spelled this prefix
+            target = self.transitions[last][char]
+            if self.lengths[last] + 1 == self.lengths[target]:
+                return target
+            clone = self._clone(target, self.lengths[last] + 1)
+            self.links[target] = clone
+            state = last
+            while state != -1 and self.transitions[state].get(char) == target:
+                self.transitions[state][char] = clone
+                state = self.links[state]
+            return clone
+
+        current = self._new_state(self.lengths[last] + 1, {}, 0)
+        state = last
+        while state != -1 and char not in self.transitions[state]:
+            self.transitions[state][char] = current
+            state = self.links[state]
+
+        if state != -1:
+            target = self.transitions[state][char]
+            if self.lengths[state] + 1 == self.lengths[target]:
+                self.links[current] = target
+            else:
+                clone = self._clone(target, self.lengths[state] + 1)
+                while state != -1 and self.transitions[state].get(char) == target:
+                    self.transitions[state][char] = clone
+                    state = self.links[state]
+                self.links[target] = clone
+                self.links[current] = clone
+        return current
+
+    def _collect_matches(self):
+        """Map every state to the ids of the terms containing its substrings"""
+        matches = [[] for _ in self.lengths]
+        marked_by = [-1] * len(self.lengths)
+
+        for term_id, term in enumerate(self.terms):
+            # Substrings of a term are suffixes of its prefixes: walk each
+            # prefix state up its suffix links until already marked
+            prefix_state = 0
+            states = [0]
+            for char in term:
+                prefix_state = self.transitions[prefix_state][char]
+                states.append(prefix_state)
+            for state in states:
+                while state != -1 and marked_by[state] != term_id:
+                    marked_by[state] = term_id
+                    matches[state].append(term_id)
+                    state = self.links[state]
+
+        return [tuple(term_ids) for term_ids in matches]
+
+    def containing(self, text):
+        """Vocabulary terms that contain text, in vocabulary order"""
+        state = 0
+        for char in text:
+            state = self.transitions[state].get(char)
+            if state is None:
+                return []
+        return [self.terms[term_id] for term_id in self.matches[state]]
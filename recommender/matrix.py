@@ -0,0 +1,268 @@
+"""
+Career Scoring Matrix
+Careers x vocabulary incidence matrices for scoring every career in one vectorized pass
+"""
+
+import heapq
+
+import numpy as np
+
+from .index import INDEXED_FIELDS
+
+# Interest match tiers, mirroring CareerRecommender._calculate_interest_score
+EXACT_MATCH_POINTS = 100
+PARTIAL_MATCH_POINTS = 60
+RELATED_MATCH_POINTS = 30
+
+# Points of a similar (not related) concept at cosine similarity 1; scaled by the similarity and
+# rounded, so a similar concept never outranks a partial match and sums stay exact integers
+SIMILAR_MATCH_POINTS = PARTIAL_MATCH_POINTS
+
+
+def similar_points(similarity):
+    """Interest points a similar concept earns at a given cosine similarity"""
+    return round(SIMILAR_MATCH_POINTS * similarity)
+
+# Upper bound on profiles x careers cells accumulated at once when scoring a batch
+PRODUCT_CELLS = 1 << 22
+
+
+class ProfileScores:
+    """Per-category scores for the careers a profile touches, as parallel arrays"""
+
+    def __init__(self, rows, interest_average, skills, strengths, preferences, total):
+        self.rows = rows
+        self.interest_average = interest_average
+        self.skills = skills
+        self.strengths = strengths
+        self.preferences = preferences
+        self.total = total
+
+    def above(self, threshold):
+        """Positions of the careers scoring strictly above the threshold"""
+        return np.flatnonzero(self.total > threshold)
+
+    def top(self, n, threshold):
+        """Positions of the n best careers above the threshold, best first, ties in database order"""
+        positions = self.above(threshold)
+        if len(positions) > n > 0:
+            # Anything below the n-th best score can never make the cut
+            cutoff = np.partition(self.total[positions], -n)[-n]
+            positions = positions[self.total[positions] >= cutoff]
+        # nlargest keeps input order among equal scores, like a stable descending sort
+        return heapq.nlargest(n, positions.tolist(), key=self.total.__getitem__)
+
+
+class ScoringMatrix:
+    """
+    Sparse careers x vocabulary matrices stored column-wise (CSC).
+    Each column holds the rows of the careers that list that term.
+    """
+
+    def __init__(self, index, preference_keywords):
+        self.index = index
+        self.num_careers = len(index)
+        self.columns = {}
+        self.indptr = {}
+        self.indices = {}
+
+        for field in INDEXED_FIELDS:
+            columns, indptr, rows = index.csc(field)
+            self.columns[field] = columns
+            self.indptr[field] = np.asarray(indptr)
+            self.indices[field] = np.asarray(rows)
+
+        # Careers x preference categories: does the work environment support it.
+        # Work environments repeat heavily, so each distinct value is checked once.
+        self.preference_keywords = preference_keywords
+        self.preference_categories = list(preference_keywords)
+        codes, values = index.work_environments()
+        support_by_value = np.array(
+            [[category in work_env or any(keyword in work_env for keyword in keywords)
+              for category, keywords in preference_keywords.items()]
+             for work_env in (value.lower() for value in values)],
+            dtype=bool).reshape(len(values), len(self.preference_categories))
+        self.preference_support = support_by_value[np.asarray(codes, dtype=np.intp)]
+
+    def rows_for(self, field, terms):
+        """Rows of every career listing any of the given terms (may repeat)"""
+        columns = self.columns[field]
+        indptr = self.indptr[field]
+        indices = self.indices[field]
+        slices = [indices[indptr[columns[term]]:indptr[columns[term] + 1]]
+                  for term in terms if term in columns]
+        if not slices:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate(slices)
+
+    def interest_weights(self, interest, related_terms, similar_terms=None):
+        """
+        Sparse per-career points one normalized interest earns, as (rows, points)
+        similar_terms optionally maps the interest to (term, similarity) pairs of similar concepts
+        """
+        similar_rows = np.empty(0, dtype=np.int32)
+        similar_scores = np.empty(0, dtype=np.float64)
+        if similar_terms is not None:
+            similar = [(self.rows_for("key_interests", [term]), similar_points(similarity))
+                       for term, similarity in similar_terms(interest)]
+            if similar:
+                similar_rows = np.concatenate([rows for rows, _ in similar])
+                similar_scores = np.repeat([float(points) for _, points in similar],
+                                           [len(rows) for rows, _ in similar])
+        related_rows = self.rows_for("key_interests", related_terms(interest))
+        partial_rows = self.rows_for(
+            "key_interests", self.index.terms_containing("key_interests", interest))
+        exact_rows = self.rows_for("key_interests", [interest])
+
+        rows = np.concatenate((similar_rows, related_rows, partial_rows, exact_rows))
+        points = np.concatenate((
+            similar_scores,
+            np.full(len(related_rows), RELATED_MATCH_POINTS, dtype=np.float64),
+            np.full(len(partial_rows), PARTIAL_MATCH_POINTS, dtype=np.float64),
+            np.full(len(exact_rows), EXACT_MATCH_POINTS, dtype=np.float64)
+        ))
+
+        # Each career keeps only its best tier for this interest
+        unique_rows, inverse = np.unique(rows, return_inverse=True)
+        best = np.zeros(len(unique_rows))
+        np.maximum.at(best, inverse, points)
+        return unique_rows, best
+
+    def containment_weights(self, field, term):
+        """Rows of careers with a field term containing this term, each worth one hit"""
+        rows = np.unique(self.rows_for(field, self.index.terms_containing(field, term)))
+        return rows, np.ones(len(rows))
+
+    def _product(self, profile_weights):
+        """
+        Multiply a sparse profiles x terms matrix by the terms x careers weights.
+        profile_weights holds, per profile, the (rows, points) of each of its terms.
+        """
+        profile_ids = []
+        rows = []
+        points = []
+        for profile_id, term_weights in enumerate(profile_weights):
+            for term_rows, term_points in term_weights:
+                profile_ids.append(np.full(len(term_rows), profile_id, dtype=np.int64))
+                rows.append(term_rows)
+                points.append(term_points)
+
+        size = len(profile_weights) * self.num_careers
+        if not rows:
+            return np.zeros(size).reshape(len(profile_weights), self.num_careers)
+        flat = np.concatenate(profile_ids) * self.num_careers + np.concatenate(rows)
+        totals = np.bincount(flat, weights=np.concatenate(points), minlength=size)
+        return totals.reshape(len(profile_weights), self.num_careers)
+
+    def _preference_hits(self, rows, preferences):
+        """Count, per candidate row, how many preferences its work environment supports"""
+        hits = np.zeros(len(rows))
+        support = self.preference_support[rows]
+        for preference in preferences:
+            pref_lower = preference.lower()
+            triggered = [col for col, keywords in enumerate(self.preference_keywords.values())
+                         if any(keyword in pref_lower for keyword in keywords)]
+            if triggered:
+                hits += support[:, triggered].any(axis=1)
+        return hits
+
+    def score_profiles(self, user_profiles, normalized_interests, related_terms, allowed=None, similar_terms=None):
+        """
+        Score many profiles with one sparse matrix product per chunk of profiles.
+        normalized_interests holds the expanded interests of each profile.
+        allowed optionally masks the career rows to score; the rest are dropped up front.
+        similar_terms optionally adds the similar-concept tier, see interest_weights.
+        Yields one ProfileScores per profile, in input order.
+        """
+        # Terms repeat heavily across a cohort, so resolve each one only once
+        interest_cache = {}
+        skill_cache = {}
+        strength_cache = {}
+
+        def restrict(weights):
+            if allowed is None:
+                return weights
+            rows, points = weights
+            keep = allowed[rows]
+            return rows[keep], points[keep]
+
+        def interest_weights(term):
+            if term not in interest_cache:
+                interest_cache[term] = restrict(self.interest_weights(term, related_terms, similar_terms))
+            return interest_cache[term]
+
+        def containment_weights(cache, field, term):
+            if term not in cache:
+                cache[term] = restrict(self.containment_weights(field, term))
+            return cache[term]
+
+        chunk_size = max(1, PRODUCT_CELLS // max(self.num_careers, 1))
+        for start in range(0, len(user_profiles), chunk_size):
+            chunk = user_profiles[start:start + chunk_size]
+            chunk_interests = normalized_interests[start:start + chunk_size]
+            skills = [[skill.lower() for skill in profile.get('skills', [])] for profile in chunk]
+            strengths = [[strength.lower() for strength in profile.get('strengths', [])]
+                         for profile in chunk]
+
+            interest_totals = self._product(
+                [[interest_weights(term) for term in terms] for terms in chunk_interests])
+            skill_hits = self._product(
+                [[containment_weights(skill_cache, "key_skills", term) for term in terms]
+                 for terms in skills])
+            strength_hits = self._product(
+                [[containment_weights(strength_cache, "key_strengths", term) for term in terms]
+                 for terms in strengths])
+
+            for i, user_profile in enumerate(chunk):
+                # Careers matching nothing here score at most 10 points from preferences
+                rows = np.flatnonzero(
+                    (interest_totals[i] > 0) | (skill_hits[i] > 0) | (strength_hits[i] > 0))
+                yield self.finish(user_profile, len(skills[i]), len(strengths[i]), rows,
+                                  interest_totals[i][rows], skill_hits[i][rows], strength_hits[i][rows])
+
+    def score_profile(self, user_profile, normalized_interests, related_terms, allowed=None, similar_terms=None):
+        """Score every (allowed) career sharing a term with the profile, in database order"""
+        return next(self.score_profiles([user_profile], [normalized_interests], related_terms, allowed,
+                                        similar_terms))
+
+    def finish(self, user_profile, num_skills, num_strengths, rows,
+               interest_totals, skill_hits, strength_hits):
+        """
+        Turn one profile's accumulated hits into weighted category and match scores.
+        rows lists the candidate careers; the hit arrays are aligned with it.
+        """
+        num_interests = len(user_profile.get('interests', []))
+        preferences = user_profile.get('preferences', [])
+
+        interest_average = np.zeros(len(rows))
+        if num_interests:
+            interest_average = interest_totals / num_interests
+        skills_score = np.zeros(len(rows))
+        if num_skills:
+            skills_score = (skill_hits / num_skills) * 100
+        strengths_score = np.zeros(len(rows))
+        if num_strengths:
+            strengths_score = (strength_hits / num_strengths) * 100
+        preferences_score = np.zeros(len(rows))
+        if preferences:
+            preferences_score = (self._preference_hits(rows, preferences) / len(preferences)) * 100
+
+        # Same weights and summation order as calculate_match_score, so rounding agrees
+        total = np.minimum(interest_average, 100) * 0.4
+        total = total + skills_score * 0.3
+        total = total + strengths_score * 0.2
+        total = total + preferences_score * 0.1
+        total = np.minimum(np.rint(total), 100)
+
+        return ProfileScores(rows, interest_average, skills_score, strengths_score, preferences_score, total)
+
+
+_shared_matrix = None
+
+
+def get_scoring_matrix(index, preference_keywords):
+    """Return the scoring matrix for an index, building it only when the index changes"""
+    global _shared_matrix
+    if _shared_matrix is None or _shared_matrix.index is not index:
+        _shared_matrix = ScoringMatrix(index, preference_keywords)
+    return _shared_matrix
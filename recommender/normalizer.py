@@ -0,0 +1,107 @@
+"""
+Term Normalizer
+Compiled, memoized normalization of user terms over the abbreviation map
+"""
+
+import re
+from functools import lru_cache
+
+# Distinct raw terms whose normalized form is remembered
+NORMALIZED_TERMS = 4096
+
+# Words of a term may be separated by spaces, underscores, hyphens or slashes
+_SEPARATORS = re.compile(r"[\s_\-/]+")
+
+# Trie node key holding the expansion of the phrase ending there
+_END = ""
+
+
+def split_words(term):
+    """Lowercase words of a term, whatever separates them"""
+    return [word for word in _SEPARATORS.split(term.lower()) if word]
+
+
+def singular(word):
+    """Light plural stemming: "technologies" -> "technology", "classes" -> "class", "computers" -> "computer" """
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("sses", "ches", "shes", "xes")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+class TermNormalizer:
+    """
+    Abbreviation keys compiled into a word trie, so a key matches however its words are
+    separated ("machine learning", "machine-learning", "machine_learning") and in plural.
+    A term that is not a key becomes its words joined with underscores, the catalogue's form.
+    Results are memoized in a bounded LRU, as the same few user terms recur on every request.
+    """
+
+    def __init__(self, abbreviations, vocabulary=(), cache_size=NORMALIZED_TERMS):
+        self.trie = {}
+        for key, expansions in abbreviations.items():
+            node = self.trie
+            for word in split_words(key):
+                node = node.setdefault(word, {})
+            node[_END] = tuple(expansions)
+        self.vocabulary = frozenset(vocabulary)
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    def _match(self, words, start, stem):
+        """Longest key starting at words[start], as (end, expansions), or None"""
+        node = self.trie
+        match = None
+        for end in range(start, len(words)):
+            word = words[end]
+            node = node.get(word) or (stem and node.get(singular(word)))
+            if not node:
+                break
+            if _END in node:
+                match = end + 1, node[_END]
+        return match
+
+    def _lookup(self, words, stem):
+        match = self._match(words, 0, stem)
+        if match and match[0] == len(words):
+            return match[1]
+        return None
+
+    def _segment(self, words):
+        """Expansions of a term made up entirely of keys, e.g. "ai/ml", or None"""
+        expansions = {}
+        start = 0
+        while start < len(words):
+            match = self._match(words, start, True)
+            if match is None:
+                return None
+            start, terms = match
+            expansions.update(dict.fromkeys(terms))
+        return tuple(expansions)
+
+    def _normalize(self, term):
+        words = split_words(term)
+        if not words:
+            return (term.lower().strip(),)
+
+        expansions = self._lookup(words, False)
+        if expansions is not None:
+            return expansions
+        joined = "_".join(words)
+        if joined in self.vocabulary:
+            return (joined,)
+
+        expansions = self._lookup(words, True)
+        if expansions is not None:
+            return expansions
+        stemmed = "_".join(words[:-1] + [singular(words[-1])])
+        if stemmed in self.vocabulary:
+            return (stemmed,)
+
+        if len(words) > 1:
+            expansions = self._segment(words)
+            if expansions is not None:
+                return expansions
+        return (joined,)
@@ -0,0 +1,39 @@
+"""
+Conversation Rankings
+Compact ranked results kept per conversation, so follow-up turns reuse them without rescoring
+"""
+
+from .cache import PROFILE_FIELDS, profile_hash
+
+RANKING_FORMAT = 1
+
+
+def compact_ranking(recommendations, user_profile, version):
+    """
+    JSON-ready summary of a ranking: each career's id, category scores and matched
+    terms, plus the profile hash and catalogue version it was scored against
+    """
+    return {
+        "format": RANKING_FORMAT,
+        "profile_hash": profile_hash(user_profile),
+        "version": version,
+        "careers": [{
+            "id": recommendation["career_id"],
+            "scores": [recommendation["category_scores"][field] for field in PROFILE_FIELDS],
+            "matched": recommendation["matched_terms"]
+        } for recommendation in recommendations]
+    }
+
+
+def ranking_matches(ranking, user_profile, version):
+    """Whether a stored ranking is still valid for this profile and catalogue version"""
+    return (bool(ranking)
+            and ranking.get("format") == RANKING_FORMAT
+            and ranking.get("version") == version
+            and ranking.get("profile_hash") == profile_hash(user_profile))
+
+
+def expand_ranking(ranking, recommender):
+    """Full recommendation dicts rebuilt from a compact ranking, in rank order"""
+    return [recommender.recommendation_for(career["id"], career["scores"], career["matched"])
+            for career in ranking["careers"] if career["id"] in recommender.career_db]
@@ -4,41 +4,121 @@ Implements intelligent matching algorithms for career recommendations
 """
 
 import math
-from .career_database import CAREER_DATABASE, normalize_interest, search_careers_by_keywords
+import os
+import threading
+from .career_database import (CAREER_CATALOGUE, ABBREVIATION_MAP, CAREER_PROGRESSION_MAP, CERTIFICATION_MAP,
+                              DEFAULT_CAREER_PROGRESSION, DEFAULT_CERTIFICATIONS, get_interest_normalizer,
+                              search_careers_by_keywords)
+from .cache import PROFILE_FIELDS, canonical_profile, get_recommendation_cache, profile_key
+from .concepts import RELATED_CONCEPT_DEPTH, SIMILARITY_THRESHOLD, get_concept_graph
+from .index import get_career_index
+from .lazy import lazy_import
+
+# NumPy-backed scoring modules, the optional catalogue backends and process pools load on first use
+_futures = lazy_import("concurrent.futures")
+_facets = lazy_import(".facets", __package__)
+_incremental = lazy_import(".incremental", __package__)
+_matrix = lazy_import(".matrix", __package__)
+_salary = lazy_import(".salary", __package__)
+_similarity = lazy_import(".similarity", __package__)
+_snapshot = lazy_import(".snapshot", __package__)
+_store = lazy_import(".store", __package__)
+
+# Simple semantic relationships, merged with ABBREVIATION_MAP into a bidirectional concept graph
+RELATED_TERMS = {
+    "tech": ["technology", "computer", "software", "programming", "it"],
+    "technology": ["tech", "computer", "software", "programming", "it", "coding"],
+    "computer": ["technology", "programming", "software", "tech", "it"],
+    "programming": ["coding", "software", "development", "tech", "technology"],
+    "coding": ["programming", "software", "development", "tech", "technology"],
+    "software": ["programming", "development", "tech", "technology", "computer"],
+    "it": ["information_technology", "tech", "technology", "computer", "software"],
+    "data": ["analytics", "statistics", "information", "database"],
+    "creative": ["art", "design", "innovation", "creativity"],
+    "business": ["management", "finance", "strategy", "entrepreneurship"],
+    "science": ["research", "analysis", "discovery", "laboratory"],
+    "people": ["social", "communication", "helping", "human"],
+    "numbers": ["mathematics", "analytics", "finance", "statistics"],
+    "logic": ["analytical", "problem_solving", "reasoning", "algorithm"]
+}
+
+# Simple preference matching - can be expanded
+PREFERENCE_KEYWORDS = {
+    "remote": ["remote", "flexible", "work_from_home"],
+    "travel": ["travel", "business_trip"],
+    "creative": ["creativity", "innovation"],
+    "leadership": ["leadership", "management"],
+    "teamwork": ["team", "collaboration"],
+    "independent": ["independent", "autonomous"]
+}
 
 class CareerRecommender:
-    def __init__(self):
-        self.career_db = CAREER_DATABASE
+    def __init__(self, concept_depth=RELATED_CONCEPT_DEPTH, cache=None, use_cache=True, career_db=None,
+                 certifications=None, progressions=None, similarity_threshold=SIMILARITY_THRESHOLD, version=None):
+        self.career_db = CAREER_CATALOGUE if career_db is None else career_db
+        self.certifications = CERTIFICATION_MAP if certifications is None else certifications
+        self.progressions = CAREER_PROGRESSION_MAP if progressions is None else progressions
+        self.concepts = get_concept_graph(RELATED_TERMS, ABBREVIATION_MAP, concept_depth)
+        self.index = get_career_index(self.career_db)
+        # Interests resolve plurals against this catalogue's vocabulary, not the built-in one
+        self.normalizer = get_interest_normalizer(self.index)
+        # Identifies everything the recommender serves, learning-plan data included
+        self.version = version or self.index.version
+        self.matrix = _matrix.get_scoring_matrix(self.index, PREFERENCE_KEYWORDS)
+        self.facets = _facets.get_facet_index(self.index)
+        self.salaries = _salary.get_salary_index(self.index)
+        # Interests also earn points from similar vocabulary terms; a threshold of None turns this off
+        self.similarity_threshold = similarity_threshold
+        self.similar_terms = None
+        if similarity_threshold is not None:
+            self.similar_terms = _similarity.get_concept_similarity(self.index).similar_terms(similarity_threshold)
+        self.incremental = _incremental.get_incremental_scorer(self.matrix, self.concepts, self.normalizer,
+                                                               self.similar_terms)
+        self.cache = (cache or get_recommendation_cache()) if use_cache else None
+
+    def warm_up(self):
+        """Exercise the scoring path once so the first real request pays no one-off costs"""
+        self._score_and_rank({'interests': ['tech'], 'skills': ['python'], 'strengths': ['creativity'],
+                              'preferences': ['remote']}, top_n=1)
+        return self
+
+    def normalize_interest(self, interest):
+        """Expand abbreviations and normalize separators and plurals of one interest, over this catalogue"""
+        return list(self.normalizer.normalize(interest))
 
     def calculate_match_score(self, user_profile, career_data):
         """
         Calculate how well a career matches a user's profile
         Returns score between 0-100 and explanation
         """
+        interest_score = self._calculate_interest_score(user_profile.get('interests', []), career_data)
+        skills_score = self._calculate_skills_score(user_profile.get('skills', []), career_data)
+        strengths_score = self._calculate_strengths_score(user_profile.get('strengths', []), career_data)
+        preferences_score = self._calculate_preferences_score(user_profile.get('preferences', []), career_data)
+
+        return self._combine_scores(interest_score, skills_score, strengths_score, preferences_score)
+
+    def _combine_scores(self, interest_score, skills_score, strengths_score, preferences_score):
+        """Weight the category scores into a 0-100 match score with explanations"""
         score = 0
-        max_score = 100
         explanations = []
 
         # Interest matching (40% weight)
-        interest_score = self._calculate_interest_score(user_profile.get('interests', []), career_data)
         score += interest_score * 0.4
         if interest_score > 0:
             explanations.append(f"Interest alignment: {interest_score}%")
 
         # Skills matching (30% weight)
-        skills_score = self._calculate_skills_score(user_profile.get('skills', []), career_data)
         score += skills_score * 0.3
         if skills_score > 0:
             explanations.append(f"Skills match: {skills_score}%")
 
         # Strengths matching (20% weight)
-        strengths_score = self._calculate_strengths_score(user_profile.get('strengths', []), career_data)
         score += strengths_score * 0.2
         if strengths_score > 0:
             explanations.append(f"Strengths alignment: {strengths_score}%")
 
         # Preferences bonus (10% weight)
-        preferences_score = self._calculate_preferences_score(user_profile.get('preferences', []), career_data)
         score += preferences_score * 0.1
         if preferences_score > 0:
             explanations.append(f"Preferences match: {preferences_score}%")
@@ -55,7 +135,7 @@ class CareerRecommender:
 
         for user_interest in user_interests:
             # Normalize the interest (handle abbreviations)
-            normalized_interests = normalize_interest(user_interest)
+            normalized_interests = self.normalize_interest(user_interest)
 
             for norm_interest in normalized_interests:
                 # Check exact matches
@@ -66,10 +146,13 @@ class CareerRecommender:
                 elif any(norm_interest in interest for interest in career_data["key_interests"]):
                     total_score += 60
                     matched_interests.append(norm_interest)
-                # Check related concepts
-                elif self._are_related_concepts(norm_interest, career_data["key_interests"]):
-                    total_score += 30
-                    matched_interests.append(norm_interest)
+                # Check related and similar concepts, keeping the better of the two
+                else:
+                    points = max(30 if self._are_related_concepts(norm_interest, career_data["key_interests"]) else 0,
+                                 self._similar_concept_points(norm_interest, career_data["key_interests"]))
+                    if points:
+                        total_score += points
+                        matched_interests.append(norm_interest)
 
         # Average score across all interests, but cap at 100
         if user_interests:
@@ -108,20 +191,10 @@ class CareerRecommender:
         if not user_preferences:
             return 0
 
-        # Simple preference matching - can be expanded
-        preference_keywords = {
-            "remote": ["remote", "flexible", "work_from_home"],
-            "travel": ["travel", "business_trip"],
-            "creative": ["creativity", "innovation"],
-            "leadership": ["leadership", "management"],
-            "teamwork": ["team", "collaboration"],
-            "independent": ["independent", "autonomous"]
-        }
-
         matched_prefs = 0
         for pref in user_preferences:
             pref_lower = pref.lower()
-            for pref_category, keywords in preference_keywords.items():
+            for pref_category, keywords in PREFERENCE_KEYWORDS.items():
                 if any(keyword in pref_lower for keyword in keywords):
                     # Check if career supports this preference
                     work_env = career_data.get("work_environment", "").lower()
@@ -133,64 +206,188 @@ class CareerRecommender:
 
     def _are_related_concepts(self, concept, career_interests):
         """Check if a concept is related to career interests using semantic similarity"""
-        # Simple semantic relationships - can be enhanced with word embeddings
-        related_terms = {
-            "tech": ["technology", "computer", "software", "programming", "it"],
-            "technology": ["tech", "computer", "software", "programming", "it", "coding"],
-            "computer": ["technology", "programming", "software", "tech", "it"],
-            "programming": ["coding", "software", "development", "tech", "technology"],
-            "coding": ["programming", "software", "development", "tech", "technology"],
-            "software": ["programming", "development", "tech", "technology", "computer"],
-            "it": ["information_technology", "tech", "technology", "computer", "software"],
-            "data": ["analytics", "statistics", "information", "database"],
-            "creative": ["art", "design", "innovation", "creativity"],
-            "business": ["management", "finance", "strategy", "entrepreneurship"],
-            "science": ["research", "analysis", "discovery", "laboratory"],
-            "people": ["social", "communication", "helping", "human"],
-            "numbers": ["mathematics", "analytics", "finance", "statistics"],
-            "logic": ["analytical", "problem_solving", "reasoning", "algorithm"]
-        }
-
-        concept_lower = concept.lower()
-        if concept_lower in related_terms:
-            return any(term in career_interests for term in related_terms[concept_lower])
+        return self.concepts.is_related(concept, career_interests)
 
-        # Check reverse relationships
-        for related_list in related_terms.values():
-            if concept_lower in related_list:
-                return any(term in career_interests for term in related_terms.keys()
-                          if concept_lower in related_terms.get(term, []))
-
-        return False
+    def _similar_concept_points(self, concept, career_interests):
+        """Points for the career interest most similar to a concept, 0 when none passes the threshold"""
+        if self.similar_terms is None:
+            return 0
+        return max((_matrix.similar_points(similarity) for term, similarity in self.similar_terms(concept)
+                    if term in career_interests), default=0)
 
-    def recommend_careers(self, user_profile, top_n=5):
+    def recommend_careers(self, user_profile, top_n=5, conversation_id=None, filters=None,
+                          min_salary=None, max_salary=None):
         """
         Recommend top N careers based on user profile
         Returns list of career recommendations with scores and explanations
+        With a conversation_id, only terms changed since that conversation's last call are rescored
+        filters, e.g. {"domain": "Healthcare & Science", "growth_potential": ["High", "Very High"]},
+        and a min_salary/max_salary band restrict scoring to the careers matching all of them
+        """
+        if self.cache is None:
+            return self._score_and_rank(user_profile, top_n, conversation_id,
+                                        self._allowed(filters, min_salary, max_salary))
+
+        # Equivalent profiles share an entry, keyed by their canonical form. Only the ranked
+        # category scores are cached; the dicts are built from the caller's own profile, so
+        # explanations quote its terms as given, exactly as without the cache.
+        # The version is part of the key too, so a request still finishing on a swapped-out
+        # catalogue can never have its results served for the new one
+        version = self.index.version
+        self.cache.check_version(version)
+        key = (version, profile_key(canonical_profile(user_profile)), top_n, self.concepts.depth,
+               self.similarity_threshold, _facets.canonical_filters(filters), min_salary, max_salary)
+
+        interests = self._normalize_interests(user_profile)
+        ranked = self.cache.get(key)
+        if ranked is None:
+            ranked = self._rank(user_profile, top_n, conversation_id,
+                                self._allowed(filters, min_salary, max_salary), interests)
+            self.cache.put(key, ranked, version)
+        return self._build_recommendations(user_profile, ranked, interests)
+
+    def _allowed(self, filters=None, min_salary=None, max_salary=None):
+        """Row mask of the careers passing the facet filters and salary band, or None for all"""
+        allowed = self.facets.mask(filters)
+        salary_mask = self.salaries.mask(min_salary, max_salary)
+        if salary_mask is not None:
+            allowed = salary_mask if allowed is None else allowed & salary_mask
+        return allowed
+
+    def _score_and_rank(self, user_profile, top_n, conversation_id=None, allowed=None):
+        """Score a profile against every (allowed) career and build its top N recommendations"""
+        interests = self._normalize_interests(user_profile)
+        return self._build_recommendations(user_profile, self._rank(user_profile, top_n, conversation_id,
+                                                                    allowed, interests), interests)
+
+    def _rank(self, user_profile, top_n, conversation_id=None, allowed=None, interests=None):
+        """(career_id, category scores) of a profile's top N (allowed) careers, best first"""
+        if conversation_id is not None:
+            scores = self.incremental.score_profile(conversation_id, user_profile, allowed)
+        else:
+            if interests is None:
+                interests = self._normalize_interests(user_profile)
+            normalized_interests = [norm_interest for _, norm_interests in interests
+                                    for norm_interest in norm_interests]
+            scores = self.matrix.score_profile(user_profile, normalized_interests, self.concepts.related, allowed,
+                                               self.similar_terms)
+        return self._top_careers(scores, top_n)
+
+    def _normalize_interests(self, user_profile, normalized=None):
+        """
+        (interest, normalized interests) for each profile interest, so a request
+        normalizes every term once; normalized can carry results across a batch
+        """
+        if normalized is None:
+            normalized = {}
+        interests = []
+        for interest in user_profile.get('interests', []):
+            if interest not in normalized:
+                normalized[interest] = self.normalize_interest(interest)
+            interests.append((interest, normalized[interest]))
+        return interests
+
+    def filter_careers(self, filters=None, min_salary=None, max_salary=None):
+        """Faceted query: careers matching the filters and salary band, plus per-facet value counts"""
+        return self.facets.query(filters, self.salaries.mask(min_salary, max_salary))
+
+    def recommend_careers_batch(self, user_profiles, top_n=5, workers=None, filters=None,
+                                min_salary=None, max_salary=None):
+        """
+        Recommend top N careers for many profiles at once
+        Returns one recommendation list per profile, in input order
+        """
+        if workers and workers > 1 and len(user_profiles) > 1:
+            return self._recommend_in_processes(user_profiles, top_n, workers,
+                                                (filters, min_salary, max_salary))
+
+        # Normalize each distinct interest once for the whole cohort
+        normalized = {}
+        interests = [self._normalize_interests(user_profile, normalized) for user_profile in user_profiles]
+        normalized_interests = [[norm_interest for _, norm_interests in profile_interests
+                                 for norm_interest in norm_interests]
+                                for profile_interests in interests]
+
+        scored = self.matrix.score_profiles(user_profiles, normalized_interests, self.concepts.related,
+                                            self._allowed(filters, min_salary, max_salary), self.similar_terms)
+        return [self._build_recommendations(user_profile, self._top_careers(scores, top_n), profile_interests)
+                for user_profile, scores, profile_interests in zip(user_profiles, scored, interests)]
+
+    def _recommend_in_processes(self, user_profiles, top_n, workers, constraints=(None, None, None)):
+        """Split a cohort into contiguous slices and score them in a process pool"""
+        slice_size = math.ceil(len(user_profiles) / workers)
+        slices = [user_profiles[i:i + slice_size] for i in range(0, len(user_profiles), slice_size)]
+
+        # Every worker rebuilds this recommender, over the same catalogue, once before taking slices
+        settings = (self._catalogue_source(), self.concepts.depth, self.cache is not None, self.similarity_threshold)
+        with _futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                          initargs=settings) as executor:
+            results = executor.map(_recommend_batch_worker, slices, [top_n] * len(slices),
+                                   [constraints] * len(slices))
+            return [recommendations for chunk in results for recommendations in chunk]
+
+    def _catalogue_source(self):
+        """
+        What a worker process needs to open this recommender's catalogue: None for the
+        built-in one, a store file's path, or else a plain dict copy of the careers
+        """
+        if self.career_db is CAREER_CATALOGUE:
+            return None
+        if isinstance(self.career_db, _store.CareerStore):
+            return self.career_db.path
+        return {career_id: dict(career_data) for career_id, career_data in self.career_db.items()}
+
+    def _top_careers(self, scores, top_n):
+        """(career_id, category scores) of the top N careers in a profile's vectorized scores"""
+        ranked = []
+        for i in scores.top(top_n, 20):  # Minimum threshold for recommendations
+            ranked.append((self.index.career_ids[scores.rows[i]], (
+                min(float(scores.interest_average[i]), 100),
+                float(scores.skills[i]),
+                float(scores.strengths[i]),
+                float(scores.preferences[i])
+            )))
+        return ranked
+
+    def _build_recommendations(self, user_profile, ranked, interests=None):
         """
-        recommendations = []
-
-        for career_id, career_data in self.career_db.items():
-            score, explanations = self.calculate_match_score(user_profile, career_data)
-
-            if score > 20:  # Minimum threshold for recommendations
-                recommendations.append({
-                    "career_id": career_id,
-                    "career_name": career_data["name"],
-                    "domain": career_data["domain"],
-                    "description": career_data["description"],
-                    "match_score": score,
-                    "confidence": self._calculate_confidence(score),
-                    "explanations": explanations,
-                    "key_requirements": career_data["key_skills"][:3],  # Top 3 skills
-                    "salary_range": career_data["salary_range"],
-                    "education": career_data["education"],
-                    "why_it_fits": self._generate_fit_explanation(user_profile, career_data, explanations)
-                })
-
-        # Sort by score descending and return top N
-        recommendations.sort(key=lambda x: x["match_score"], reverse=True)
-        return recommendations[:top_n]
+        Build the recommendation dicts of ranked (career_id, category scores) pairs
+        interests are the profile's (interest, normalized interests) pairs, if already known
+        """
+        if interests is None:
+            interests = self._normalize_interests(user_profile)
+        # Terms each interest is checked against in the fit explanation, resolved once for all careers
+        fit_terms = [(interest, {self.normalize_interest(norm_interest)[0] for norm_interest in norm_interests})
+                     for interest, norm_interests in interests]
+
+        # Only the final top N get explanations and requirement fields built
+        return [self.recommendation_for(career_id, category_scores,
+                                        self._matched_terms(user_profile, self.career_db[career_id], fit_terms))
+                for career_id, category_scores in ranked]
+
+    def recommendation_for(self, career_id, category_scores, matched_terms):
+        """
+        Build one recommendation dict from its (interests, skills, strengths, preferences)
+        category scores and the profile terms it matched; no scoring is repeated
+        """
+        career_data = self.career_db[career_id]
+        score, explanations = self._combine_scores(*category_scores)
+
+        return {
+            "career_id": career_id,
+            "career_name": career_data["name"],
+            "domain": career_data["domain"],
+            "description": career_data["description"],
+            "match_score": score,
+            "confidence": self._calculate_confidence(score),
+            "explanations": explanations,
+            "key_requirements": list(career_data["key_skills"][:3]),  # Top 3 skills
+            "salary_range": career_data["salary_range"],
+            "education": career_data["education"],
+            "why_it_fits": self._fit_explanation(career_data, matched_terms),
+            "category_scores": dict(zip(PROFILE_FIELDS, category_scores)),
+            "matched_terms": matched_terms
+        }
 
     def _calculate_confidence(self, score):
         """Convert match score to confidence level"""
@@ -205,35 +402,43 @@ class CareerRecommender:
         else:
             return "Low"
 
-    def _generate_fit_explanation(self, user_profile, career_data, explanations):
+    def _generate_fit_explanation(self, user_profile, career_data, explanations, fit_terms=None):
         """Generate a human-readable explanation of why this career fits"""
+        return self._fit_explanation(career_data, self._matched_terms(user_profile, career_data, fit_terms))
+
+    def _matched_terms(self, user_profile, career_data, fit_terms=None):
+        """The profile's interests, skills and strengths that this career matches"""
+        if fit_terms is None:
+            fit_terms = [(interest, {self.normalize_interest(norm_interest)[0]
+                                     for norm_interest in self.normalize_interest(interest)})
+                         for interest in user_profile.get('interests', [])]
+        career_interests = career_data["key_interests"]
+        career_skills = career_data["key_skills"]
+        career_strengths = career_data["key_strengths"]
+        return {
+            "interests": [interest for interest, terms in fit_terms if not terms.isdisjoint(career_interests)],
+            "skills": [skill for skill in user_profile.get('skills', [])
+                       if any(skill.lower() in career_skill for career_skill in career_skills)],
+            "strengths": [strength for strength in user_profile.get('strengths', [])
+                          if any(strength.lower() in career_strength for career_strength in career_strengths)]
+        }
+
+    def _fit_explanation(self, career_data, matched_terms):
+        """Human-readable reasons from the terms a career matched"""
         reasons = []
 
         # Interest-based reasons
-        user_interests = user_profile.get('interests', [])
-        career_interests = career_data["key_interests"]
-        matching_interests = [interest for interest in user_interests
-                            if any(normalize_interest(interest)[0] in career_interests
-                                  for interest in normalize_interest(interest))]
-
+        matching_interests = matched_terms["interests"]
         if matching_interests:
             reasons.append(f"Aligns with your interests in {', '.join(matching_interests[:2])}")
 
         # Skills-based reasons
-        user_skills = user_profile.get('skills', [])
-        career_skills = career_data["key_skills"]
-        matching_skills = [skill for skill in user_skills
-                          if any(skill.lower() in career_skill for career_skill in career_skills)]
-
+        matching_skills = matched_terms["skills"]
         if matching_skills:
             reasons.append(f"Leverages your skills in {', '.join(matching_skills[:2])}")
 
         # Strengths-based reasons
-        user_strengths = user_profile.get('strengths', [])
-        career_strengths = career_data["key_strengths"]
-        matching_strengths = [strength for strength in user_strengths
-                             if any(strength.lower() in career_strength for career_strength in career_strengths)]
-
+        matching_strengths = matched_terms["strengths"]
         if matching_strengths:
             reasons.append(f"Matches your strengths in {', '.join(matching_strengths[:2])}")
 
@@ -252,9 +457,9 @@ class CareerRecommender:
             "name": career_data["name"],
             "description": career_data["description"],
             "domain": career_data["domain"],
-            "key_skills": career_data["key_skills"],
-            "key_interests": career_data["key_interests"],
-            "key_strengths": career_data["key_strengths"],
+            "key_skills": list(career_data["key_skills"]),
+            "key_interests": list(career_data["key_interests"]),
+            "key_strengths": list(career_data["key_strengths"]),
             "salary_range": career_data["salary_range"],
             "education": career_data["education"],
             "experience_level": career_data["experience_level"],
@@ -306,7 +511,7 @@ class CareerRecommender:
                     ]
                 }
             ],
-            "key_skills_to_learn": career_data["key_skills"][:5],
+            "key_skills_to_learn": list(career_data["key_skills"][:5]),
             "recommended_certifications": self._get_certifications_for_career(career_id),
             "career_progression": self._get_career_progression(career_id)
         }
@@ -315,27 +520,76 @@ class CareerRecommender:
 
     def _get_certifications_for_career(self, career_id):
         """Get recommended certifications for a career"""
-        certification_map = {
-            "software_engineer": ["AWS Certified Developer", "Google Cloud Professional", "Microsoft Azure Fundamentals"],
-            "data_scientist": ["IBM Data Science Professional Certificate", "Google Data Analytics", "TensorFlow Developer Certificate"],
-            "ai_engineer": ["AWS Machine Learning Specialty", "Google Cloud AI/ML", "Deep Learning Specialization"],
-            "cybersecurity_analyst": ["CompTIA Security+", "CISSP", "CEH (Certified Ethical Hacker)"],
-            "ux_ui_designer": ["Google UX Design", "Adobe Certified Expert", "Interaction Design Foundation"],
-            "business_analyst": ["CBAP (Certified Business Analysis Professional)", "PMI-PBA", "ECBA"],
-            "financial_analyst": ["CFA (Chartered Financial Analyst)", "FRM", "CPA"],
-            "project_manager": ["PMP (Project Management Professional)", "CSM (Certified ScrumMaster)", "PRINCE2"]
-        }
-
-        return certification_map.get(career_id, ["Industry-specific certifications"])
+        return list(self.certifications.get(career_id, DEFAULT_CERTIFICATIONS))
 
     def _get_career_progression(self, career_id):
         """Get career progression path"""
-        progression_map = {
-            "software_engineer": ["Junior Developer", "Mid-level Developer", "Senior Developer", "Tech Lead", "Engineering Manager"],
-            "data_scientist": ["Data Analyst", "Junior Data Scientist", "Data Scientist", "Senior Data Scientist", "Data Science Manager"],
-            "ux_ui_designer": ["Junior Designer", "UX/UI Designer", "Senior Designer", "Design Lead", "Design Manager"],
-            "business_analyst": ["Business Analyst", "Senior Business Analyst", "Business Analysis Manager", "IT Business Partner"],
-            "project_manager": ["Associate PM", "Project Manager", "Senior PM", "Program Manager", "PMO Director"]
-        }
-
-        return progression_map.get(career_id, ["Entry Level", "Mid Level", "Senior Level", "Management", "Executive"])
+        return list(self.progressions.get(career_id, DEFAULT_CAREER_PROGRESSION))
+
+_worker_recommender = None
+
+
+def _init_batch_worker(catalogue, concept_depth, use_cache, similarity_threshold):
+    """Process pool initializer: build the worker's recommender from the parent's settings"""
+    global _worker_recommender
+    career_db = _store.open_career_store(catalogue) if isinstance(catalogue, str) else catalogue
+    _worker_recommender = CareerRecommender(concept_depth=concept_depth, use_cache=use_cache, career_db=career_db,
+                                            similarity_threshold=similarity_threshold)
+
+
+def _recommend_batch_worker(user_profiles, top_n, constraints=(None, None, None)):
+    """Process pool entry point: score one slice of a cohort under (filters, min_salary, max_salary)"""
+    filters, min_salary, max_salary = constraints
+    return _worker_recommender.recommend_careers_batch(user_profiles, top_n, filters=filters,
+                                                       min_salary=min_salary, max_salary=max_salary)
+
+
+# Environment variables naming a compiled career store, or a hot-reloaded snapshot file,
+# for the shared recommender
+CAREER_STORE_ENV = "CAREER_STORE"
+CAREER_SNAPSHOT_ENV = "CAREER_SNAPSHOT"
+
+_shared_recommender = None
+_shared_lock = threading.Lock()
+_snapshot_watcher = None
+
+
+def _recommender_for_snapshot(snapshot):
+    """A warmed-up recommender over one snapshot, with every index built from it"""
+    return CareerRecommender(career_db=snapshot.career_db, certifications=snapshot.certifications,
+                             progressions=snapshot.progressions, version=snapshot.version).warm_up()
+
+
+def _swap_shared_recommender(snapshot):
+    """
+    Build the new snapshot's recommender on the watcher thread, then publish it with a
+    single reference swap. Requests already holding the old recommender finish on it.
+    """
+    global _shared_recommender
+    _shared_recommender = _recommender_for_snapshot(snapshot)
+
+
+def get_shared_recommender():
+    """
+    Return the process-wide recommender, compiling and warming it on first use.
+    Its indexes are read-only and its caches are locked, so threads can share it.
+    Set CAREER_STORE to a compiled store file to serve that catalogue instead, or
+    CAREER_SNAPSHOT to a snapshot file that is watched and swapped in when it changes.
+    """
+    global _shared_recommender, _snapshot_watcher
+    if _shared_recommender is None:
+        with _shared_lock:
+            if _shared_recommender is None:
+                snapshot_path = os.environ.get(CAREER_SNAPSHOT_ENV)
+                store_path = os.environ.get(CAREER_STORE_ENV)
+                if snapshot_path:
+                    # Watch from before the first load, so an edit made meanwhile is not missed
+                    watcher = _snapshot.SnapshotWatcher(snapshot_path, _swap_shared_recommender)
+                    snapshot = _snapshot.load_snapshot(snapshot_path)
+                    watcher.version = snapshot.version
+                    _shared_recommender = _recommender_for_snapshot(snapshot)
+                    _snapshot_watcher = watcher.start()
+                else:
+                    career_db = _store.open_career_store(store_path) if store_path else None
+                    _shared_recommender = CareerRecommender(career_db=career_db).warm_up()
+    return _shared_recommender
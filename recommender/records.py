@@ -0,0 +1,98 @@
+"""
+Career Records
+Compact, read-only career records compiled from the dict-of-dicts catalogue
+"""
+
+import sys
+from collections.abc import Mapping
+
+CAREER_FIELDS = (
+    "name", "domain", "description", "key_interests", "key_skills", "key_strengths",
+    "salary_range", "education", "experience_level", "work_environment",
+    "growth_potential", "job_satisfaction", "work_life_balance", "future_outlook"
+)
+TERM_FIELDS = ("key_interests", "key_skills", "key_strengths")
+
+# Free text that is rarely shared between careers, so not worth interning
+UNINTERNED_FIELDS = ("name", "description")
+
+_FIELD_SET = frozenset(CAREER_FIELDS)
+
+
+class Career(Mapping):
+    """
+    One career as a slotted, immutable record.
+    Term lists become tuples of interned strings, so a term repeated across
+    thousands of careers is stored once; categorical fields are interned too.
+    It still reads like the original dict: career["key_skills"], career.get(...).
+    """
+
+    __slots__ = CAREER_FIELDS
+
+    def __init__(self, career_data):
+        for field in CAREER_FIELDS:
+            value = career_data.get(field, "")
+            if field in TERM_FIELDS:
+                value = tuple(sys.intern(term) for term in value)
+            elif field not in UNINTERNED_FIELDS:
+                value = sys.intern(value)
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, field, value):
+        raise AttributeError("Career records are read-only")
+
+    def __reduce__(self):
+        # Pickle rebuilds through __init__, since the default path would set slots one by one
+        return Career, (self.to_dict(),)
+
+    def __getitem__(self, field):
+        if field not in _FIELD_SET:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self):
+        return iter(CAREER_FIELDS)
+
+    def __len__(self):
+        return len(CAREER_FIELDS)
+
+    def __repr__(self):
+        return f"Career({self.name!r})"
+
+    def to_dict(self):
+        """Plain dict copy in the original CAREER_DATABASE layout"""
+        return {field: list(self[field]) if field in TERM_FIELDS else self[field]
+                for field in CAREER_FIELDS}
+
+
+class CareerCatalogue(Mapping):
+    """Read-only mapping view of career_id -> Career"""
+
+    __slots__ = ("_careers",)
+
+    def __init__(self, careers):
+        self._careers = careers
+
+    def __getitem__(self, career_id):
+        return self._careers[career_id]
+
+    def __iter__(self):
+        return iter(self._careers)
+
+    def __len__(self):
+        return len(self._careers)
+
+    def __repr__(self):
+        return f"CareerCatalogue({len(self._careers)} careers)"
+
+    def to_dict(self):
+        """Plain dict-of-dicts copy of the whole catalogue"""
+        return {career_id: career.to_dict() for career_id, career in self._careers.items()}
+
+
+def compile_catalogue(career_db):
+    """Compile a dict-of-dicts career database into a read-only catalogue of records"""
+    if isinstance(career_db, CareerCatalogue):
+        return career_db
+    return CareerCatalogue({sys.intern(career_id): Career(career_data)
+                            for career_id, career_data in career_db.items()})
@@ -0,0 +1,109 @@
+"""
+Career Salary Index
+Numeric salary bands parsed from the display text, kept sorted for range queries
+"""
+
+import re
+
+import numpy as np
+
+# An amount such as "80,000", "$95k" or "1.2M"
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([kKmM]?)")
+_MULTIPLIERS = {"": 1, "k": 1_000, "m": 1_000_000}
+
+# Words making a single amount a ceiling ("Up to $60,000") or a floor ("From $90k")
+_CEILING = re.compile(r"\b(?:up to|under|below|less than)\b", re.IGNORECASE)
+_FLOOR = re.compile(r"\b(?:from|over|above|at least)\b", re.IGNORECASE)
+
+
+def parse_salary_range(text):
+    """
+    Parse display text like "$80,000 - $150,000" into (low, high).
+    A single amount is a one-point band, a ceiling after "up to" or "under",
+    or open-ended after "from" or "over" or when followed by "+";
+    text without amounts gives None.
+    """
+    text = text or ""
+    amounts = [float(number.replace(",", "")) * _MULTIPLIERS[suffix.lower()]
+               for number, suffix in _AMOUNT.findall(text)][:2]
+    if not amounts:
+        return None
+    if len(amounts) == 2:
+        return min(amounts), max(amounts)
+    amount = amounts[0]
+    if _CEILING.search(text):
+        return 0.0, amount
+    if _FLOOR.search(text) or text.rstrip().endswith("+"):
+        return amount, float("inf")
+    return amount, amount
+
+
+class SalaryIndex:
+    """
+    Per-career salary minimum and maximum columns, each with a sorted copy.
+    A band query is two binary searches (np.searchsorted) instead of a scan.
+    Careers whose salary text cannot be parsed never match a band.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.num_careers = len(index)
+
+        # Salary texts repeat heavily, so each distinct one is parsed once
+        codes, values = index.categories("salary_range")
+        bands = np.array([parse_salary_range(value) or (np.nan, np.nan) for value in values],
+                         dtype=np.float64).reshape(len(values), 2)
+        codes = np.asarray(codes, dtype=np.intp)
+        self.minimum = bands[codes, 0]
+        self.maximum = bands[codes, 1]
+
+        # argsort places unparsed (NaN) careers last; they are cut off by the valid counts
+        self.by_minimum = np.argsort(self.minimum, kind="stable")
+        self.by_maximum = np.argsort(self.maximum, kind="stable")
+        self.sorted_minimum = self.minimum[self.by_minimum]
+        self.sorted_maximum = self.maximum[self.by_maximum]
+        self.num_parsed = int(np.count_nonzero(~np.isnan(self.minimum)))
+
+    def rows_paying_at_least(self, amount):
+        """Rows of careers whose band reaches the amount (maximum >= amount)"""
+        start = np.searchsorted(self.sorted_maximum[:self.num_parsed], amount, side="left")
+        return self.by_maximum[start:self.num_parsed]
+
+    def rows_starting_at_most(self, amount):
+        """Rows of careers whose band starts at or below the amount (minimum <= amount)"""
+        end = np.searchsorted(self.sorted_minimum[:self.num_parsed], amount, side="right")
+        return self.by_minimum[:end]
+
+    def mask(self, min_salary=None, max_salary=None):
+        """
+        Boolean mask over career rows whose salary band overlaps [min_salary, max_salary],
+        or None when neither bound is given
+        """
+        if min_salary is None and max_salary is None:
+            return None
+        mask = np.ones(self.num_careers, dtype=bool)
+        if min_salary is not None:
+            reaching = np.zeros(self.num_careers, dtype=bool)
+            reaching[self.rows_paying_at_least(min_salary)] = True
+            mask &= reaching
+        if max_salary is not None:
+            starting = np.zeros(self.num_careers, dtype=bool)
+            starting[self.rows_starting_at_most(max_salary)] = True
+            mask &= starting
+        return mask
+
+    def rows(self, min_salary=None, max_salary=None):
+        """Rows of careers whose band overlaps the range, in database order"""
+        mask = self.mask(min_salary, max_salary)
+        return np.arange(self.num_careers) if mask is None else np.flatnonzero(mask)
+
+
+_shared_salaries = None
+
+
+def get_salary_index(index):
+    """Return the salary index for a career index, building it only when the index changes"""
+    global _shared_salaries
+    if _shared_salaries is None or _shared_salaries.index is not index:
+        _shared_salaries = SalaryIndex(index)
+    return _shared_salaries
@@ -0,0 +1,203 @@
+"""
+Career Keyword Search
+SQLite FTS5 index answering keyword searches without scanning every career
+"""
+
+import sqlite3
+import threading
+
+from .index import catalogue_fingerprint
+
+# Fields searched, numbered in the order the keyword scan checks them; the last is name/description
+SEARCH_TERM_FIELDS = ("key_interests", "key_skills", "key_strengths")
+MATCH_LABELS = ("interest", "skill", "strength", "description")
+MATCH_POINTS = (3, 2, 2, 1)
+DESCRIPTION_FIELD = len(SEARCH_TERM_FIELDS)
+
+# Trigram queries need at least this many characters; shorter keywords fall back to instr()
+MIN_TRIGRAM_LENGTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS careers (
+    id INTEGER PRIMARY KEY,
+    career_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    field INTEGER NOT NULL,
+    term TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS career_terms (
+    term_id INTEGER NOT NULL,
+    career INTEGER NOT NULL,
+    PRIMARY KEY (term_id, career)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS terms_trigram USING fts5(
+    term, content='terms', content_rowid='id', tokenize='trigram'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS terms_words USING fts5(
+    term, content='terms', content_rowid='id', tokenize='unicode61 remove_diacritics 0', prefix='2 3'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS careers_trigram USING fts5(
+    name, description, content='careers', content_rowid='id', tokenize='trigram'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS careers_words USING fts5(
+    name, description, content='careers', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 0', prefix='2 3'
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_FTS_TABLES = ("terms_trigram", "terms_words", "careers_trigram", "careers_words")
+
+_POINTS_CASE = "CASE hit % {} {} END".format(
+    len(MATCH_POINTS), " ".join(f"WHEN {field} THEN {points}" for field, points in enumerate(MATCH_POINTS)))
+
+
+def _phrase(keyword):
+    """Quote a keyword as an FTS5 phrase"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+class CareerSearchIndex:
+    """
+    Full-text index over a career database, scored like search_careers_by_keywords.
+    Keywords are matched against the distinct terms of each field, then joined to
+    the careers listing them. Substring searches use trigram indexes confirmed with
+    instr(), so results match the scan exactly; prefix searches use word indexes.
+    """
+
+    def __init__(self, career_db, path=":memory:", version=None):
+        self.career_db = career_db
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+        # An in-memory index is always fresh; a file is reused while its catalogue version matches
+        if path != ":memory:":
+            version = version or getattr(career_db, "version", None) or catalogue_fingerprint(career_db)
+        if version is None or self._stored_version() != version:
+            self._rebuild(version)
+
+    def _stored_version(self):
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else None
+
+    def _rebuild(self, version):
+        """Reload every career and rebuild the FTS indexes"""
+        term_ids = {}
+        careers = []
+        career_terms = []
+        for career, (career_id, career_data) in enumerate(self.career_db.items()):
+            careers.append((career, career_id, career_data["name"].lower(), career_data["description"].lower()))
+            for field, field_name in enumerate(SEARCH_TERM_FIELDS):
+                for term in career_data[field_name]:
+                    term_id = term_ids.setdefault((field, term), len(term_ids))
+                    career_terms.append((term_id, career))
+
+        with self._connection:
+            for table in ("careers", "terms", "career_terms"):
+                self._connection.execute(f"DELETE FROM {table}")
+            self._connection.executemany("INSERT INTO careers VALUES (?, ?, ?, ?)", careers)
+            self._connection.executemany("INSERT INTO terms VALUES (?, ?, ?)",
+                                         ((term_id, field, term) for (field, term), term_id in term_ids.items()))
+            self._connection.executemany("INSERT OR IGNORE INTO career_terms VALUES (?, ?)", career_terms)
+            for table in _FTS_TABLES:
+                self._connection.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+            if version is not None:
+                self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                                         (version,))
+
+    def __len__(self):
+        return len(self.career_db)
+
+    def _hit_queries(self, keywords, prefix):
+        """SELECTs yielding (career, hit) pairs, where hit encodes keyword position and field"""
+        selects = []
+        parameters = []
+        for position, keyword in enumerate(keywords):
+            keyword_lower = keyword.lower()
+            base = position * len(MATCH_LABELS)
+            if prefix:
+                if not any(ch.isalnum() for ch in keyword_lower):
+                    continue
+                query = _phrase(keyword_lower) + " *"
+                selects.append("SELECT DISTINCT career, ? + terms.field FROM terms_words "
+                               "JOIN terms ON terms.id = terms_words.rowid "
+                               "JOIN career_terms ON career_terms.term_id = terms.id "
+                               "WHERE terms_words MATCH ?")
+                selects.append("SELECT rowid, ? FROM careers_words WHERE careers_words MATCH ?")
+                parameters += [base, query, base + DESCRIPTION_FIELD, query]
+            elif len(keyword_lower) >= MIN_TRIGRAM_LENGTH:
+                query = _phrase(keyword_lower)
+                selects.append("SELECT DISTINCT career, ? + terms.field FROM terms_trigram "
+                               "JOIN terms ON terms.id = terms_trigram.rowid "
+                               "JOIN career_terms ON career_terms.term_id = terms.id "
+                               "WHERE terms_trigram MATCH ? AND instr(terms.term, ?) > 0")
+                selects.append("SELECT rowid, ? FROM careers_trigram WHERE careers_trigram MATCH ? "
+                               "AND (instr(name, ?) > 0 OR instr(description, ?) > 0)")
+                parameters += [base, query, keyword_lower, base + DESCRIPTION_FIELD, query,
+                               keyword_lower, keyword_lower]
+            else:
+                selects.append("SELECT DISTINCT career, ? + terms.field FROM terms "
+                               "JOIN career_terms ON career_terms.term_id = terms.id "
+                               "WHERE instr(terms.term, ?) > 0")
+                selects.append("SELECT id, ? FROM careers WHERE instr(name, ?) > 0 OR instr(description, ?) > 0")
+                parameters += [base, keyword_lower, base + DESCRIPTION_FIELD, keyword_lower, keyword_lower]
+        return selects, parameters
+
+    def search(self, keywords, limit=None, offset=0, prefix=False):
+        """
+        Careers matching the keywords, best first, as
+        {career_id: {"career", "score", "matched_keywords"}}.
+        With prefix=True a keyword matches the start of a word instead of any substring.
+        """
+        keywords = list(keywords)
+        selects, parameters = self._hit_queries(keywords, prefix)
+        if not selects:
+            return {}
+
+        query = f"""
+            WITH hits (career, hit) AS ({" UNION ALL ".join(selects)})
+            SELECT careers.career_id, ranked.score, ranked.hits
+            FROM (SELECT career, SUM({_POINTS_CASE}) AS score, group_concat(hit) AS hits
+                  FROM hits GROUP BY career ORDER BY score DESC, career LIMIT ? OFFSET ?) AS ranked
+            JOIN careers ON careers.id = ranked.career
+            ORDER BY ranked.score DESC, ranked.career
+        """
+        parameters += [-1 if limit is None else limit, offset]
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+
+        results = {}
+        for career_id, score, hits in rows:
+            matched_keywords = []
+            for hit in sorted(int(hit) for hit in hits.split(",")):
+                position, field = divmod(hit, len(MATCH_LABELS))
+                matched_keywords.append(f"{MATCH_LABELS[field]}: {keywords[position]}")
+            results[career_id] = {
+                "career": self.career_db[career_id],
+                "score": score,
+                "matched_keywords": matched_keywords
+            }
+        return results
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._connection.close()
+
+
+_shared_search_index = None
+
+
+def get_search_index(career_db):
+    """Return the search index for a career database, building it only when the database changes"""
+    global _shared_search_index
+    if (_shared_search_index is None or _shared_search_index.career_db is not career_db
+            or len(_shared_search_index) != len(career_db)):
+        _shared_search_index = CareerSearchIndex(career_db)
+    return _shared_search_index
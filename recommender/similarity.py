@@ -0,0 +1,141 @@
+"""
+Concept Similarity
+Offline character n-gram TF-IDF embeddings of the interest vocabulary with precomputed neighbours
+"""
+
+import math
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from .concepts import SIMILARITY_THRESHOLD
+
+# Character n-gram lengths taken from each word, padded with spaces to mark its edges
+NGRAM_SIZES = (3, 4)
+
+# Hashed feature buckets per embedding; collisions only blur the rarest n-grams
+EMBEDDING_DIMENSIONS = 1024
+
+# Nearest vocabulary terms kept per term
+NEIGHBOURS = 10
+
+# Terms outside the vocabulary whose neighbours are remembered
+QUERY_CACHE_SIZE = 4096
+
+# Rows of the similarity matrix computed at once when precomputing neighbours
+_BLOCK_ROWS = 512
+
+
+def term_features(term):
+    """Whole words plus the padded character n-grams of each word"""
+    features = []
+    for word in term.lower().replace("-", "_").replace(" ", "_").split("_"):
+        if not word:
+            continue
+        features.append("w:" + word)
+        padded = f" {word} "
+        for size in NGRAM_SIZES:
+            features.extend(padded[i:i + size] for i in range(len(padded) - size + 1))
+    return features
+
+
+def _bucket(feature):
+    return zlib.crc32(feature.encode("utf-8")) % EMBEDDING_DIMENSIONS
+
+
+class ConceptSimilarity:
+    """
+    Dense, L2-normalized TF-IDF embeddings of every vocabulary term, built locally
+    from hashed character n-grams, so phrasings like "data_scientist" and "data_science"
+    land close together. The top-k neighbours of each term are precomputed; other
+    terms are embedded on demand and compared against the whole matrix in one product.
+    """
+
+    def __init__(self, index, neighbours=NEIGHBOURS):
+        self.index = index
+        self.terms = list(index.csc("key_interests")[0])
+        self.positions = {term: i for i, term in enumerate(self.terms)}
+
+        buckets = [[_bucket(feature) for feature in term_features(term)] for term in self.terms]
+        document_frequency = np.zeros(EMBEDDING_DIMENSIONS)
+        for term_buckets in buckets:
+            document_frequency[list(set(term_buckets))] += 1
+        self.idf = np.log((1 + len(self.terms)) / (1 + document_frequency)) + 1
+
+        self.embeddings = np.zeros((len(self.terms), EMBEDDING_DIMENSIONS), dtype=np.float32)
+        for row, term_buckets in enumerate(buckets):
+            self.embeddings[row] = self._weigh(term_buckets)
+
+        self.neighbour_ids, self.neighbour_similarities = self._precompute(min(neighbours, len(self.terms) - 1))
+        self._query_neighbours = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._nearest)
+        self._thresholded = {}
+
+    def __len__(self):
+        return len(self.terms)
+
+    def _weigh(self, term_buckets):
+        """TF-IDF vector of a term's feature buckets, scaled to unit length"""
+        vector = np.bincount(term_buckets, minlength=EMBEDDING_DIMENSIONS) * self.idf
+        norm = math.sqrt(float(vector @ vector))
+        return vector / norm if norm else vector
+
+    def _precompute(self, k):
+        """Top-k (ids, similarities) of every vocabulary term, excluding the term itself"""
+        count = len(self.terms)
+        ids = np.zeros((count, max(k, 0)), dtype=np.int32)
+        similarities = np.zeros((count, max(k, 0)), dtype=np.float32)
+        if k <= 0:
+            return ids, similarities
+
+        for start in range(0, count, _BLOCK_ROWS):
+            block = self.embeddings[start:start + _BLOCK_ROWS] @ self.embeddings.T
+            block[np.arange(len(block)), np.arange(start, start + len(block))] = -1
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_similarities = np.take_along_axis(block, top, axis=1)
+            # Best first; equal similarities keep vocabulary order
+            order = np.lexsort((top, -top_similarities), axis=1)
+            ids[start:start + len(block)] = np.take_along_axis(top, order, axis=1)
+            similarities[start:start + len(block)] = np.take_along_axis(top_similarities, order, axis=1)
+        return ids, similarities
+
+    def _nearest(self, term):
+        """Top-k of a term outside the vocabulary, embedded on the spot"""
+        k = min(self.neighbour_ids.shape[1] + 1, len(self.terms))
+        if not k:
+            return ()
+        query = self._weigh([_bucket(feature) for feature in term_features(term)]).astype(np.float32)
+        similarities = self.embeddings @ query
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.lexsort((top, -similarities[top]))]
+        return tuple((self.terms[i], float(similarities[i])) for i in top.tolist())
+
+    def neighbours(self, term):
+        """(term, cosine similarity) of a term's nearest vocabulary terms, most similar first"""
+        position = self.positions.get(term)
+        if position is None:
+            return self._query_neighbours(term)
+        return tuple(zip((self.terms[i] for i in self.neighbour_ids[position].tolist()),
+                         self.neighbour_similarities[position].tolist()))
+
+    def similar(self, term, threshold=SIMILARITY_THRESHOLD):
+        """Neighbours of a term at or above the similarity threshold"""
+        return [(neighbour, similarity) for neighbour, similarity in self.neighbours(term)
+                if similarity >= threshold]
+
+    def similar_terms(self, threshold=SIMILARITY_THRESHOLD):
+        """A term -> similar terms function for one threshold, the same object on every call"""
+        if threshold not in self._thresholded:
+            self._thresholded[threshold] = lambda term: self.similar(term, threshold)
+        return self._thresholded[threshold]
+
+
+_shared_similarity = None
+
+
+def get_concept_similarity(index):
+    """Return the similarity model over an index's interest vocabulary, rebuilding it when the index changes"""
+    global _shared_similarity
+    if _shared_similarity is None or _shared_similarity.index is not index:
+        _shared_similarity = ConceptSimilarity(index)
+    return _shared_similarity
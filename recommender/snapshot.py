@@ -0,0 +1,152 @@
+"""
+Career Snapshots
+Versioned catalogue snapshot files and a watcher that reloads them off the request path
+
+Usage:
+    python -m recommender.snapshot careers.snapshot.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+
+from .index import catalogue_fingerprint
+from .records import compile_catalogue
+
+SNAPSHOT_FORMAT = 1
+
+# Seconds between checks of the snapshot file for changes
+DEFAULT_POLL_INTERVAL = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+class CareerSnapshot:
+    """One immutable version of the catalogue and the learning-plan data that goes with it"""
+
+    __slots__ = ("version", "career_db", "certifications", "progressions")
+
+    def __init__(self, career_db, certifications, progressions, version=None):
+        self.career_db = compile_catalogue(career_db)
+        self.certifications = {career_id: tuple(items) for career_id, items in certifications.items()}
+        self.progressions = {career_id: tuple(steps) for career_id, steps in progressions.items()}
+        self.version = version or catalogue_fingerprint(
+            {"careers": self.career_db, "certifications": certifications, "progressions": progressions})
+
+    def __repr__(self):
+        return f"CareerSnapshot({self.version!r}, {len(self.career_db)} careers)"
+
+
+def load_snapshot(path):
+    """Read and compile a snapshot file"""
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    if data.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported career snapshot format {data.get('format')!r} in {path}")
+    return CareerSnapshot(data["careers"], data.get("certifications", {}), data.get("progressions", {}),
+                          data.get("version"))
+
+
+def write_snapshot(path, career_db, certifications, progressions, version=None):
+    """
+    Write a snapshot file atomically: it is written beside the target and renamed
+    over it, so a watcher never reads a half-written file.
+    """
+    snapshot = CareerSnapshot(career_db, certifications, progressions, version)
+    data = {
+        "format": SNAPSHOT_FORMAT,
+        "version": snapshot.version,
+        "careers": snapshot.career_db.to_dict(),
+        "certifications": {career_id: list(items) for career_id, items in snapshot.certifications.items()},
+        "progressions": {career_id: list(steps) for career_id, steps in snapshot.progressions.items()}
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    handle = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False)
+    try:
+        with handle:
+            json.dump(data, handle, indent=2)
+        os.replace(handle.name, path)
+    except BaseException:
+        os.unlink(handle.name)
+        raise
+    return snapshot
+
+
+class SnapshotWatcher:
+    """
+    Background thread polling a snapshot file. When the file changes and holds a
+    new version, the snapshot is loaded on this thread and handed to on_change.
+    A file that fails to load is logged and skipped; the previous snapshot stays live.
+    """
+
+    def __init__(self, path, on_change, version=None, interval=DEFAULT_POLL_INTERVAL):
+        self.path = path
+        self.on_change = on_change
+        self.version = version
+        self.interval = interval
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="career-snapshot-watcher", daemon=True)
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def check(self):
+        """Reload the snapshot if the file changed; returns whether a new version was applied"""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            snapshot = load_snapshot(self.path)
+        except (OSError, ValueError, KeyError) as error:
+            logger.warning("Ignoring unreadable career snapshot %s: %s", self.path, error)
+            return False
+        if snapshot.version == self.version:
+            return False
+        self.on_change(snapshot)
+        self.version = snapshot.version
+        logger.info("Loaded career snapshot %s from %s", snapshot.version, self.path)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Career snapshot reload failed")
+
+
+def main():
+    """Export the built-in catalogue, certifications and progressions as a snapshot file"""
+    from .career_database import CAREER_CATALOGUE, CAREER_PROGRESSION_MAP, CERTIFICATION_MAP
+
+    parser = argparse.ArgumentParser(description="Export the career catalogue as a snapshot file")
+    parser.add_argument("output", help="path of the snapshot file to write")
+    args = parser.parse_args()
+
+    snapshot = write_snapshot(args.output, CAREER_CATALOGUE, CERTIFICATION_MAP, CAREER_PROGRESSION_MAP)
+    print(f"[OK] Wrote snapshot {snapshot.version} ({len(snapshot.career_db)} careers) to {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,402 @@
+"""
+Career Store
+Compiled, memory-mapped career catalogue file decoded lazily per career
+
+Usage:
+    python -m recommender.store careers.store
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+
+import numpy as np
+
+from .index import INDEXED_FIELDS, _plain, catalogue_fingerprint
+from .matching import SubstringMatcher
+from .records import CAREER_FIELDS, TERM_FIELDS, UNINTERNED_FIELDS, Career
+
+MAGIC = b"CAREERS1"
+FORMAT_VERSION = 1
+ALIGNMENT = 8
+
+SCALAR_FIELDS = tuple(field for field in CAREER_FIELDS if field not in TERM_FIELDS)
+
+# Each record row: career id, every scalar field, then a (start, end) span of term_refs per term field
+RECORD_WIDTH = 1 + len(SCALAR_FIELDS) + 2 * len(TERM_FIELDS)
+SCALAR_COLUMNS = {field: 1 + i for i, field in enumerate(SCALAR_FIELDS)}
+TERM_COLUMNS = {field: 1 + len(SCALAR_FIELDS) + 2 * i for i, field in enumerate(TERM_FIELDS)}
+
+# Decoded careers kept around, so hot careers are not rebuilt on every request
+DECODED_CAREERS = 4096
+
+_HEADER_PREFIX = struct.Struct("<8sI")
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class StoreFormatError(ValueError):
+    """Raised when a file is not a career store this version can read"""
+
+
+class StoreWriter:
+    """
+    Builds a store file one career at a time, for catalogues too large to hold as a dict.
+    Terms and categorical values are interned; names and descriptions are spooled to a
+    temporary file, and rows and postings are kept as compact arrays until finish().
+    The file is written beside the target and renamed over it, so open stores keep
+    reading the previous file.
+    """
+
+    def __init__(self, path, version=None):
+        self.path = path
+        self.version = version
+        self._strings = {}
+        self._string_offsets = array("Q", [0])
+        self._string_data = tempfile.TemporaryFile()
+        self._career_ids = []
+        self._seen_ids = set()
+        self._records = array("I")
+        self._term_refs = array("I")
+        self._postings = {field: {} for field in INDEXED_FIELDS}
+        self._digest = hashlib.sha1()
+
+    def __len__(self):
+        return len(self._career_ids)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.finish()
+        finally:
+            self.close()
+
+    def close(self):
+        """Discard the spooled strings; call after finish(), or instead of it to abandon the store"""
+        self._string_data.close()
+
+    def _append(self, value):
+        encoded = value.encode("utf-8")
+        self._string_data.write(encoded)
+        self._string_offsets.append(self._string_offsets[-1] + len(encoded))
+        return len(self._string_offsets) - 2
+
+    def _ref(self, value):
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = self._strings[value] = self._append(value)
+        return string_id
+
+    def add(self, career_id, career_data):
+        """Append one career; ids must be unique"""
+        if career_id in self._seen_ids:
+            raise ValueError(f"Duplicate career id: {career_id}")
+        self._seen_ids.add(career_id)
+        position = len(self._career_ids)
+        self._career_ids.append(career_id.encode("utf-8"))
+        self._digest.update(json.dumps([career_id, career_data], sort_keys=True, default=_plain).encode("utf-8"))
+
+        records = self._records
+        records.append(self._ref(career_id))
+        for field in SCALAR_FIELDS:
+            value = career_data.get(field, "")
+            records.append(self._append(value) if field in UNINTERNED_FIELDS else self._ref(value))
+        for field in TERM_FIELDS:
+            records.append(len(self._term_refs))
+            for term in career_data.get(field, ()):
+                string_id = self._ref(term)
+                self._term_refs.append(string_id)
+                rows = self._postings[field].setdefault(string_id, array("I"))
+                if not rows or rows[-1] != position:
+                    rows.append(position)
+            records.append(len(self._term_refs))
+
+    def finish(self):
+        """Write the store file and return its version"""
+        if self.version is None:
+            self.version = self._digest.hexdigest()[:12]
+        interned = {string_id: value.encode("utf-8") for value, string_id in self._strings.items()}
+        career_ids = self._career_ids
+
+        sections = {
+            "string_offsets": self._string_offsets,
+            "string_data": self._string_data,
+            "records": self._records,
+            "term_refs": self._term_refs,
+            "id_order": array("I", sorted(range(len(career_ids)), key=career_ids.__getitem__))
+        }
+        for field in INDEXED_FIELDS:
+            postings = self._postings[field]
+            vocabulary = sorted(postings, key=interned.__getitem__)
+            indptr = array("Q", [0])
+            indices = array("I")
+            for string_id in vocabulary:
+                indices.extend(postings[string_id])
+                indptr.append(len(indices))
+            sections[field + ".vocabulary"] = array("I", vocabulary)
+            sections[field + ".indptr"] = indptr
+            sections[field + ".indices"] = indices
+
+        layout = {}
+        offset = 0
+        for name, data in sections.items():
+            if isinstance(data, array):
+                typecode, size = data.typecode, len(data) * data.itemsize
+            else:
+                typecode, size = "B", self._string_offsets[-1]
+            layout[name] = [offset, size, typecode]
+            offset = _align(offset + size)
+
+        header = json.dumps({
+            "format": FORMAT_VERSION,
+            "careers": len(career_ids),
+            "version": self.version,
+            "sections": layout
+        }).encode("utf-8")
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        handle = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".tmp", delete=False)
+        try:
+            with handle:
+                handle.write(_HEADER_PREFIX.pack(MAGIC, len(header)))
+                handle.write(header)
+                data_start = _align(_HEADER_PREFIX.size + len(header))
+                for name, data in sections.items():
+                    handle.seek(data_start + layout[name][0])
+                    if isinstance(data, array):
+                        data.tofile(handle)
+                    else:
+                        data.seek(0)
+                        shutil.copyfileobj(data, handle)
+                handle.truncate(data_start + offset)
+            os.replace(handle.name, self.path)
+        except BaseException:
+            os.unlink(handle.name)
+            raise
+        return self.version
+
+
+def write_store(career_db, path, version=None):
+    """
+    Compile a career database into a store file.
+    Strings are deduplicated into one table, careers become fixed-width rows
+    of string references, and each term field gets CSC postings sorted by term.
+    """
+    with StoreWriter(path, version or catalogue_fingerprint(career_db)) as writer:
+        for career_id, career in career_db.items():
+            writer.add(career_id, career)
+    return writer.version
+
+
+class CareerStore(Mapping):
+    """
+    Read-only career_id -> Career mapping over a memory-mapped store file.
+    Opening only reads the header; careers are decoded on access and the
+    term postings are used in place as NumPy views of the mapped buffer.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_size = _HEADER_PREFIX.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise StoreFormatError(f"{path} is not a career store")
+        header = json.loads(self._buffer[_HEADER_PREFIX.size:_HEADER_PREFIX.size + header_size])
+        if header["format"] != FORMAT_VERSION:
+            raise StoreFormatError(f"Unsupported career store format {header['format']}")
+
+        self.version = header["version"]
+        self._num_careers = header["careers"]
+        data_start = _align(_HEADER_PREFIX.size + header_size)
+        self._sections = {}
+        for name, (offset, size, typecode) in header["sections"].items():
+            dtype = np.dtype(typecode)
+            self._sections[name] = np.frombuffer(self._buffer, dtype=dtype, count=size // dtype.itemsize,
+                                                 offset=data_start + offset)
+
+        self._string_offsets = self._sections["string_offsets"]
+        self._string_base = data_start + header["sections"]["string_data"][0]
+        self.records = self._sections["records"].reshape(self._num_careers, RECORD_WIDTH)
+        self.career_at = lru_cache(maxsize=DECODED_CAREERS)(self._decode_career)
+        self._index = None
+
+    def _raw_string(self, string_id):
+        start = self._string_base + int(self._string_offsets[string_id])
+        end = self._string_base + int(self._string_offsets[string_id + 1])
+        return self._buffer[start:end]
+
+    def string(self, string_id):
+        """Decode one entry of the string table"""
+        return self._raw_string(string_id).decode("utf-8")
+
+    def _terms(self, row, field):
+        start, end = row[TERM_COLUMNS[field]], row[TERM_COLUMNS[field] + 1]
+        return [self.string(string_id) for string_id in self._sections["term_refs"][start:end]]
+
+    def _decode_career(self, position):
+        row = self.records[position]
+        career_data = {field: self.string(row[column]) for field, column in SCALAR_COLUMNS.items()}
+        for field in TERM_FIELDS:
+            career_data[field] = self._terms(row, field)
+        return Career(career_data)
+
+    def id_at(self, position):
+        """Career id stored at a row position"""
+        return self.string(self.records[position, 0])
+
+    def position_of(self, career_id):
+        """Row position of a career id, found by binary search over the sorted id table"""
+        # Ids are strings; anything else is simply absent, so get() and `in` behave like a dict
+        if not isinstance(career_id, str):
+            raise KeyError(career_id)
+        target = career_id.encode("utf-8")
+        id_order = self._sections["id_order"]
+        i = bisect.bisect_left(id_order, target, key=lambda position: self._raw_string(self.records[position, 0]))
+        if i == len(id_order) or self._raw_string(self.records[id_order[i], 0]) != target:
+            raise KeyError(career_id)
+        return int(id_order[i])
+
+    def __getitem__(self, career_id):
+        return self.career_at(self.position_of(career_id))
+
+    def __iter__(self):
+        for position in range(self._num_careers):
+            yield self.id_at(position)
+
+    def __len__(self):
+        return self._num_careers
+
+    def __repr__(self):
+        return f"CareerStore({self.path!r}, {self._num_careers} careers)"
+
+    def vocabulary(self, field):
+        """Distinct terms of a field in store (sorted) order"""
+        return [self.string(string_id) for string_id in self._sections[field + ".vocabulary"]]
+
+    def term_column(self, field, term):
+        """Column of a term in a field's postings, or None when no career lists it"""
+        vocabulary = self._sections[field + ".vocabulary"]
+        target = term.encode("utf-8")
+        i = bisect.bisect_left(vocabulary, target, key=self._raw_string)
+        if i < len(vocabulary) and self._raw_string(vocabulary[i]) == target:
+            return i
+        return None
+
+    def postings(self, field):
+        """(indptr, indices) views of a field's CSC postings, without copying"""
+        return self._sections[field + ".indptr"], self._sections[field + ".indices"]
+
+    def compiled_index(self):
+        """Index over this store, reading its postings straight from the mapped buffer"""
+        if self._index is None:
+            self._index = StoreIndex(self)
+        return self._index
+
+
+class _CareerIds(Sequence):
+    """Career ids by row position, decoded on access"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, position):
+        return self.store.id_at(int(position))
+
+    def __len__(self):
+        return len(self.store)
+
+
+class _TermColumns(Mapping):
+    """term -> column lookups answered by binary search over a store's sorted vocabulary"""
+
+    def __init__(self, store, field):
+        self.store = store
+        self.field = field
+
+    def __getitem__(self, term):
+        column = self.store.term_column(self.field, term)
+        if column is None:
+            raise KeyError(term)
+        return column
+
+    def __iter__(self):
+        return iter(self.store.vocabulary(self.field))
+
+    def __len__(self):
+        return len(self.store.postings(self.field)[0]) - 1
+
+
+class StoreIndex:
+    """The CareerIndex interface, backed by a CareerStore instead of in-memory postings"""
+
+    def __init__(self, store):
+        self.career_db = store
+        self.version = store.version
+        self.career_ids = _CareerIds(store)
+        self._matchers = {}
+
+    def __len__(self):
+        return len(self.career_db)
+
+    def csc(self, field):
+        """Column lookup and zero-copy CSC arrays of a field's postings"""
+        indptr, indices = self.career_db.postings(field)
+        return _TermColumns(self.career_db, field), indptr, indices
+
+    def categories(self, field):
+        """A categorical field of every career as (per-row codes, distinct values)"""
+        string_ids = self.career_db.records[:, SCALAR_COLUMNS[field]]
+        distinct, codes = np.unique(string_ids, return_inverse=True)
+        return codes, [self.career_db.string(string_id) for string_id in distinct]
+
+    def work_environments(self):
+        """Work environment of every career as (per-row codes, distinct values)"""
+        return self.categories("work_environment")
+
+    def terms_containing(self, field, term):
+        """Indexed terms of the given field that contain this term"""
+        # The automaton is vocabulary-sized, so it is only built once partial matching is needed
+        matcher = self._matchers.get(field)
+        if matcher is None:
+            matcher = self._matchers[field] = SubstringMatcher(self.career_db.vocabulary(field))
+        return matcher.containing(term)
+
+
+def open_career_store(path):
+    """Open a compiled career store file"""
+    return CareerStore(path)
+
+
+def main():
+    """Compile the built-in career catalogue into a store file"""
+    from .career_database import CAREER_CATALOGUE
+
+    parser = argparse.ArgumentParser(description="Compile the career catalogue into a store file")
+    parser.add_argument("output", help="path of the store file to write")
+    args = parser.parse_args()
+
+    write_store(CAREER_CATALOGUE, args.output)
+    print(f"[OK] Wrote {len(CAREER_CATALOGUE)} careers to {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Import-Time Budget Check
+Measures the cold import of the recommender in fresh interpreters and fails over budget
+
+Usage:
+    python tests/check_import_time.py
+    python tests/check_import_time.py --budget 50 --runs 9
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULE = "recommender.recommendation_engine"
+
+# Median cumulative import time allowed, in milliseconds
+DEFAULT_BUDGET_MS = 75
+
+# Heavy modules that importing the recommender must leave for the code paths that use them
+DEFAULT_FORBIDDEN = ["numpy", "sqlite3", "concurrent.futures.process"]
+
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+    Returns its cumulative import time in ms and every module the import executed.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    cumulative_ms = None
+    executed = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (field.strip() for field in line[len("import time:"):].split("|"))
+        if not cumulative.isdigit():
+            continue  # Column header
+        executed.add(name)
+        if name == module:
+            cumulative_ms = int(cumulative) / 1000
+    return cumulative_ms, executed
+
+
+def main():
+    """Run the import-time check from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="module whose cold import is measured")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help="median import time allowed, in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to measure")
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN,
+                        help="modules the import must not execute")
+    args = parser.parse_args()
+
+    timings = []
+    eager = set()
+    for _ in range(args.runs):
+        cumulative_ms, executed = measure_import(args.module)
+        timings.append(cumulative_ms)
+        eager |= executed & set(args.forbid)
+
+    median_ms = statistics.median(timings)
+    print(f"{args.module}: median {median_ms:.1f} ms, min {min(timings):.1f} ms, "
+          f"max {max(timings):.1f} ms over {args.runs} runs (budget {args.budget:.0f} ms)")
+
+    success = True
+    if median_ms > args.budget:
+        print(f"[FAIL] Cold import is over budget by {median_ms - args.budget:.1f} ms")
+        success = False
+    if eager:
+        print(f"[FAIL] Imported eagerly: {', '.join(sorted(eager))}")
+        success = False
+    if success:
+        print("[OK] Import time within budget")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
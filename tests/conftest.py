@@ -0,0 +1,23 @@
+"""
+Test Configuration
+Makes the recommender, benchmark helpers and sibling test modules importable, and shares catalogue fixtures
+"""
+
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(TESTS_DIR)
+for path in (PROJECT_ROOT, TESTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from profiles import CATALOGUES, build_catalogue  # noqa: E402
+
+
+@pytest.fixture(scope="session", params=CATALOGUES)
+def catalogue(request):
+    """Each test catalogue in turn"""
+    return build_catalogue(request.param)
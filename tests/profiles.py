@@ -0,0 +1,59 @@
+"""
+Test Profiles
+Catalogues and randomized user profiles shared by the equivalence tests
+"""
+
+import random
+
+from benchmarks.synthetic import generate_career_database, generate_profiles
+from recommender.career_database import CAREER_CATALOGUE, ABBREVIATION_MAP
+from recommender.records import TERM_FIELDS, compile_catalogue
+
+PREFERENCES = ["remote work", "travel", "creative", "leadership", "team", "independent", "office"]
+
+# Catalogues every equivalence test runs on
+CATALOGUES = ("builtin", "synthetic")
+
+# Reference minimum score, as in CareerRecommender._top_careers
+MIN_SCORE = 20
+
+
+def build_catalogue(name):
+    """The built-in catalogue, or a small synthetic one sharing its vocabulary"""
+    if name == "builtin":
+        return CAREER_CATALOGUE
+    return compile_catalogue(generate_career_database(200, seed=7))
+
+
+def vocabulary(career_db):
+    return sorted({term for career in career_db.values() for field in TERM_FIELDS for term in career[field]})
+
+
+def random_profiles(career_db, count, seed):
+    """Catalogue terms, fragments of them, abbreviations and noise, in random case and order"""
+    rng = random.Random(seed)
+    terms = vocabulary(career_db)
+    pool = terms + [term[1:5] for term in terms] + list(ABBREVIATION_MAP) + ["Python", "xyz", "data"]
+    profiles = []
+    for _ in range(count):
+        profile = {field: [rng.choice(pool) for _ in range(rng.randint(0, 4))]
+                   for field in ("interests", "skills", "strengths")}
+        profile["preferences"] = rng.sample(PREFERENCES, rng.randint(0, 2))
+        profiles.append(profile)
+    return profiles + generate_profiles(career_db, count, seed=seed)
+
+
+def reference_ranking(recommender, user_profile, top_n):
+    """calculate_match_score over every career, stable-sorted best first"""
+    scored = []
+    for career_id, career_data in recommender.career_db.items():
+        score, explanations = recommender.calculate_match_score(user_profile, career_data)
+        if score > MIN_SCORE:
+            scored.append((career_id, score, explanations))
+    scored.sort(key=lambda entry: entry[1], reverse=True)
+    return scored[:top_n]
+
+
+def ranking(recommendations):
+    """(career_id, match_score, explanations) of recommendation dicts, comparable with reference_ranking"""
+    return [(rec["career_id"], rec["match_score"], rec["explanations"]) for rec in recommendations]
@@ -0,0 +1,122 @@
+"""
+Action Server
+Actions score on the executor and reply with what the recommender ranks
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("rasa_sdk")
+
+from rasa_sdk.executor import CollectingDispatcher  # noqa: E402
+
+from actions import actions  # noqa: E402
+from recommender.recommendation_engine import get_shared_recommender  # noqa: E402
+
+PROFILE = {"interests": ["tech", "ai"], "skills": ["python"], "strengths": [], "preferences": []}
+
+
+class Tracker:
+    """Just the tracker surface the actions read"""
+
+    def __init__(self, slots, entities=(), sender_id="conversation"):
+        self.slots = slots
+        self.latest_message = {"entities": list(entities)}
+        self.sender_id = sender_id
+
+    def get_slot(self, name):
+        return self.slots.get(name)
+
+
+def run(action, slots, **tracker_options):
+    dispatcher = CollectingDispatcher()
+    events = asyncio.run(action.run(dispatcher, Tracker(slots, **tracker_options), {}))
+    return dispatcher.messages, {event["name"]: event["value"] for event in events}
+
+
+def test_run_in_executor_leaves_the_event_loop():
+    async def worker_thread():
+        return await actions.run_in_executor(threading.current_thread)
+
+    assert asyncio.run(worker_thread()) is not threading.main_thread()
+
+
+def test_recommendations_are_scored_off_the_loop_and_match_the_recommender():
+    messages, slots = run(actions.ActionRecommendCareers(), dict(PROFILE))
+    expected = get_shared_recommender().recommend_careers(PROFILE, top_n=5)
+    assert slots["current_career_recommendations"] == [rec["career_id"] for rec in expected]
+    assert messages[0]["text"] == actions.format_recommendations(expected)
+
+
+def test_follow_up_actions_use_the_top_recommendation():
+    _, slots = run(actions.ActionRecommendCareers(), dict(PROFILE))
+    top = slots["current_career_recommendations"][0]
+    messages, _ = run(actions.ActionProvideCareerDetails(), dict(PROFILE, **slots))
+    assert messages[0]["text"] == actions.career_details_text(top)
+    messages, _ = run(actions.ActionGenerateLearningPlan(), dict(PROFILE, **slots))
+    assert messages[0]["text"] == actions.learning_plan_text(top)
+
+
+def test_concurrent_conversations_do_not_block_each_other():
+    async def conversations():
+        dispatchers = [CollectingDispatcher() for _ in range(20)]
+        await asyncio.gather(*[
+            actions.ActionRecommendCareers().run(dispatcher, Tracker(dict(PROFILE), sender_id=str(i)), {})
+            for i, dispatcher in enumerate(dispatchers)])
+        return [dispatcher.messages[0]["text"] for dispatcher in dispatchers]
+
+    texts = asyncio.run(conversations())
+    assert len(set(texts)) == 1
+
+
+def test_recommendation_payload_replaces_the_text_parts():
+    messages, _ = run(actions.ActionRecommendCareers(), dict(PROFILE))
+    text, payload = messages[0]["text"], messages[0]["json_message"]
+    expected = get_shared_recommender().recommend_careers(PROFILE, top_n=5)
+
+    # The REST channel sends the text as its blank-line separated parts, then the payload
+    assert payload["type"] == "career_recommendations"
+    assert payload["version"] == actions.PAYLOAD_VERSION
+    assert payload["text_parts"] == len(text.strip().split("\n\n")) > 1
+    assert [card["career_id"] for card in payload["recommendations"]] == [rec["career_id"] for rec in expected[:3]]
+    for card, rec in zip(payload["recommendations"], expected):
+        assert (card["name"], card["match_score"], card["why_it_fits"]) == \
+            (rec["career_name"], rec["match_score"], rec["why_it_fits"])
+        assert card["key_skills"] == rec["key_requirements"][:3]
+
+
+def test_no_payload_without_recommendations():
+    messages, slots = run(actions.ActionRecommendCareers(), {"interests": ["zzzz"]})
+    assert "json_message" not in messages[0]
+    assert list(slots) == ["career_ranking"]
+
+
+def test_export_replies_at_once_with_a_download_reference(tmp_path, monkeypatch):
+    from recommender import export
+
+    release = threading.Event()
+
+    def render_pdf(plan):
+        release.wait(5)
+        return b"%PDF-1.4"
+
+    queue = export.ExportQueue(export.ExportStore(str(tmp_path)))
+    monkeypatch.setattr(export, "render_pdf", render_pdf)
+    monkeypatch.setattr(actions, "get_export_queue", lambda: queue)
+
+    _, slots = run(actions.ActionRecommendCareers(), dict(PROFILE))
+    slots = dict(PROFILE, **slots)
+    messages, _ = run(actions.ActionExportCareerPlan(), slots)
+    payload = messages[0]["json_message"]
+    key = export.export_key(slots["career_ranking"]["profile_hash"], slots["career_ranking"]["version"])
+    # Tracker events keep every json_message, so the PDF itself never travels in one
+    assert payload == {"type": "career_plan_export", "version": actions.PAYLOAD_VERSION, "status": "pending",
+                       "key": key, "url": export.export_url(key)}
+
+    release.set()
+    queue.submit(PROFILE, slots["career_ranking"], get_shared_recommender()).result(5)
+    messages, _ = run(actions.ActionExportCareerPlan(), slots)
+    assert messages[0]["json_message"]["status"] == "ready"
+    assert messages[0]["text"].endswith("📥 *Your PDF career plan is ready to download!*")
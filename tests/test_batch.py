@@ -0,0 +1,25 @@
+"""
+Batch Recommendations
+A batch returns what scoring each profile on its own would, in or out of process
+"""
+
+from profiles import random_profiles
+from recommender.career_database import CAREER_DATABASE
+from recommender.recommendation_engine import CareerRecommender
+
+
+def test_batch_matches_single_profiles(catalogue):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False)
+    profiles = random_profiles(catalogue, 100, seed=2)
+    assert recommender.recommend_careers_batch(profiles, 5) == \
+        [recommender.recommend_careers(profile, 5) for profile in profiles]
+
+
+def test_worker_processes_score_the_callers_catalogue():
+    careers = {career_id: CAREER_DATABASE[career_id]
+               for career_id in ("software_engineer", "data_scientist", "graphic_designer")}
+    recommender = CareerRecommender(career_db=careers, concept_depth=2)
+    profiles = [{"interests": ["design"]}, {"interests": ["health"]}, {"interests": ["tech"], "skills": ["python"]}]
+    in_process = recommender.recommend_careers_batch(profiles)
+    assert recommender.recommend_careers_batch(profiles, workers=2) == in_process
+    assert {rec["career_id"] for recs in in_process for rec in recs} <= set(careers)
@@ -0,0 +1,78 @@
+"""
+Recommendation Cache
+LRU/TTL bookkeeping, version invalidation, and cached results matching uncached ones
+"""
+
+from profiles import random_profiles
+from recommender.cache import RecommendationCache, canonical_profile, profile_hash, profile_key
+from recommender.recommendation_engine import CareerRecommender
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_evicts_least_recently_used():
+    cache = RecommendationCache(maxsize=2, ttl=None)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = RecommendationCache(ttl=10, clock=clock)
+    cache.put("a", 1)
+    clock.now = 10
+    assert cache.get("a") == 1
+    clock.now = 10.5
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["expirations"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_version_change_invalidates_and_stale_puts_are_dropped():
+    cache = RecommendationCache()
+    cache.check_version("v1")
+    cache.put("a", 1, "v1")
+    cache.check_version("v1")
+    assert cache.get("a") == 1
+
+    cache.check_version("v2")
+    assert cache.get("a") is None
+    assert cache.stats()["invalidations"] == 1
+    cache.put("b", 2, "v1")  # Finished scoring on the old catalogue after the swap
+    assert cache.get("b") is None
+
+
+def test_equivalent_profiles_share_a_key():
+    first = {"interests": ["Tech ", "AI"], "skills": ["Python"]}
+    second = {"interests": ["ai", "tech"], "skills": ["python"], "strengths": [], "preferences": []}
+    assert profile_key(canonical_profile(first)) == profile_key(canonical_profile(second))
+    assert profile_hash(first) == profile_hash(second)
+    assert profile_hash(first) != profile_hash({"interests": ["tech"]})
+
+
+def test_cached_results_match_uncached(catalogue):
+    uncached = CareerRecommender(career_db=catalogue, use_cache=False)
+    cached = CareerRecommender(career_db=catalogue, cache=RecommendationCache())
+    profiles = random_profiles(catalogue, 60, seed=3)
+    expected = [uncached.recommend_careers(profile, 5) for profile in profiles]
+    assert [cached.recommend_careers(profile, 5) for profile in profiles] == expected
+    assert [cached.recommend_careers(profile, 5) for profile in profiles] == expected
+    assert cached.cache.stats()["hits"] >= len(profiles)
+
+
+def test_cached_explanations_quote_the_callers_terms():
+    recommender = CareerRecommender(cache=RecommendationCache())
+    recommender.recommend_careers({"interests": ["coding", "technology"], "skills": ["java", "python"]})
+    profile = {"interests": ["Technology", "Coding"], "skills": ["Python", "Java"]}
+    assert recommender.recommend_careers(profile) == CareerRecommender(use_cache=False).recommend_careers(profile)
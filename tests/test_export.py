@@ -0,0 +1,134 @@
+"""
+Career Plan Export
+Exports are content-addressed, rendered once off the request path and served over HTTP by key
+"""
+
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from recommender import export
+from recommender.export import ExportQueue, ExportStore, export_key, export_url, start_export_server
+from recommender.ranking import compact_ranking
+from recommender.recommendation_engine import CareerRecommender
+
+PROFILE = {"interests": ["tech"], "skills": ["python"], "strengths": [], "preferences": []}
+
+
+class Renderer:
+    """Stands in for render_pdf: blocks until released, then returns fake PDF bytes or fails"""
+
+    def __init__(self, error=None):
+        self.release = threading.Event()
+        self.error = error
+        self.plans = []
+
+    def __call__(self, plan):
+        self.release.wait(5)
+        self.plans.append(plan)
+        if self.error is not None:
+            raise self.error
+        return b"%PDF-1.4 " + ",".join(career["details"]["name"] for career in plan["careers"]).encode()
+
+
+@pytest.fixture
+def recommender():
+    return CareerRecommender(use_cache=False)
+
+
+@pytest.fixture
+def ranking(recommender):
+    return compact_ranking(recommender.recommend_careers(PROFILE), PROFILE, recommender.version)
+
+
+def test_export_key_is_stable():
+    key = export_key("0123456789abcdef", "v1")
+    assert key == export_key("0123456789abcdef", "v1")
+    assert len(key) == 40 and set(key) <= set("0123456789abcdef")
+    assert key != export_key("0123456789abcdef", "v2")
+    assert key != export_key("fedcba9876543210", "v1")
+    assert export_url(key) == f"/exports/{key}.pdf"
+
+
+def test_store_writes_atomically(tmp_path):
+    store = ExportStore(str(tmp_path))
+    key = export_key("profile", "v1")
+    assert store.get(key) is None and store.read(key) is None
+
+    path = store.put(key, b"first")
+    assert store.get(key) == path == os.path.join(str(tmp_path), key[:2], f"{key}.pdf")
+    store.put(key, b"second")
+    assert store.read(key) == b"second"
+    assert os.listdir(os.path.dirname(path)) == [f"{key}.pdf"]
+
+
+def test_queue_renders_each_plan_once(tmp_path, monkeypatch, recommender, ranking):
+    renderer = Renderer()
+    monkeypatch.setattr(export, "render_pdf", renderer)
+    queue = ExportQueue(ExportStore(str(tmp_path)))
+    key = export_key(ranking["profile_hash"], ranking["version"])
+
+    first = queue.submit(PROFILE, ranking, recommender)
+    assert queue.submit(PROFILE, ranking, recommender) is first
+    assert queue.is_pending(key)
+    renderer.release.set()
+    assert first.result(5) == key
+    assert not queue.is_pending(key)
+
+    # Already stored, so answered at once without rendering again
+    again = queue.submit(PROFILE, ranking, recommender)
+    assert again is not first and again.done() and again.result() == key
+    assert len(renderer.plans) == 1
+    assert [career["recommendation"]["career_id"] for career in renderer.plans[0]["careers"]] == \
+        [career["id"] for career in ranking["careers"][:export.EXPORTED_CAREERS]]
+
+
+def test_failed_render_is_reported_and_not_stored(tmp_path, monkeypatch, recommender, ranking):
+    renderer = Renderer(RuntimeError("no fonts"))
+    renderer.release.set()
+    monkeypatch.setattr(export, "render_pdf", renderer)
+    queue = ExportQueue(ExportStore(str(tmp_path)))
+
+    future = queue.submit(PROFILE, ranking, recommender)
+    with pytest.raises(RuntimeError, match="no fonts"):
+        future.result(5)
+    key = export_key(ranking["profile_hash"], ranking["version"])
+    assert queue.store.get(key) is None
+    assert not queue.is_pending(key)
+
+
+def test_download_server_status_codes(tmp_path, monkeypatch, recommender, ranking):
+    renderer = Renderer()
+    monkeypatch.setattr(export, "render_pdf", renderer)
+    queue = ExportQueue(ExportStore(str(tmp_path)))
+    server = start_export_server(queue, host="127.0.0.1", port=0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def fetch(path):
+        try:
+            with urllib.request.urlopen(base + path, timeout=5) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as error:
+            return error.code, error.headers, b""
+
+    try:
+        key = export_key(ranking["profile_hash"], ranking["version"])
+        assert fetch(export_url(key))[0] == 404
+
+        future = queue.submit(PROFILE, ranking, recommender)
+        status, headers, _ = fetch(export_url(key))
+        assert (status, headers["Retry-After"]) == (202, str(export.RETRY_AFTER_SECONDS))
+
+        renderer.release.set()
+        future.result(5)
+        status, headers, body = fetch(export_url(key) + "?download=1")
+        assert (status, headers["Content-Type"], body) == (200, "application/pdf", queue.store.read(key))
+
+        for path in ("/", f"/exports/{key}", f"/exports/{key.upper()}.pdf", "/exports/../secret.pdf"):
+            assert fetch(path)[0] == 404, path
+    finally:
+        server.shutdown()
+        server.server_close()
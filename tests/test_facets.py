@@ -0,0 +1,67 @@
+"""
+Career Facets
+Facet masks and queries select exactly the careers a plain filter over the catalogue would
+"""
+
+import random
+
+import pytest
+
+from recommender.facets import FACET_FIELDS
+from recommender.recommendation_engine import CareerRecommender
+
+
+def brute_force(catalogue, filters):
+    """career_ids whose every filtered facet holds one of the wanted values, case-insensitively"""
+    wanted = {field: {value.lower() for value in ([values] if isinstance(values, str) else values)}
+              for field, values in filters.items() if values}
+    return [career_id for career_id, career in catalogue.items()
+            if all(career[field].lower() in values for field, values in wanted.items())]
+
+
+def random_filters(catalogue, count, seed):
+    rng = random.Random(seed)
+    values = {field: sorted({career[field] for career in catalogue.values()}) for field in FACET_FIELDS}
+    filters = []
+    for _ in range(count):
+        chosen = {}
+        for field in rng.sample(FACET_FIELDS, rng.randint(1, 3)):
+            picked = rng.sample(values[field], min(len(values[field]), rng.randint(0, 2)))
+            chosen[field] = [value.upper() if rng.random() < 0.2 else value for value in picked]
+        if rng.random() < 0.2:
+            chosen["domain"] = "No Such Domain"
+        filters.append(chosen)
+    return filters
+
+
+def test_mask_and_query_match_brute_force(catalogue):
+    facets = CareerRecommender(career_db=catalogue, use_cache=False).facets
+    career_ids = list(catalogue)
+    for filters in random_filters(catalogue, 100, seed=6):
+        expected = brute_force(catalogue, filters)
+        mask = facets.mask(filters)
+        selected = career_ids if mask is None else [career_ids[row] for row in mask.nonzero()[0]]
+        assert selected == expected, filters
+
+        result = facets.query(filters)
+        assert list(result["careers"]) == expected
+        assert result["total"] == len(expected)
+        domains = {}
+        for career_id in expected:
+            domains[catalogue[career_id]["domain"]] = domains.get(catalogue[career_id]["domain"], 0) + 1
+        assert result["facets"]["domain"] == domains
+
+
+def test_empty_filters_do_not_constrain(catalogue):
+    facets = CareerRecommender(career_db=catalogue, use_cache=False).facets
+    assert facets.mask(None) is None
+    assert facets.mask({"domain": []}) is None
+    assert facets.query({})["total"] == len(catalogue)
+
+
+def test_unknown_facet_is_rejected(catalogue):
+    facets = CareerRecommender(career_db=catalogue, use_cache=False).facets
+    with pytest.raises(ValueError, match="Unknown facet 'colour'"):
+        facets.mask({"colour": "blue"})
+    with pytest.raises(ValueError):
+        facets.matching_rows({"colour": ["blue"]})
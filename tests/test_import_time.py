@@ -0,0 +1,33 @@
+"""
+Import-Time Budget
+Runs check_import_time's measurement as part of the test suite
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+from check_import_time import DEFAULT_BUDGET_MS, DEFAULT_FORBIDDEN, DEFAULT_MODULE, measure_import
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUNS = 3
+
+
+def test_recommender_imports_within_budget():
+    timings = []
+    eager = set()
+    for _ in range(RUNS):
+        cumulative_ms, executed = measure_import(DEFAULT_MODULE)
+        timings.append(cumulative_ms)
+        eager |= executed & set(DEFAULT_FORBIDDEN)
+
+    assert statistics.median(timings) <= DEFAULT_BUDGET_MS
+    assert not eager, f"Imported eagerly: {', '.join(sorted(eager))}"
+
+
+def test_lazy_modules_are_reachable_from_their_package():
+    # asyncio reads concurrent.futures as an attribute, after the recommender registered it lazily
+    code = f"import {DEFAULT_MODULE}, asyncio, concurrent; assert not asyncio.iscoroutinefunction(concurrent.futures.wait)"
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)
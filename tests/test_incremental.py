@@ -0,0 +1,55 @@
+"""
+Incremental Scoring
+A conversation scored turn by turn ranks like scoring its whole profile afresh
+"""
+
+import random
+
+from profiles import random_profiles
+from recommender.incremental import IncrementalScorer
+from recommender.recommendation_engine import CareerRecommender
+
+
+def test_conversation_matches_full_scoring(catalogue):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False)
+    sources = random_profiles(catalogue, 40, seed=2)
+
+    # One conversation growing and shrinking its profile turn by turn
+    profile = {"interests": [], "skills": [], "strengths": [], "preferences": []}
+    rng = random.Random(3)
+    for turn, source in enumerate(sources):
+        field = rng.choice(list(profile))
+        if profile[field] and rng.random() < 0.3:
+            profile[field].pop(rng.randrange(len(profile[field])))
+        elif source[field]:
+            profile[field].append(rng.choice(source[field]))
+        snapshot = {field: list(terms) for field, terms in profile.items()}
+        assert recommender.recommend_careers(snapshot, 5, conversation_id="conversation") == \
+            recommender.recommend_careers(snapshot, 5), (turn, snapshot)
+
+
+def test_state_holds_only_touched_careers(catalogue):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False)
+    scorer = IncrementalScorer(recommender.matrix, recommender.concepts, recommender.normalizer)
+    empty = scorer.update("quiet", {})
+    assert len(empty.rows) == 0
+
+    term = next(iter(catalogue.values()))["key_skills"][0]
+    state = scorer.update("narrow", {"skills": [term]})
+    assert 0 < len(state.rows) < len(catalogue)
+    assert scorer.nbytes == empty.nbytes + state.nbytes
+
+    # Removing the term returns every touched career to zero, which drops it
+    state = scorer.update("narrow", {"skills": []})
+    assert len(state.rows) == 0
+    assert scorer.nbytes == empty.nbytes * 2
+
+
+def test_memory_budget_evicts_least_recent_conversations(catalogue):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False)
+    scorer = IncrementalScorer(recommender.matrix, recommender.concepts, recommender.normalizer)
+    scorer.max_bytes = scorer.update("first", {}).nbytes * 2
+    scorer.update("second", {})
+    scorer.update("third", {})
+    assert list(scorer.states) == ["second", "third"]
+    assert scorer.nbytes == sum(state.nbytes for state in scorer.states.values())
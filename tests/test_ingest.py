@@ -0,0 +1,83 @@
+"""
+Career Ingestion
+Valid records stream into a store in canonical form; invalid ones are counted and skipped
+"""
+
+import io
+import json
+
+import pytest
+
+from recommender.ingest import InvalidRecord, ingest, read_csv, read_jsonl
+from recommender.store import StoreWriter, open_career_store
+
+CSV = """career_id,name,domain,key_interests,key_skills,key_strengths
+data_analyst,Data Analyst,Technology,Data; Statistics,SQL;Machine Learning,Detail Oriented
+,Park Ranger,Environment,Nature,First Aid,
+no_skills,No Skills,Technology,Data,,
+data_analyst,Duplicate,Technology,Data,SQL,
+too_wide,Too Wide,Technology,Data,SQL,Focus,extra
+"""
+
+JSONL = [
+    {"career_id": "nurse", "name": "Nurse", "domain": "Healthcare",
+     "key_interests": ["Healthcare", "healthcare"], "key_skills": ["Patient Care"]},
+    "not json",
+    ["not", "an", "object"],
+    {"name": "Chef", "domain": "Hospitality", "key_interests": "Cooking", "key_skills": [1, 2]},
+    {"name": "Welder", "domain": 3, "key_interests": ["Metal"], "key_skills": ["Welding"]},
+    {},
+]
+
+
+def jsonl_lines():
+    return "\n".join(line if isinstance(line, str) else json.dumps(line) for line in JSONL) + "\n\n"
+
+
+def ingest_into(tmp_path, rows, **options):
+    path = str(tmp_path / "careers.store")
+    with StoreWriter(path) as writer:
+        report = ingest(rows, writer, **options)
+    return report, open_career_store(path)
+
+
+def test_csv_ingest_counts_rejections(tmp_path):
+    report, store = ingest_into(tmp_path, read_csv(io.StringIO(CSV)))
+    assert (report.records, report.written) == (5, 2)
+    assert report.invalid == {"missing key_skills": 1, "Duplicate career id": 1, "more values than header columns": 1}
+    assert report.errors == ["line 4: missing key_skills", "line 5: Duplicate career id: data_analyst",
+                             "line 6: more values than header columns"]
+    assert report.lines()[0] == "5 records read, 2 careers written, 3 invalid"
+
+    assert list(store) == ["data_analyst", "park_ranger"]
+    analyst = store["data_analyst"]
+    assert list(analyst["key_interests"]) == ["data", "statistics"]
+    assert list(analyst["key_skills"]) == ["sql", "machine_learning"]
+    assert list(analyst["key_strengths"]) == ["detail_oriented"]
+    assert list(store["park_ranger"]["key_strengths"]) == []
+
+
+def test_jsonl_ingest_counts_rejections(tmp_path):
+    report, store = ingest_into(tmp_path, read_jsonl(io.StringIO(jsonl_lines())))
+    assert (report.records, report.written) == (6, 1)
+    assert sum(report.invalid.values()) == 5
+    assert report.invalid["invalid JSON"] == 1
+    assert report.invalid["a JSON line must hold an object"] == 1
+    assert report.invalid["'key_skills' must be a list of strings or separated text"] == 1
+    assert report.invalid["'domain' must be text"] == 1
+    assert report.invalid["missing name, domain, key_interests, key_skills"] == 1
+    assert list(store) == ["nurse"]
+    assert list(store["nurse"]["key_interests"]) == ["healthcare"]
+
+
+def test_strict_ingest_stops_at_the_first_invalid_record(tmp_path):
+    with pytest.raises(InvalidRecord, match="line 4: missing key_skills"):
+        ingest_into(tmp_path, read_csv(io.StringIO(CSV)), strict=True)
+
+
+def test_columns_and_separator(tmp_path):
+    rows = [(1, {"Title": "Baker", "Field": "Food", "Likes": "Baking|Early Mornings", "Can": "Ovens"}, None)]
+    report, store = ingest_into(tmp_path, rows, separator="|", columns={
+        "name": "Title", "domain": "Field", "key_interests": "Likes", "key_skills": "Can"})
+    assert report.written == 1
+    assert list(store["baker"]["key_interests"]) == ["baking", "early_mornings"]
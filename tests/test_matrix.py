@@ -0,0 +1,20 @@
+"""
+Scoring Matrix
+The vectorized recommender ranks exactly like calculate_match_score over every career
+"""
+
+from profiles import random_profiles, ranking, reference_ranking
+from recommender.recommendation_engine import CareerRecommender
+
+
+def test_vectorized_matches_calculate_match_score(catalogue):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False)
+    for i, profile in enumerate(random_profiles(catalogue, 150, seed=1)):
+        top_n = (1, 3, 5, 25)[i % 4]
+        assert ranking(recommender.recommend_careers(profile, top_n)) == \
+            reference_ranking(recommender, profile, top_n), profile
+
+
+def test_empty_profile_recommends_nothing(catalogue):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False)
+    assert recommender.recommend_careers({}) == []
@@ -0,0 +1,65 @@
+"""
+Term Normalizer
+User interests normalize to the served catalogue's terms, whatever their case, separators or plurals
+"""
+
+import pytest
+
+from recommender.career_database import ABBREVIATION_MAP, CAREER_DATABASE
+from recommender.normalizer import TermNormalizer, singular, split_words
+from recommender.records import compile_catalogue
+from recommender.recommendation_engine import CareerRecommender
+
+VOCABULARY = {"design", "machine_learning", "data_science", "statistics", "animal"}
+
+
+@pytest.fixture
+def normalizer():
+    return TermNormalizer(ABBREVIATION_MAP, vocabulary=VOCABULARY)
+
+
+@pytest.mark.parametrize("word, stem", [
+    ("technologies", "technology"), ("classes", "class"), ("computers", "computer"),
+    ("statistics", "statistic"), ("analysis", "analysis"), ("status", "status"), ("ties", "tie"),
+])
+def test_singular(word, stem):
+    assert singular(word) == stem
+
+
+def test_split_words():
+    assert split_words(" Machine_Learning/AI-ops  now ") == ["machine", "learning", "ai", "ops", "now"]
+
+
+@pytest.mark.parametrize("term, expected", [
+    ("AI", ["artificial_intelligence", "machine_learning"]),
+    ("ai/ml", ["artificial_intelligence", "machine_learning", "data_science"]),
+    ("UX", ["user_experience", "design"]),
+    ("Machine Learning", ["machine_learning"]),
+    ("machine-learning", ["machine_learning"]),
+    ("designs", ["design"]),
+    ("Animals", ["animal"]),
+    ("statistics", ["statistics"]),
+    ("Wildlife Photography", ["wildlife_photography"]),
+    ("", [""]),
+])
+def test_normalize(normalizer, term, expected):
+    assert list(normalizer.normalize(term)) == expected
+
+
+def test_plurals_resolve_against_the_served_catalogue():
+    careers = {
+        "zookeeper": dict(CAREER_DATABASE["software_engineer"], name="Zookeeper", domain="Animal Care",
+                          key_interests=["animal", "conservation"], key_skills=["husbandry"],
+                          key_strengths=["patience"]),
+        "software_engineer": CAREER_DATABASE["software_engineer"],
+    }
+    recommender = CareerRecommender(career_db=compile_catalogue(careers), use_cache=False)
+    assert recommender.normalize_interest("Animals") == ["animal"]
+
+    profile = {"interests": ["animals"], "skills": ["husbandry"]}
+    recommendations = recommender.recommend_careers(profile)
+    assert [rec["career_id"] for rec in recommendations] == ["zookeeper"]
+    assert recommender.recommend_careers(profile, conversation_id="zoo") == recommendations
+
+    # The built-in catalogue has no such term, so there the plural is left alone
+    assert CareerRecommender(use_cache=False).normalize_interest("Animals") == ["animals"]
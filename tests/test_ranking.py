@@ -0,0 +1,43 @@
+"""
+Conversation Rankings
+A compact ranking stored in a slot expands back into the recommendations it was made from
+"""
+
+import json
+
+from profiles import random_profiles
+from recommender.ranking import RANKING_FORMAT, compact_ranking, expand_ranking, ranking_matches
+from recommender.recommendation_engine import CareerRecommender
+
+
+def test_expanded_ranking_equals_fresh_recommendations(catalogue):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False)
+    for profile in random_profiles(catalogue, 100, seed=10):
+        recommendations = recommender.recommend_careers(profile, 5)
+        # Slots travel through the tracker as JSON
+        ranking = json.loads(json.dumps(compact_ranking(recommendations, profile, recommender.version)))
+        assert ranking_matches(ranking, profile, recommender.version)
+        assert expand_ranking(ranking, recommender) == recommendations, profile
+
+
+def test_ranking_is_invalidated_by_profile_version_and_format():
+    recommender = CareerRecommender(use_cache=False)
+    profile = {"interests": ["tech"], "skills": ["python"], "strengths": [], "preferences": []}
+    ranking = compact_ranking(recommender.recommend_careers(profile), profile, recommender.version)
+
+    # Order and case do not change the profile hash; a new term does
+    assert ranking_matches(ranking, {"skills": ["Python"], "interests": ["tech"]}, recommender.version)
+    assert not ranking_matches(ranking, dict(profile, skills=["python", "sql"]), recommender.version)
+    assert not ranking_matches(ranking, profile, "another-version")
+    assert not ranking_matches(dict(ranking, format=RANKING_FORMAT + 1), profile, recommender.version)
+    assert not ranking_matches(None, profile, recommender.version)
+    assert not ranking_matches({}, profile, recommender.version)
+
+
+def test_careers_missing_from_the_catalogue_are_skipped():
+    recommender = CareerRecommender(use_cache=False)
+    profile = {"interests": ["tech"], "skills": ["python"]}
+    recommendations = recommender.recommend_careers(profile)
+    ranking = compact_ranking(recommendations, profile, recommender.version)
+    ranking["careers"].insert(1, {"id": "retired_career", "scores": [100, 0, 0, 0], "matched": {}})
+    assert expand_ranking(ranking, recommender) == recommendations
@@ -0,0 +1,58 @@
+"""
+Render Cache
+Pre-rendered replies follow the catalogue version and cover the whole catalogue
+"""
+
+import concurrent.futures
+
+import pytest
+
+pytest.importorskip("rasa_sdk")
+
+from actions import actions  # noqa: E402
+from recommender.recommendation_engine import get_shared_recommender  # noqa: E402
+
+
+def test_warm_covers_every_career():
+    catalogue = get_shared_recommender().career_db
+    cache = actions.RenderCache()
+    cache.warm()
+    assert cache.capacity == len(actions.RENDERERS) * len(catalogue)
+    version = get_shared_recommender().version
+    for career_id in catalogue:
+        assert cache.get("details", career_id, version) == actions.career_details_text(career_id)
+        assert cache.get("learning_plan", career_id, version) == actions.learning_plan_text(career_id)
+
+
+def test_cap_from_the_environment(monkeypatch):
+    monkeypatch.setenv(actions.RENDER_CACHE_SIZE_ENV, "6")
+    cache = actions.RenderCache()
+    cache.warm()
+    assert cache.capacity == 6
+    assert len(cache.entries) == 6
+    assert actions.render_capacity(2) == 4
+
+
+def test_renders_are_keyed_by_catalogue_version(monkeypatch):
+    # Warm-ups run inline, so follow() has finished re-rendering when it returns
+    class InlineExecutor:
+        def submit(self, func, *args):
+            future = concurrent.futures.Future()
+            future.set_result(func(*args))
+            return future
+
+    monkeypatch.setattr(actions, "get_executor", InlineExecutor)
+    recommender = get_shared_recommender()
+    cache = actions.RenderCache()
+    cache.follow("old", 3)
+    assert cache.capacity == 3 * len(actions.RENDERERS)
+    cache.put("details", "software_engineer", "old", "stale text")
+    assert cache.get("details", "software_engineer", "old") == "stale text"
+    assert cache.get("details", "software_engineer", "new") is None
+
+    # A new version drops the old renders and warms the new catalogue
+    cache.follow(recommender.version, len(recommender.career_db))
+    assert cache.get("details", "software_engineer", "old") is None
+    assert cache.get("details", "software_engineer", recommender.version) == \
+        actions.career_details_text("software_engineer")
+    assert len(cache.entries) == len(actions.RENDERERS) * len(recommender.career_db)
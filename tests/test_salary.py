@@ -0,0 +1,65 @@
+"""
+Career Salary Index
+Salary text parses into bands, and band queries select what a scan over those bands would
+"""
+
+import math
+import random
+
+import pytest
+
+from recommender.career_database import CAREER_DATABASE
+from recommender.records import compile_catalogue
+from recommender.recommendation_engine import CareerRecommender
+from recommender.salary import parse_salary_range
+
+INF = math.inf
+
+
+@pytest.mark.parametrize("text, band", [
+    ("$80,000 - $150,000", (80_000, 150_000)),
+    ("$150,000 - $80,000", (80_000, 150_000)),
+    ("$95k-$120K", (95_000, 120_000)),
+    ("$1.2M - $2M", (1_200_000, 2_000_000)),
+    ("$95,000", (95_000, 95_000)),
+    ("$120,000+", (120_000, INF)),
+    ("Up to $60,000", (0, 60_000)),
+    ("under $45k", (0, 45_000)),
+    ("From $90k", (90_000, INF)),
+    ("Over $200,000", (200_000, INF)),
+])
+def test_parse_salary_range(text, band):
+    assert parse_salary_range(text) == band
+
+
+@pytest.mark.parametrize("text", [None, "", "Competitive", "Varies by employer", "$", "k - M"])
+def test_malformed_salary_text_has_no_band(text):
+    assert parse_salary_range(text) is None
+
+
+SALARY_TEXTS = ["$40,000 - $60,000", "$80,000 - $150,000", "$95k", "$120,000+", "Up to $60,000",
+                "From $90k", "Over $200,000", "Competitive", "$55,000 - $75,000", "$1.2M - $2M"]
+
+
+def test_salary_index_matches_brute_force():
+    rng = random.Random(8)
+    careers = {}
+    for career_id, career in CAREER_DATABASE.items():
+        careers[career_id] = dict(career, salary_range=rng.choice(SALARY_TEXTS))
+    catalogue = compile_catalogue(careers)
+    salaries = CareerRecommender(career_db=catalogue, use_cache=False).salaries
+    bands = [parse_salary_range(career["salary_range"]) for career in catalogue.values()]
+
+    bounds = [None, 0, 45_000, 60_000, 60_001, 90_000, 150_000, 250_000, 3_000_000]
+    for min_salary in bounds:
+        for max_salary in bounds:
+            if min_salary is None and max_salary is None:
+                continue
+            expected = [row for row, band in enumerate(bands)
+                        if band is not None
+                        and (min_salary is None or band[1] >= min_salary)
+                        and (max_salary is None or band[0] <= max_salary)]
+            assert salaries.rows(min_salary, max_salary).tolist() == expected, (min_salary, max_salary)
+    # Without bounds nothing is filtered, unparsed salaries included
+    assert salaries.mask() is None
+    assert salaries.rows().tolist() == list(range(len(catalogue)))
@@ -0,0 +1,29 @@
+"""
+Keyword Search
+The full-text index returns what scanning every career would, page by page
+"""
+
+import random
+
+from profiles import vocabulary
+from recommender.career_database import _scan_careers_by_keywords
+from recommender.search import CareerSearchIndex
+
+
+def comparable(results):
+    return [(career_id, result["score"], result["matched_keywords"]) for career_id, result in results.items()]
+
+
+def test_fts_search_matches_full_scan(catalogue):
+    search_index = CareerSearchIndex(catalogue)
+    rng = random.Random(5)
+    terms = vocabulary(catalogue)
+    keyword_sets = [[rng.choice(terms)[:rng.randint(1, 6)] for _ in range(rng.randint(1, 4))]
+                    for _ in range(40)]
+    keyword_sets += [["Data", "AI", "", "x"], ["machine lea"], ['"quote'], ["engineer", "engineer"]]
+    for keywords in keyword_sets:
+        for prefix in (False, True):
+            for limit, offset in ((None, 0), (5, 0), (5, 3)):
+                assert comparable(search_index.search(keywords, limit, offset, prefix)) == \
+                    comparable(_scan_careers_by_keywords(keywords, catalogue, limit, offset, prefix)), \
+                    (keywords, prefix, limit, offset)
@@ -0,0 +1,46 @@
+"""
+Concept Similarity
+Similar vocabulary terms earn interest points only at or above the similarity threshold
+"""
+
+import pytest
+
+from profiles import random_profiles, ranking, reference_ranking
+from recommender.career_database import CAREER_DATABASE
+from recommender.recommendation_engine import CareerRecommender
+from recommender.similarity import get_concept_similarity
+
+# "designing" is about 0.61 similar to the catalogue's "design"
+PROFILE = {"interests": ["designing"], "skills": ["figma", "sketch"]}
+
+
+def test_similar_respects_the_threshold():
+    similarity = get_concept_similarity(CareerRecommender(use_cache=False).index)
+    neighbours = similarity.neighbours("designing")
+    assert neighbours[0][0] == "design"
+    assert all(first >= second for (_, first), (_, second) in zip(neighbours, neighbours[1:]))
+    for threshold in (0.0, 0.3, 0.5, 0.6, 0.65, 1.0):
+        assert similarity.similar("designing", threshold) == \
+            [(term, value) for term, value in neighbours if value >= threshold]
+    assert similarity.similar_terms(0.5) is similarity.similar_terms(0.5)
+
+
+@pytest.mark.parametrize("threshold, points", [(0.5, 36), (0.6, 36), (0.65, 0), (None, 0)])
+def test_interest_points_from_similar_terms(threshold, points):
+    recommender = CareerRecommender(use_cache=False, similarity_threshold=threshold)
+    assert recommender._calculate_interest_score(["designing"], CAREER_DATABASE["ux_ui_designer"]) == points
+
+
+def test_threshold_changes_the_ranking():
+    lenient = CareerRecommender(use_cache=False, similarity_threshold=0.5)
+    disabled = CareerRecommender(use_cache=False, similarity_threshold=None)
+    assert [rec["career_id"] for rec in lenient.recommend_careers(PROFILE, 3)] == ["ux_ui_designer", "architect"]
+    assert [rec["career_id"] for rec in disabled.recommend_careers(PROFILE, 3)] == ["ux_ui_designer"]
+
+
+@pytest.mark.parametrize("threshold", [0.3, None])
+def test_vectorized_scoring_matches_reference_at_any_threshold(catalogue, threshold):
+    recommender = CareerRecommender(career_db=catalogue, use_cache=False, similarity_threshold=threshold)
+    for profile in random_profiles(catalogue, 50, seed=9):
+        assert ranking(recommender.recommend_careers(profile, 5)) == \
+            reference_ranking(recommender, profile, 5), profile
@@ -0,0 +1,64 @@
+"""
+Career Snapshots
+A changed snapshot file is swapped in whole; an unreadable or unchanged one is not
+"""
+
+from recommender import recommendation_engine
+from recommender.career_database import CAREER_DATABASE, CAREER_PROGRESSION_MAP, CERTIFICATION_MAP
+from recommender.snapshot import SnapshotWatcher, load_snapshot, write_snapshot
+
+PROFILE = {"interests": ["technology", "healthcare", "design"], "skills": ["python"]}
+
+
+def subset(career_ids):
+    return {career_id: CAREER_DATABASE[career_id] for career_id in career_ids}
+
+
+def test_watcher_swaps_in_new_versions_only(tmp_path):
+    path = str(tmp_path / "careers.snapshot.json")
+    first = write_snapshot(path, CAREER_DATABASE, CERTIFICATION_MAP, CAREER_PROGRESSION_MAP)
+    assert load_snapshot(path).version == first.version
+
+    loaded = []
+    watcher = SnapshotWatcher(path, loaded.append, version=first.version)
+    assert not watcher.check()
+
+    second = write_snapshot(path, subset(["software_engineer", "nurse"]), CERTIFICATION_MAP, {})
+    assert watcher.check()
+    assert [snapshot.version for snapshot in loaded] == [second.version]
+    assert list(loaded[0].career_db) == ["software_engineer", "nurse"]
+    assert second.version != first.version
+
+    # A broken file is skipped and the live version stays
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('{"format": 1, "careers": ')
+    assert not watcher.check()
+    assert watcher.version == second.version
+
+    # Rewriting the same content is a new file but not a new version
+    write_snapshot(path, subset(["software_engineer", "nurse"]), CERTIFICATION_MAP, {})
+    assert not watcher.check()
+    assert len(loaded) == 1
+
+
+def test_swap_replaces_the_shared_recommender(tmp_path, monkeypatch):
+    path = str(tmp_path / "careers.snapshot.json")
+    write_snapshot(path, CAREER_DATABASE, CERTIFICATION_MAP, CAREER_PROGRESSION_MAP)
+    monkeypatch.setattr(recommendation_engine, "_shared_recommender", None)
+    monkeypatch.setattr(recommendation_engine, "_snapshot_watcher", None)
+    monkeypatch.setenv(recommendation_engine.CAREER_SNAPSHOT_ENV, path)
+    monkeypatch.delenv(recommendation_engine.CAREER_STORE_ENV, raising=False)
+
+    old = recommendation_engine.get_shared_recommender()
+    watcher = recommendation_engine._snapshot_watcher
+    watcher.stop()
+    before = old.recommend_careers(PROFILE, 10)
+
+    write_snapshot(path, subset(["software_engineer", "nurse"]), CERTIFICATION_MAP, {})
+    assert watcher.check()
+    new = recommendation_engine.get_shared_recommender()
+    assert new is not old
+    assert {rec["career_id"] for rec in new.recommend_careers(PROFILE, 10)} <= {"software_engineer", "nurse"}
+
+    # A request holding the old recommender still finishes on the old catalogue
+    assert old.recommend_careers(PROFILE, 10) == before
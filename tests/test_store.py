@@ -0,0 +1,32 @@
+"""
+Career Store
+A memory-mapped store reads and ranks exactly like the catalogue it was written from
+"""
+
+from profiles import random_profiles
+from recommender.recommendation_engine import CareerRecommender
+from recommender.store import open_career_store, write_store
+
+
+def test_store_matches_in_memory_catalogue(catalogue, tmp_path):
+    path = str(tmp_path / "careers.store")
+    write_store(catalogue, path)
+    store = open_career_store(path)
+    assert list(store) == list(catalogue)
+    assert all(store[career_id].to_dict() == catalogue[career_id].to_dict() for career_id in catalogue)
+
+    in_memory = CareerRecommender(career_db=catalogue, use_cache=False)
+    from_store = CareerRecommender(career_db=store, use_cache=False)
+    assert from_store.index.version == in_memory.index.version
+    for profile in random_profiles(catalogue, 100, seed=4):
+        assert from_store.recommend_careers(profile, 5) == in_memory.recommend_careers(profile, 5), profile
+
+
+def test_missing_and_non_string_ids_are_absent(catalogue, tmp_path):
+    path = str(tmp_path / "careers.store")
+    write_store(catalogue, path)
+    store = open_career_store(path)
+    for career_id in ("no_such_career", "", None, 1, b"software_engineer"):
+        assert store.get(career_id) is None
+        assert career_id not in store
+        assert catalogue.get(career_id) is None